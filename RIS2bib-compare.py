@@ -0,0 +1,488 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# RIS2bib-compare.py
+# differential test of the conversion engines of RIS2bib.py against the
+# reference loop (sequential line path); optionally a throughput gate
+
+# -------------------------------------------------------------
+# Usage
+#
+# python RIS2bib-compare.py [inputs ...] [--engines mmap,pipeline,async,threads]
+#                           [--generate N] [--seed SEED] [--runs N] [--no-checks]
+#                           [--baseline FILE] [--save-baseline FILE] [--tolerance T]
+#
+#    - every input (default: input/*.ris and generated corpora) is
+#      converted by the reference loop and by each engine
+#    - threads: several converters (see Converter) convert the same input
+#      at the same time in a thread pool; all results must be equal
+#    - the outputs are compared entry by entry; the header lines written
+#      before the loop (date, program call, ...) are ignored
+#    - the first divergence is shown with the line numbers in both outputs
+#    - checks of single options on every input (see checks): no field
+#      value lost with --crossref, no record appended twice with
+#      --append-to and --latex, the same keys from aparse/arender in
+#      every call, -m equal to the reference loop with --fields, -s and
+#      --where, records and columns of RecordStore equal to the parsed
+#      records, no shard of an earlier run left by --shard-by; --no-checks:
+#      none
+#    - --baseline: the times are compared with stored times; an engine
+#      more than --tolerance slower fails
+#    - exit code: 0 all equal (and fast enough), 1 divergence or failed check, 2 too slow
+#    - the outputs are kept in a temporary directory if they differ
+
+# -------------------------------------------------------------
+# Modules needed
+
+import sys                      # system calls
+import os                       # paths
+import glob                     # input files
+import json                     # baseline file
+import random                   # generated corpora
+import subprocess               # conversions by the program
+import tempfile                 # output files
+import time                     # wall clock
+import shutil                   # removal of the output files
+import argparse                 # argument parsing
+import asyncio                  # asynchronous engine
+import re                       # fields of the entries
+from concurrent.futures import ThreadPoolExecutor  # concurrent converters
+
+here   = os.path.dirname(os.path.abspath(__file__))
+script = os.path.join(here, "RIS2bib.py")
+sys.path.insert(0, here)
+import RIS2bib                  # asynchronous engine, concurrent converters
+
+# -------------------------------------------------------------
+# Engines: name ---> options of RIS2bib.py; None: in this process
+
+engines = {"lines"   : [],                                # reference loop
+           "mmap"    : ["-m"],
+           "pipeline": ["--pipeline", "4"],
+           "async"   : None,
+           "threads" : None}
+reference = "lines"
+threads   = 4                                         # converters at the same time (threads)
+
+# -------------------------------------------------------------
+# Defaults
+
+generate_default  = 2000                             # records per generated corpus
+seed_default      = 1                                # seed for the generated corpora
+runs_default      = 3                                # runs per engine; the best one counts
+tolerance_default = 0.25                             # allowed slowdown against the baseline
+
+# -------------------------------------------------------------
+# Generated corpora: RIS types, repeated and non-ASCII names, von parts,
+# multi-line notes and abstracts, unknown and empty RIS keys, records
+# without 'ER  -', lines outside of records, CRLF line ends
+
+families = ["Knuth", "Lamport", "Müller", "Østergaard", "van der Berg", "de la Cruz",
+            "Goossens", "Mittelbach", "Šimůnek", "O'Neil", "Partosch", "Voß"]
+givens   = ["Donald E.", "Leslie", "Anna", "Jens", "Pieter", "José", "Michel", "Frank", "Jan", "Günter"]
+words    = ["LaTeX", "TeX", "fonts", "macros", "Unicode", "typesetting", "BibTeX", "graphics",
+            "tables", "math", "&", "50%", "C#", "x_1", "$\\alpha$", "{braces}", "Ä", "ß"]
+
+def corpus(n, rnd):
+    types = sorted(t for t in RIS2bib.config if t != "GEN") + ["XYZ"]   # XYZ: unknown type
+    lines = ["Generated corpus", ""]
+    for nr in range(n):
+        ristype = rnd.choice(types)
+        lines.append("TY  - " + ristype)
+        for f in range(rnd.randint(1, 3)):
+            lines.append("AU  - " + rnd.choice(families) + ", " + rnd.choice(givens))
+        if rnd.random() < 0.2:
+            lines.append("ED  - " + rnd.choice(families) + ", " + rnd.choice(givens))
+        lines.append("PY  - " + str(rnd.choice([1984, 1994, 2005, 2015, 2020])))
+        lines.append("TI  - " + " ".join(rnd.choice(words) for f in range(rnd.randint(2, 8))))
+        for f in range(rnd.randint(0, 3)):
+            lines.append("KW  - " + rnd.choice(words))
+        if rnd.random() < 0.3:
+            lines.append("DO  - 10.1000/" + str(rnd.randint(1, 10 ** 6)))
+        if rnd.random() < 0.3:
+            lines.append("N1  - " + " ".join(rnd.choice(words) for f in range(5)))
+            lines.append(" ".join(rnd.choice(words) for f in range(5)))
+        if rnd.random() < 0.3:
+            lines.append("AB  - " + " ".join(rnd.choice(words) for f in range(8)))
+            lines.append(" ".join(rnd.choice(words) for f in range(8)))
+        if rnd.random() < 0.1:
+            lines.append("Q9  - unknown RIS key")
+        if rnd.random() < 0.05:
+            lines.append("")
+            lines.append("text between records")
+            continue                                             # record without 'ER  -'
+        lines.append("ER  - ")
+        lines.append("")
+    return lines
+
+def writecorpus(name, lines, crlf):
+    with open(name, encoding="utf-8", mode="w", newline="\r\n" if crlf else "\n") as f:
+        f.write("\n".join(lines) + "\n")
+
+# -------------------------------------------------------------
+# Conversions
+
+def convert(engine, in_file, out_file):                  # seconds
+    start = time.perf_counter()
+    if engine == "async":
+        asyncconvert(in_file, out_file)
+    elif engine == "threads":
+        threadconvert(in_file, out_file)
+    else:
+        run = subprocess.run([sys.executable, script, in_file, "-o", out_file] + engines[engine],
+                             cwd=here, capture_output=True, text=True)
+        if run.returncode != 0:
+            sys.exit("--- engine " + engine + " failed for " + in_file + ":\n" + run.stderr)
+    return time.perf_counter() - start
+
+def asyncconvert(in_file, out_file):                     # aparse and arender
+    converter = RIS2bib.Converter()
+
+    async def chunks():
+        with open(in_file, mode="rb") as f:
+            while True:
+                chunk = f.read(65536)
+                if not chunk:
+                    break
+                yield chunk
+
+    async def run():
+        texts = []
+        async for result in RIS2bib.aparse(chunks(), keeptext=True, state=converter.newstate()):
+            if isinstance(result, str):
+                texts.append(result + "\n")
+            else:
+                texts.append(await RIS2bib.arender([result], converter=converter))
+        return texts
+
+    texts = asyncio.run(run())
+    with open(out_file, encoding="utf-8", mode="w") as f:
+        f.write("% header\n\n")                              # (ignored by entries)
+        f.write("".join(texts))
+
+def threadtext(in_file):                                 # one converter, text of the output
+    converter = RIS2bib.Converter()
+    texts = []
+    with open(in_file, encoding="utf-8-sig", mode="r") as f:
+        for result in converter.parselines(f):
+            if isinstance(result, str):
+                texts.append(result + "\n")
+            else:
+                texts.append(converter.renderrecord(result[0], converter.resultkey(result), result[1]))
+    return "".join(texts)
+
+def threadconvert(in_file, out_file):                    # converters in a thread pool
+    with ThreadPoolExecutor(threads) as pool:
+        texts = list(pool.map(threadtext, [in_file] * threads))
+    for nr in range(1, threads):
+        if texts[nr] != texts[0]:
+            sys.exit("--- engine threads: converter " + str(nr) + " differs from converter 0 for " + in_file)
+    with open(out_file, encoding="utf-8", mode="w") as f:
+        f.write("% header\n\n")                              # (ignored by entries)
+        f.write(texts[0])
+
+# -------------------------------------------------------------
+# Entries of an output file: the header (up to the first empty line) is
+# skipped; an entry starts with a line "@..."; lines before the first
+# entry form an entry of their own
+#
+# result: list of (line number of the first line, lines)
+
+fieldline = re.compile(r"^([A-Za-z]+) *= \{(.*)$")     # first line of a field
+
+def entries(name):
+    with open(name, encoding="utf-8") as f:
+        lines = f.read().split("\n")
+    start = lines.index("") + 1 if "" in lines else 0
+    result = [(start + 1, [])]
+    for nr in range(start, len(lines)):
+        if lines[nr].startswith("@"):
+            result.append((nr + 1, []))
+        result[-1][1].append(lines[nr])
+    return result
+
+def firstdivergence(ref_file, new_file):             # None or text of the first divergence
+    old, new = entries(ref_file), entries(new_file)
+    for nr in range(max(len(old), len(new))):
+        if nr >= len(old) or nr >= len(new):
+            more = (new_file, new) if nr >= len(old) else (ref_file, old)
+            return ("entry " + str(nr) + ": only in " + more[0] + " (line " + str(more[1][nr][0]) + "): " +
+                    more[1][nr][1][0])
+        (oldline, oldlines), (newline, newlines) = old[nr], new[nr]
+        if oldlines != newlines:
+            for f in range(max(len(oldlines), len(newlines))):
+                a = oldlines[f] if f < len(oldlines) else "<missing>"
+                b = newlines[f] if f < len(newlines) else "<missing>"
+                if a != b:
+                    return ("entry " + str(nr) + ", line " + str(oldline + f) + " / " + str(newline + f) + ":\n" +
+                            "    reference: " + a + "\n" +
+                            "    engine   : " + b)
+    return None
+
+# -------------------------------------------------------------
+# Checks of single options on every input (see checks); a check returns
+# None or the text of the first problem
+
+def fieldsof(lines):                                 # lines of an entry ---> (type, key, field ---> value)
+    head = lines[0]
+    bibtype, key = head[:head.index("{")], head[head.index("{") + 1:].rstrip(",")
+    fields, field = {}, None
+    for line in lines[1:]:
+        m = fieldline.match(line)
+        if line == "}":                                  # (lines outside of records follow)
+            break
+        elif m:
+            field = m.group(1)
+            fields[field] = m.group(2)
+        elif field is not None:
+            fields[field] = fields[field] + "\n" + line
+    for field in fields:
+        fields[field] = fields[field][:-2]               # (without "},")
+    return (bibtype, key, fields)
+
+def records(name):                                   # key ---> (type, field ---> value)
+    result = {}
+    for (nr, lines) in entries(name):
+        if lines and lines[0].startswith("@"):
+            bibtype, key, fields = fieldsof(lines)
+            result[key] = (bibtype, fields)
+    return result
+
+def runprogram(in_file, options):                    # output of the program; exit on failure
+    run = subprocess.run([sys.executable, script, in_file] + options, cwd=here, capture_output=True, text=True)
+    if run.returncode != 0:
+        sys.exit("--- " + " ".join(options) + " failed for " + in_file + ":\n" + run.stderr)
+    return run.stdout
+
+# --crossref: every child written with crossref (as many as reported),
+# every parent present, no field value lost (with and without --fields, -s),
+# every entry followed by exactly one empty line
+
+crossrefoptions = [[], ["--fields", "title,subtitle,booktitle,editor,publisher,year,location"],
+                   ["-s", "title,year"]]
+
+def checkcrossref(in_file, workdir):
+    plain, reduced = os.path.join(workdir, "plain.bib"), os.path.join(workdir, "crossref.bib")
+    for options in crossrefoptions:
+        label = " ".join(["--crossref"] + options)
+        runprogram(in_file, ["-o", plain] + options)
+        stdout = runprogram(in_file, ["-o", reduced, "--crossref"] + options)
+        children = int(stdout.split("parent entries for")[1].split()[0])
+        old, new = records(plain), records(reduced)
+        withcrossref = [key for key in new if "crossref" in new[key][1]]
+        if len(withcrossref) != children:
+            return label + ": " + str(children) + " children, " + str(len(withcrossref)) + " with crossref"
+        for key in old:
+            if key not in new:
+                return label + ": record " + key + " missing"
+            fields = new[key][1]
+            parent = {}
+            if "crossref" in fields:
+                if fields["crossref"] not in new:
+                    return label + ": parent " + fields["crossref"] + " of " + key + " missing"
+                parent = new[fields["crossref"]][1]
+            for (field, value) in old[key][1].items():
+                if not (fields.get(field) == value or
+                        (field in RIS2bib.crossreffields and parent.get(field) == value) or
+                        (field in RIS2bib.crossreftitles and parent.get("title") == value)):
+                    return label + ": field " + field + " of " + key + " lost"
+        with open(reduced, encoding="utf-8") as f:
+            text = f.read()
+        separator = re.search(r"\n\}\n(?!\n@|\n$)|\n\n\n", text)
+        if separator is not None:
+            line = text.count("\n", 0, separator.start()) + 2
+            return label + ": entries not separated by one empty line (line " + str(line) + ")"
+    return None
+
+# --append-to: appending the same input to a file written with each
+# --latex mode adds no record
+
+latexmodes = ["", "special", "ascii"]
+
+def checkappend(in_file, workdir):
+    out_file = os.path.join(workdir, "append.bib")
+    for mode in latexmodes:
+        options = [] if mode == "" else ["--latex", mode]
+        runprogram(in_file, ["-o", out_file] + options)
+        before = len(records(out_file))
+        runprogram(in_file, ["--append-to", out_file] + options)
+        after  = len(records(out_file))
+        if after != before:
+            return " ".join(["--append-to"] + options) + ": " + str(after - before) + " records added again"
+    return None
+
+def checkasynckeys(in_file, workdir):                 # aparse/arender without converter: same keys in each call
+    import asyncio
+
+    async def run():
+        async def chunks():
+            with open(in_file, mode="rb") as f:
+                yield f.read()
+        return await RIS2bib.arender([result async for result in RIS2bib.aparse(chunks())])
+
+    first  = asyncio.run(run())
+    second = asyncio.run(run())
+    if first != second:
+        return "aparse/arender without converter: keys of the second call differ from the first"
+    return None
+
+# -m with fields which are not written and records which are not selected
+# (lines not decoded, see scanrecord): the same output as the reference loop
+
+mmapoptions = [["--fields", "author,title,year"], ["-s", "abstract,note"], ["-s", "abstract"],
+               ["--fields", "author,note"], ["--where", "year>=2005"], ["--where", "type!=book has=doi"]]
+
+def checkmmap(in_file, workdir):
+    ref_file, new_file = os.path.join(workdir, "select-lines.bib"), os.path.join(workdir, "select-mmap.bib")
+    for options in mmapoptions:
+        runprogram(in_file, ["-o", ref_file] + options)
+        runprogram(in_file, ["-o", new_file, "-m"] + options)
+        divergence = firstdivergence(ref_file, new_file)
+        if divergence is not None:
+            return "-m " + " ".join(options) + ": " + divergence
+    return None
+
+# RecordStore (string heap of the children held by --crossref): every
+# record and every column read back equal to the parsed records
+
+def checkstore(in_file, workdir):
+    converter = RIS2bib.Converter()
+    inp, encoding = RIS2bib.openinput(in_file)
+    with inp:
+        parsed = [(result[0], converter.resultkey(result), result[1])
+                  for result in converter.parselines(inp) if not isinstance(result, str)]
+    store = RIS2bib.RecordStore()
+    for (bibtype, key, o) in parsed:
+        store.add(bibtype, key, o)
+    for (nr, record) in enumerate(store.records()):
+        if record != parsed[nr]:
+            return "RecordStore: record " + str(nr + 1) + " (" + parsed[nr][1] + ") differs"
+    for f in store.fields:
+        if store.column(f)[1] != [o[f] for (bibtype, key, o) in parsed if f in o]:
+            return "RecordStore: column " + f + " differs"
+    return None
+
+# --shard-by size: a second run with fewer shards leaves only its own
+# shards (and other files) next to the manifest
+
+def checkshards(in_file, workdir):
+    folder = os.path.join(workdir, "shards")
+    os.makedirs(folder, exist_ok=True)
+    out_file, other = os.path.join(folder, "lit.bib"), os.path.join(folder, "lit-notes.bib")
+    open(other, mode="w").close()
+    runprogram(in_file, ["-o", out_file, "--shard-by", "size=2KB"])
+    runprogram(in_file, ["-o", out_file, "--shard-by", "size=1GB"])
+    with open(out_file + ".manifest", encoding="utf-8") as f:
+        listed = {line.split("\t")[0] for line in f.read().split("\n")[1:] if line != ""}
+    found = set(os.listdir(folder)) - {"lit.bib.manifest", "lit-notes.bib"}
+    shutil.rmtree(folder)
+    if found != listed:
+        return "--shard-by: shards " + ", ".join(sorted(found - listed)) + " not in the manifest"
+    return None
+
+checks = {"crossref": checkcrossref, "append": checkappend, "asynckeys": checkasynckeys, "mmap": checkmmap,
+          "store": checkstore, "shards": checkshards}
+
+# =============================================================
+# The Process
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "differential test of the engines of RIS2bib.py")
+    parser.add_argument("inputs", nargs = "*",
+                        help    = "RIS files; Default: input/*.ris")
+    parser.add_argument("--engines",
+                        help    = "engines compared with the reference loop; Default: %(default)s",
+                        default = ",".join(e for e in engines if e != reference))
+    parser.add_argument("--generate",
+                        help    = "records per generated corpus (0: none); Default: %(default)s",
+                        type    = int,
+                        default = generate_default)
+    parser.add_argument("--seed",
+                        help    = "seed for the generated corpora; Default: %(default)s",
+                        type    = int,
+                        default = seed_default)
+    parser.add_argument("--runs",
+                        help    = "runs per engine and input; Default: %(default)s",
+                        type    = int,
+                        default = runs_default)
+    parser.add_argument("--no-checks",
+                        help    = "Flag: no checks of single options (" + ", ".join(checks) + ")",
+                        dest    = "checks",
+                        action  = "store_false",
+                        default = True)
+    parser.add_argument("--baseline",
+                        help    = "JSON file with stored times; Default: %(default)s",
+                        default = "")
+    parser.add_argument("--save-baseline",
+                        help    = "write the times to this JSON file; Default: %(default)s",
+                        dest    = "save_baseline",
+                        default = "")
+    parser.add_argument("--tolerance",
+                        help    = "allowed slowdown against the baseline; Default: %(default)s",
+                        type    = float,
+                        default = tolerance_default)
+    args = parser.parse_args()
+
+    selected = [e for e in args.engines.split(",") if e != ""]
+    for e in selected:
+        if e not in engines:
+            sys.exit("--- unknown engine " + e + "; known: " + ", ".join(engines))
+
+    workdir = tempfile.mkdtemp(prefix="ris2bib-")
+    inputs  = args.inputs or sorted(glob.glob(os.path.join(here, "input", "*.ris")))
+    if args.generate > 0:
+        rnd = random.Random(args.seed)
+        for (name, crlf) in [("generated-lf.ris", False), ("generated-crlf.ris", True)]:
+            writecorpus(os.path.join(workdir, name), corpus(args.generate, rnd), crlf)
+            inputs.append(os.path.join(workdir, name))
+
+    times    = {}                                            # engine ---> input ---> seconds
+    diverged = False
+    for in_file in inputs:
+        label = os.path.basename(in_file)
+        size  = os.path.getsize(in_file) / 1024 / 1024
+        outs  = {}
+        for engine in [reference] + selected:
+            outs[engine] = os.path.join(workdir, engine + "-" + label + ".bib")
+            seconds = min(convert(engine, in_file, outs[engine]) for f in range(args.runs))
+            times.setdefault(engine, {})[label] = seconds
+            status = ""
+            if engine != reference:
+                divergence = firstdivergence(outs[reference], outs[engine])
+                status = "equal" if divergence is None else "DIFFERENT"
+                if divergence is not None:
+                    diverged = True
+            print("%-28s %-9s %7.3f s %7.2f MB/s  %s" % (label, engine, seconds, size / seconds, status))
+            if status == "DIFFERENT":
+                print("    " + outs[reference] + " / " + outs[engine] + ", " + divergence)
+        if args.checks:
+            for name in checks:
+                problem = checks[name](in_file, workdir)
+                print("%-28s %-9s %s" % (label, name, "ok" if problem is None else "FAILED"))
+                if problem is not None:
+                    diverged = True
+                    print("    " + problem)
+
+    if args.save_baseline != "":
+        with open(args.save_baseline, encoding="utf-8", mode="w") as f:
+            json.dump(times, f, indent=1, sort_keys=True)
+        print("- Baseline", args.save_baseline, "written")
+
+    slow = False
+    if args.baseline != "":
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        for engine in times:
+            for label in times[engine]:
+                old = baseline.get(engine, {}).get(label)
+                if old is not None and times[engine][label] > old * (1 + args.tolerance):
+                    slow = True
+                    print("--- too slow:", engine, label, "%.3f s" % times[engine][label],
+                          "(baseline: %.3f s)" % old)
+
+    if diverged:                                             # the outputs are kept
+        sys.exit(1)
+    shutil.rmtree(workdir)
+    if slow:
+        sys.exit(2)
+    print("- all engines equal to the reference loop")
@@ -0,0 +1,93 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# RIS2bib-startup.py
+# startup time of RIS2bib.py: wall clock of the program, imports
+# measured with "python -X importtime"
+
+# -------------------------------------------------------------
+# Usage
+#
+# python RIS2bib-startup.py [budget]
+#
+#    - "RIS2bib.py -V", the conversion of a small file and "import
+#      RIS2bib" are run several times; the best times and the most
+#      expensive imports are shown
+#    - budget: startup budget in ms (default: see budget_default);
+#      exit code 1 if "RIS2bib.py -V" takes longer (interpreter included)
+#    - the bytecode is written first, so that a normal start is measured
+#      (RIS2bib.py is a launcher; the program in RIS2bibcore.py is run
+#      from its bytecode)
+
+# -------------------------------------------------------------
+# Modules needed
+
+import sys                      # system calls
+import os                       # paths and environment
+import subprocess               # child interpreters
+import time                     # wall clock
+import tempfile                 # output of the small conversion
+
+# -------------------------------------------------------------
+# Defaults
+
+budget_default = 60                                  # startup budget (ms) for "RIS2bib.py -V"
+runs           = 5                                   # number of runs; the best one counts
+top            = 10                                  # number of imports shown
+
+here   = os.path.dirname(os.path.abspath(__file__))
+script = os.path.join(here, "RIS2bib.py")
+small  = os.path.join(here, "input", "in-test2.ris")   # small conversion
+env    = dict(os.environ)
+env.pop("PYTHONDONTWRITEBYTECODE", None)             # bytecode as in a normal installation
+
+# -------------------------------------------------------------
+# import time of RIS2bib and of its imports (microseconds)
+
+def importtimes():
+    run = subprocess.run([sys.executable, "-X", "importtime", "-c", "import RIS2bib"],
+                         cwd=here, env=env, capture_output=True, text=True)
+    times = {}
+    for line in run.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if not parts[0].strip().isdigit():               # header line
+            continue
+        times[parts[2].strip()] = (int(parts[0]), int(parts[1]))  # name ---> (self, cumulative)
+    return times
+
+# -------------------------------------------------------------
+# wall clock of "RIS2bib.py ..." (ms)
+
+def walltime(arguments):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, script] + arguments, cwd=here, env=env, capture_output=True)
+    return (time.perf_counter() - start) * 1000
+
+# =============================================================
+# The Process
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else budget_default
+
+    importtimes()                                            # bytecode written
+    best = None
+    for f in range(runs):
+        times = importtimes()
+        if best is None or times["RIS2bib"][1] < best["RIS2bib"][1]:
+            best = times
+    wall = min(walltime(["-V"]) for f in range(runs))
+    with tempfile.TemporaryDirectory() as folder:
+        out_file = os.path.join(folder, "small.bib")
+        conversion = min(walltime([small, "-o", out_file]) for f in range(runs))
+
+    print("- RIS2bib.py -V  :", "%.1f" % wall, "ms (interpreter included; budget:", "%g" % budget, "ms)")
+    print("- small file     :", "%.1f" % conversion, "ms (" + os.path.basename(small) + ")")
+    print("- import RIS2bib :", "%.1f" % (best["RIS2bib"][1] / 1000), "ms")
+    print("\n- most expensive imports (self, ms):")
+    for (name, (own, cumulative)) in sorted(best.items(), key=lambda item: -item[1][0])[:top]:
+        print("%8.1f" % (own / 1000), name)
+
+    if wall > budget:
+        sys.exit("--- startup budget exceeded")
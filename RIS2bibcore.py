@@ -0,0 +1,4747 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# RIS2bibcore.py
+# (C) Günter Partosch, 2019/2010
+#
+# the program RIS2bib.py; started by the launcher RIS2bib.py, so that its
+# bytecode is cached (a script given to python is compiled at every start)
+
+# -------------------------------------------------------------
+# Usage
+
+# usage: RIS2bib.py [-h] [-a] [-o OUT_FILE] [-c CORRECTION_FILE]
+#                   [--encoding ENCODING] [-s SKIP] [--latex {special,ascii}]
+#                   [--fields FIELDS] [--where WHERE] [--sort-by SORTBY]
+#                   [--sort-memory SORTMEMORY] [--append-to APPEND_FILE]
+#                   [--index] [--check] [--extract EXTRACT] [--sample SAMPLE]
+#                   [--seed SEED] [--profile {cpu,mem,both}]
+#                   [--slow-records SLOW] [--pipeline PIPELINE]
+#                   [--shard-by SHARDBY] [--progress [PROGRESS]]
+#                   [--diff DIFF_FILE] [--fulltext] [--search SEARCH]
+#                   [--checkpoint CHECKPOINT] [--resume] [--crossref] [-v] [-b]
+#                   [-m] [-V]
+#                   in_file
+# 
+# converts RIS files to .bib files [RIS2bib.py; Version: 1.7 (2020-07-16)]
+# 
+# Positional parameters:
+#   in_file               name for input file; Default:
+# 
+# Optional parameters:
+#   -h, --help            show this help message and exit
+#   -a, --author          author of the program
+#   -o OUT_FILE, --output OUT_FILE
+#                         name for output file; Default: out-test.bib
+#   -c CORRECTION_FILE, --correction CORRECTION_FILE
+#                         name for a file with additional conversion rules;
+#                         Default:
+#   --encoding ENCODING   encoding of the input file, e.g. cp1252, utf-16;
+#                         Default: guessed
+#   -s SKIP, --skip SKIP  skip BibTeX fields; Default: []
+#   --latex {special,ascii}
+#                         escape LaTeX special characters (special) and non-
+#                         ASCII characters (ascii); after the built-in
+#                         transformers, before those of addtransformer (-c);
+#                         Default:
+#   --fields FIELDS       write only these BibTeX fields, e.g.
+#                         title,author,year,doi; Default:
+#   --where WHERE         select records, e.g. "type=JOUR year>=2015
+#                         keyword=LaTeX has=doi"; Default:
+#   --sort-by SORTBY      sort the BibTeX records by key|author,year|type (also
+#                         title); Default:
+#   --sort-memory SORTMEMORY
+#                         memory (MB, at least 1) for a sorted run before it is
+#                         written to a temporary file; Default: 64
+#   --append-to APPEND_FILE
+#                         append only new records to this existing .bib file
+#                         (instead of -o); Default:
+#   --index               Flag: write the index file <in_file>.idx and stop;
+#                         Default: False
+#   --check               Flag: only check the structure of the input file; exit
+#                         code 1 if there are problems; Default: False
+#   --extract EXTRACT     convert only these records (numbers, ranges, keys),
+#                         e.g. 1-10,42,Knuth.1984a; Default:
+#   --sample SAMPLE       convert only a random sample of n records; Default: 0
+#   --seed SEED           seed for --sample; Default: None
+#   --profile {cpu,mem,both}
+#                         write a CPU profile (<out_file>.prof, pstats) and/or
+#                         the top memory allocations (<out_file>.mem); Default:
+#   --slow-records SLOW   list the records whose processing takes longer than
+#                         this number of milliseconds; Default: 0
+#   --pipeline PIPELINE   read and write in own threads; number of 64 KB blocks
+#                         in the queues (0: sequential); Default: 0
+#   --shard-by SHARDBY    write several .bib files <out_file>-<shard>.bib and a
+#                         manifest, split by size=50MB|type|year; Default:
+#   --progress [PROGRESS]
+#                         report bytes, records/s and ETA on stderr or (with a
+#                         file name) in a status file; Default:
+#   --diff DIFF_FILE      convert only the records added or changed since this
+#                         older RIS file (old keys kept; removed keys in
+#                         <out_file>.removed); Default:
+#   --fulltext            Flag: write a full-text index <out_file>.fts of
+#                         titles, abstracts, keywords and authors; Default:
+#                         False
+#   --search SEARCH       show the keys of the records matching this query in
+#                         the full-text index <in_file>.fts, e.g. "title:tikz
+#                         AND font*"; Default:
+#   --checkpoint CHECKPOINT
+#                         write a checkpoint <out_file>.checkpoint every n
+#                         seconds (implies -m; 0: no checkpoints); Default: 0
+#   --resume              Flag: continue an interrupted conversion from
+#                         <out_file>.checkpoint; Default: False
+#   --crossref            Flag: one @book/@proceedings entry for chapters and
+#                         papers of the same book; crossref in the children;
+#                         Default: False
+#   -v, --verbose         Flag: verbose output; Default: False
+#   -b, --bibtexkeys      Flag: show the generated BibTeX keys; Default: False
+#   -m, --mmap            Flag: memory-mapped input; only the lines of the
+#                         selected records and written fields are decoded;
+#                         Default: False
+#   -V, --version         version of the program
+
+
+# =============================================================
+# Messages
+# --------
+# 
+# Fatal messages
+# --------------
+# input file" <input file> could not be opened; program terminated
+# --where: <reason>; program terminated
+# --sort-by: <reason>; program terminated
+# --encoding: unknown encoding <encoding>; program terminated
+# encoding <encoding> not possible with -m, --index, --extract, --sample, --checkpoint, --resume; program terminated
+# --shard-by: <reason>; program terminated
+# --shard-by not possible with --append-to; program terminated
+# --crossref not possible with --shard-by, --append-to; program terminated
+# --diff not possible with --append-to; program terminated
+# --diff: input file <old file> could not be opened; program terminated
+# --fulltext: <reason>; program terminated
+# --search: full-text index <index file> not found; program terminated
+# --search: <reason>; program terminated
+# --checkpoint, --resume not possible with --sort-by, --shard-by, --append-to, --crossref, --diff, --extract, --sample, --fulltext, --pipeline; program terminated
+# --checkpoint, --resume: <output file> is not a regular file; program terminated
+# --resume: <reason>; program terminated
+# 
+# Other error messages
+# --------------------
+# Correction file <correction file> could not be opened
+# Line <line nr>: actual record not completed by 'ER  -'; skipped
+# Line <line nr>: RIS type incorrect in '<line>'; 'GEN' supposed
+# Line <line nr>: empty bibfield for <RIS type> <RIS key> in '<line>'; collected in 'note'
+# Line <line nr>: unknown riskey for", <RIS type> <RIS key> in '<line>'
+# Record '<title>' already present; skipped
+# Line <line nr>: <problem> (--check: RIS type unknown, RIS key unknown or outside of a record, record not completed)
+# <n> bytes not valid in <encoding>; read as Windows-1252 or Latin-1 (see --encoding)
+# 
+# Informative messages
+# --------------------
+# File <correction file> with additional conversion rules read
+# Generated BibTeX keys
+# Program call: <program name> <arguments>
+# Program finished
+# Index file <index file> with <n> records written
+# File <.bib file> with <n> records scanned
+# Input file <input file> read with encoding <encoding>
+# Profile <profile file> written
+# Records slower than <n> ms
+# Manifest <manifest file> with <n> shards written
+# <n> shards of an earlier run removed
+# Crossref: <n> parent entries for <m> entries; <bytes> bytes saved (<x> %)
+# Check: <input file>; <n> records; <m> problems
+# File <old file> with <n> records indexed
+# Diff: <a> added, <c> changed, <u> unchanged, <r> removed records; removed keys in <file>
+# Full-text index <index file> with <n> records written
+# <n> records found in <t> ms
+# --resume: no checkpoint <checkpoint file>; conversion from the beginning
+# Resumed from <checkpoint file> at line <line nr> (<n> records converted)
+
+
+# =============================================================
+# Examples
+# --------
+# 
+# RIS2bib -h                                               [-h]
+#    - help; show the options
+# 
+# RIS2bib inp.ris -o out.bib                               [-o]
+#    - simple call
+# 
+# RIS2bib inp.ris -o out.bib -v                            [-o, -v]
+#    - as above
+#    - verbose output
+# 
+# RIS2bib inp.ris -o out.bib -b -v                         [-o, -b, -v]
+#    - as above
+#    - generated BibTeX keys are shown
+# 
+# RIS2bib inp2.ris -o out2.bib -v -c corr.py -b            [-o, -v, -c, -b]
+#    - as above
+#    - with some new conversion rules in corr.py;
+#      the file corr.py must be in a special format, e.g.
+# 
+#      config["UNPB"]["SN"] = "isbn"
+#      config["UNPB"]["U3"] = "note"
+# 
+# RIS2bib inp2.ris -o out2.bib -s ["note","abstract"] -v   [-o, -s, -v]
+#    - the BibTeX fields "note" and "abstract" are skipped
+# 
+# RIS2bib inp2.ris -o out2.bib -s note,abstract            [-o, -s]
+#    - as above; the fields are given as a plain list
+# 
+# RIS2bib inp.ris -o out.bib --where "type=JOUR year>=2015" --fields title,author,year,doi
+#                                                          [-o, --where, --fields]
+#    - only journal articles since 2015 are converted
+#    - only the fields title, author, year and doi are written
+#    - further conditions: type=article, year<2000, keyword=LaTeX, has=doi
+# 
+# RIS2bib big.ris -o out.bib -m --where "year>=2015"        [-o, -m, --where]
+#    - the input file is memory-mapped and scanned record by record; the
+#      fields of a record are built only if the record is selected (type,
+#      year, keyword, has), so records which are not selected cost little
+# 
+# RIS2bib inp.ris -o out.bib --sort-by author,year         [-o, --sort-by]
+#    - the BibTeX records are sorted by author and year (also: key, type, title)
+#    - the keys are the same as without sorting
+#    - runs larger than --sort-memory (MB) are sorted in temporary files
+#      and merged at the end
+# 
+# RIS2bib big.ris --index                                  [--index]
+#    - the index file big.ris.idx is written (record number, byte range,
+#      line, RIS type, DOI, first author, year, key); no conversion
+# 
+# RIS2bib big.ris -o out.bib --extract 1-10,42,Knuth.1984a  [-o, --extract]
+#    - only the selected records (numbers, ranges, keys) are converted;
+#      they are read directly with the byte offsets of the index file
+#    - the index file is written first if it is missing or out of date
+#    - the keys are the same as in a full conversion
+# 
+# RIS2bib big.ris -o qa.bib --sample 50 --seed 1           [-o, --sample, --seed]
+#    - a random sample of 50 records is converted (reservoir sampling)
+# 
+# RIS2bib new.ris --append-to master.bib                   [--append-to]
+#    - master.bib is only scanned for "@type{key," lines and a few
+#      one-line fields (doi, url, title, year, author)
+#    - records already present (same DOI, URL or title/year/first author)
+#      are skipped; the new records are appended with keys unique in
+#      the whole file
+#    - title and author are compared without LaTeX escaping, so records
+#      written with --latex special|ascii are recognized
+# 
+# RIS2bib citavi.ris -o out.bib                            [-o]
+#    - the encoding of the input file is guessed from the first 64 KB
+#      (BOM, UTF-16 without BOM, UTF-8, Windows-1252, Latin-1)
+#    - the file is decoded while it is read; no separate re-encoding
+#    - bytes not valid in the guessed encoding (e.g. Windows-1252 after
+#      64 KB of ASCII) are read as Windows-1252 and counted: "--- 3 bytes
+#      not valid in utf-8-sig; read as Windows-1252 or Latin-1 (see
+#      --encoding)"
+# 
+# RIS2bib endnote.ris -o out.bib --encoding cp1252         [-o, --encoding]
+#    - the encoding is given explicitly
+# 
+# RIS2bib inp.ris -o out.bib --latex special               [-o, --latex]
+#    - & % # _ $ ~ ^ \ are escaped for LaTeX; braces only if they are
+#      not balanced; url, doi, eprint and file are written verbatim
+# 
+# RIS2bib inp.ris -o out.bib --latex ascii                 [-o, --latex]
+#    - as above; in addition non-ASCII characters are written as LaTeX
+#      macros, e.g. ä ---> {\"a}, ß ---> {\ss} (for classic BibTeX)
+# 
+# RIS2bib big.ris -o out.bib --profile both -v             [-o, --profile, -v]
+#    - the CPU profile is written to out.bib.prof (pstats format), e.g.
+#      python -c "import pstats; pstats.Stats('out.bib.prof').sort_stats('cumtime').print_stats(20)"
+#    - the largest memory allocations are written to out.bib.mem
+# 
+# RIS2bib big.ris -o out.bib --slow-records 5              [-o, --slow-records]
+#    - the records whose processing takes longer than 5 ms are listed
+#      with their line numbers and keys
+# 
+# python RIS2bib-startup.py 60
+#    - startup time of RIS2bib.py (wall clock of "RIS2bib.py -V" and of a
+#      small conversion, python -X importtime) and the most expensive
+#      imports; exit code 1 if "RIS2bib.py -V" takes longer than 60 ms
+#    - RIS2bib.py is a small launcher: the program in RIS2bibcore.py is
+#      run from its cached bytecode instead of being compiled at every start
+#    - asyncio, unidecode, json, tempfile, random and the profilers are
+#      loaded only when they are needed
+# 
+# RIS2bib big.ris -o out.bib --pipeline 8                  [-o, --pipeline]
+#    - the input file is read by a reader thread and out.bib is written
+#      by a writer thread; parsing and rendering are not blocked by the
+#      file system (e.g. network drives)
+#    - at most 8 blocks of 64 KB wait in each queue
+#    - the output is the same as without --pipeline
+# 
+# python RIS2bib-compare.py --save-baseline times.json
+#    - input/*.ris and two generated corpora (LF, CRLF) are converted by the
+#      reference loop and by the engines -m, --pipeline and aparse/arender
+#    - the outputs are compared entry by entry (without the header lines);
+#      the first divergence is shown with its line numbers
+#    - the times are written to times.json
+# 
+# python RIS2bib-compare.py --baseline times.json --tolerance 0.2
+#    - as above; exit code 2 if an engine is more than 20 % slower than in
+#      times.json (exit code 1: outputs differ)
+# 
+# RIS2bib big.ris -o lit.bib --shard-by year               [-o, --shard-by]
+#    - one .bib file per year: lit-2015.bib, lit-2016.bib, ..., lit-noyear.bib;
+#      each with its own header; the keys are unique over all files
+#    - lit.bib.manifest lists the files with number of records, size and
+#      first/last key (separated by tabs)
+#    - also: --shard-by type (lit-article.bib, lit-book.bib, ...) and
+#      --shard-by size=50MB (lit-001.bib, lit-002.bib, ...)
+#    - lines outside of records are not written
+# 
+# RIS2bib big.ris -o out.bib --progress                    [-o, --progress]
+#    - about once a second the bytes processed, records/s and the ETA are
+#      shown on stderr (e.g. "--- 8.3 of 14.3 MB (58 %); 13824 records;
+#      13805 records/s; ETA 1 s")
+# 
+# RIS2bib big.ris -o out.bib --progress status.txt         [-o, --progress]
+#    - as above, but the report is written to the status file status.txt
+#      (status, bytes, total, records, records/s, elapsed, ETA); the file
+#      is replaced as a whole, so a reader never sees a half-written file
+#    - --progress before the input file needs a value: --progress - big.ris
+# 
+# RIS2bib inp.ris -o out.bib -c trans.py                   [-o, -c]
+#    - field values are transformed before they are written:
+#      author, editor: "; " ---> " and "; pages: 12-15 ---> 12--15;
+#      keywords: "; " ---> ", "; doi: "https://doi.org/" removed;
+#      date, urldate: 2015/03/07 ---> 2015-03-07, 2015/03// ---> 2015-03
+#    - further transformers can be added in the correction file, e.g.
+# 
+#      addtransformer("title", lambda value: value.replace("LaTeX", "\\LaTeX{}"))
+#      addtransformer("publisher", str.strip)
+#    - order: built-in transformers, LaTeX escaping (--latex), added
+#      transformers; an added transformer gets the escaped value and its
+#      result (e.g. \LaTeX{}) is not escaped again
+# 
+# RIS2bib chapters.ris -o out.bib --crossref               [-o, --crossref]
+#    - chapters and conference papers (@inbook, @inproceedings) with the
+#      same book title, ISBN, year and publisher get one parent entry
+#      (@book, @proceedings) with title, editor, publisher, location, isbn,
+#      series, volume, edition and year; the children keep their own fields
+#      and get "crossref = {book.<hash>}" instead of the common ones
+#    - a group gets its parent entry only if it saves bytes; until then its
+#      children are held back; groups without parent entry (e.g. a single
+#      chapter) are written unchanged at the end
+#    - so the children are not in input order: a held child is written
+#      when its group gets its parent entry, after records which follow it
+#      in the input; every record is followed by one empty line (empty
+#      lines between the records of the input are dropped)
+#    - the parent entries are written at the end (as classic BibTeX needs);
+#      their keys are made from a hash of the group, so no other key changes
+#    - the size reduction is shown: "--- Crossref: 134 parent entries for
+#      888 entries; 57175 bytes saved (5.7 %)"
+#    - with --fields, -s the parent gets only fields which are written;
+#      "crossref" is always written
+#    - not possible with --shard-by and --append-to
+# 
+# RIS2bib inp.ris --check                                  [--check]
+#    - only the structure of inp.ris is checked: records completed by
+#      'ER  -', known RIS types, RIS keys known for the RIS type of the
+#      record (see -c), no RIS keys outside of records
+#    - no records are built, no keys generated, no output file written;
+#      much faster than a conversion
+#    - each problem is shown with its line number, e.g. "--- Line 89: RIS
+#      key SV unknown for RIS type CPAPER", then "--- Check: inp.ris;
+#      16 records; 1 problems"
+#    - exit code 0: no problems; 1: problems (or input file not readable);
+#      for CI, e.g. RIS2bib upload.ris --check > /dev/null || reject
+# 
+# RIS2bib --diff old.ris new.ris -o delta.bib              [--diff, -o]
+#    - old.ris and new.ris are two snapshots of the same export; only the
+#      records added or changed in new.ris are written to delta.bib
+#    - a record is matched by its DOI, its URL or (title, year, first
+#      author); it is changed if any field differs
+#    - changed records keep the keys of a conversion of old.ris; added
+#      records get new keys, different from all old ones
+#    - the keys of the removed records are written to delta.bib.removed
+#      (one per line)
+#    - only hashes and keys of old.ris are kept in memory
+#    - "--- Diff: 2 added, 2 changed, 1534 unchanged, 3 removed records;
+#      removed keys in delta.bib.removed"
+# 
+# RIS2bib inp.ris -o out.bib --fulltext                    [-o, --fulltext]
+#    - while converting, the words of title, abstract (also folded over
+#      several lines), keywords and author of each record are written to
+#      the full-text index out.bib.fts (SQLite, FTS5)
+#    - accents are removed and case is folded: "muller" finds "Müller"
+#    - with --append-to master.bib the index master.bib.fts is extended
+#      by the appended records
+# 
+# RIS2bib out.bib --search "title:biblatex AND biber"      [--search]
+#    - shows the keys of the matching records in out.bib.fts, best first,
+#      one per line; no conversion
+#    - queries: "latex fonts" (both words), "font*", "biber OR bibtex",
+#      "\"beamer class\"" (phrase), "author:knuth", "NOT", "(...)"
+#    - exit code 0: records found; 1: no record found
+# 
+# RIS2bib big.ris -o big.bib --checkpoint 60              [-o, --checkpoint]
+#    - the conversion is written to big.bib.part and renamed to big.bib
+#      when it is complete; an existing big.bib stays untouched until then
+#    - every 60 seconds the position in big.ris and the length of
+#      big.bib.part are written to big.bib.checkpoint; the keys generated
+#      since the last checkpoint are appended to big.bib.checkpoint.keys;
+#      the output is synced to disk only at a checkpoint and at the end
+#    - the input is memory-mapped (as with -m)
+# 
+# RIS2bib big.ris -o big.bib --resume                     [-o, --resume]
+#    - continues a killed conversion at its last checkpoint: big.bib.part
+#      and big.bib.checkpoint.keys are cut to the lengths in
+#      big.bib.checkpoint, and big.ris is parsed from the position in the
+#      checkpoint with the same keys
+#    - the result is the same as that of an uninterrupted conversion
+#    - "--- Resumed from big.bib.checkpoint at line 162891 (5696 records
+#      converted)"
+#    - without a checkpoint the conversion starts from the beginning
+
+
+# =============================================================
+# The Preparation
+
+# -------------------------------------------------------------
+# Modules needed
+
+import re                       # regular expressions
+import sys                      # system calls
+import time                     # get time/date of file
+import codecs                   # incremental decoders
+import io                       # newline translation
+import mmap                     # memory-mapped input
+import heapq                    # k-way merge of sorted runs
+import contextvars              # decoding errors counted per converter
+import os                       # file size and modification time
+import stat                     # regular output file (see atomicoutput)
+import unicodedata              # decomposition of accented characters
+from array import array         # compact columns of the record store
+from collections.abc import MutableMapping # conversion table, corrections
+from types import MappingProxyType  # read-only compiled conversion tables
+from collections import namedtuple  # parsed names
+
+# -------------------------------------------------------------
+# Modules loaded only when needed (fast start for -h, -V and small files;
+# see RIS2bib-startup.py)
+#
+# argparse              : argument parsing (only the program, not the module)
+# unidecode             : mapping unicode characters to ASCII (see toascii)
+# asyncio               : asynchronous interface (aparse, arender)
+# json, tempfile        : sorted runs in temporary files (--sort-by)
+# json                  : checkpoints (--checkpoint, --resume)
+# random                : reservoir sampling (--sample)
+# queue, threading      : threaded pipeline (--pipeline)
+# hashlib               : keys of the parent entries (--crossref), hash index (--diff)
+# sqlite3               : full-text index (--fulltext, --search)
+# cProfile, tracemalloc : profiles (--profile)
+
+# -------------------------------------------------------------
+# program related infos
+
+programname       = "RIS2bib.py"
+programversion    = "1.7"
+programdate       = "2020-07-16"
+programauthor     = "Günter Partosch"
+authorinstitution = "Justus-Liebig-Universität Gießen, Hochschulrechenzentrum"
+authoremail       = "Guenter.Partosch@hrz.uni-giessen.de"
+call              = sys.argv
+
+# -------------------------------------------------------------
+# Conversion table and compiled conversion tables
+#
+# config (see below) is compiled into a read-only table RIS type --->
+# TableEntry, which is shared by all conversions (see newstate,
+# Converter); every change of config discards the compiled table (all
+# changes, also update, pop, setdefault and clear, go through
+# __setitem__ and __delitem__)
+
+TableEntry = namedtuple("TableEntry", ["bibtype", "layer", "linetable"])
+
+class ConfigLayer(MutableMapping):                  # RIS key ---> BibTeX field (one RIS type)
+    def __init__(self, layer, owner):
+        self.fields = dict(layer)
+        self.owner  = owner                         # ConfigTable or ConfigOverlay
+
+    def __getitem__(self, riskey):
+        return self.fields[riskey]
+
+    def __setitem__(self, riskey, bibfield):
+        self.fields[riskey] = bibfield
+        self.owner.compiled = None
+
+    def __delitem__(self, riskey):
+        del self.fields[riskey]
+        self.owner.compiled = None
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+        return repr(self.fields)
+
+class ConfigTable(MutableMapping):                  # RIS type ---> ConfigLayer
+    def __init__(self):
+        self.layers   = {}
+        self.compiled = None                        # compiled table (see compile)
+
+    def __getitem__(self, ristype):
+        return self.layers[ristype]
+
+    def __setitem__(self, ristype, layer):
+        self.layers[ristype] = ConfigLayer(layer, self)
+        self.compiled = None
+
+    def __delitem__(self, ristype):
+        del self.layers[ristype]
+        self.compiled = None
+
+    def __iter__(self):
+        return iter(self.layers)
+
+    def __len__(self):
+        return len(self.layers)
+
+    def __repr__(self):
+        return repr(self.layers)
+
+    def compile(self):                              # RIS type ---> TableEntry (read-only)
+        table = self.compiled
+        if table is None:
+            table = self.compiled = MappingProxyType({ristype: compileentry(layer)
+                                                      for (ristype, layer) in self.items()})
+        return table
+
+# -------------------------------------------------------------
+# Corrections of one conversion (see Converter): a RIS type is copied
+# from the compiled table when it is used first (copy-on-write); the
+# compiled entries of all other RIS types stay shared
+
+class ConfigOverlay(MutableMapping):                # RIS type ---> ConfigLayer
+    def __init__(self, base):
+        self.base     = base                        # compiled table (read-only)
+        self.layers   = {}                          # copied or new RIS types ---> ConfigLayer
+        self.deleted  = set()                       # deleted RIS types
+        self.compiled = None                        # compiled table (see compile)
+
+    def __contains__(self, ristype):
+        return ristype in self.layers or (ristype in self.base and ristype not in self.deleted)
+
+    def __getitem__(self, ristype):
+        if ristype not in self.layers:
+            if ristype not in self:
+                raise KeyError(ristype)
+            self.layers[ristype] = ConfigLayer(self.base[ristype].layer, self)  # copy
+        return self.layers[ristype]
+
+    def __setitem__(self, ristype, layer):
+        self.layers[ristype] = ConfigLayer(layer, self)
+        self.deleted.discard(ristype)
+        self.compiled = None
+
+    def __delitem__(self, ristype):
+        if ristype not in self:
+            raise KeyError(ristype)
+        self.layers.pop(ristype, None)
+        self.deleted.add(ristype)
+        self.compiled = None
+
+    def __iter__(self):
+        for ristype in self.base:
+            if ristype not in self.layers and ristype not in self.deleted:
+                yield ristype
+        yield from self.layers
+
+    def __len__(self):
+        return sum(1 for ristype in self)
+
+    def compile(self):                              # RIS type ---> TableEntry (read-only)
+        table = self.compiled
+        if table is None:
+            if not self.layers and not self.deleted:
+                table = self.base                   # nothing corrected
+            else:
+                table = {ristype: entry for (ristype, entry) in self.base.items()
+                         if ristype not in self.deleted and ristype not in self.layers}
+                for (ristype, layer) in self.layers.items():
+                    table[ristype] = compileentry(layer)
+                table = MappingProxyType(table)
+            self.compiled = table
+        return table
+
+# -------------------------------------------------------------
+# Initialize the conversion table
+
+config            = ConfigTable()
+config["ADVS"]    = {"TY": "@audio"}         # ADVS, SLIDE, SOUND, VIDEO
+config["ART"]     = {"TY": "@art"}           # Art work
+config["BOOK"]    = {"TY": "@book"}          # Book
+config["CHAP"]    = {"TY": "@inbook"}        # Chapter?
+config["COMP"]    = {"TY": "@software"}      # Computer program
+config["CONF"]    = {"TY": "@proceedings"}   # Conference proceeding
+config["CPAPER"]  = {"TY": "@inproceedings"} # Conference paper
+config["ELEC"]    = {"TY": "@online"}        # Electronic Citation
+config["GEN"]     = {"TY": "@misc"}          # generic
+config["ICOMM"]   = {"TY": "@online"}        # Internet communication
+config["JOUR"]    = {"TY": "@article"}       # ABST, INPR, JFULL, JOUR
+config["MANSCPT"] = {"TY": "@unpublished"}   # Manuscript
+config["MUSIC"]   = {"TY": "@music"}         # Music score
+config["NEWS"]    = {"TY": "@article"}       # Newspaper
+config["PCOMM"]   = {"TY": "@letter"}        # Personal communication
+config["THES"]    = {"TY": "@thesis"}        # Thesis/Dissertation
+config["UNPB"]    = {"TY": "@unpublished"}   # Unpublished work
+
+config["ADVS"]["A1"]    = "author"     # primary author
+config["ADVS"]["A2"]    = "userd"      # Performers
+config["ADVS"]["A3"]    = "editor"     # Series Editor
+config["ADVS"]["A4"]    = ""           # Subsidiary Author / Translator
+config["ADVS"]["AB"]    = "abstract"   # Abstract
+config["ADVS"]["AD"]    = ""           # Author Address
+config["ADVS"]["AN"]    = ""           # Accession Number
+config["ADVS"]["AU"]    = "author"     # Author
+config["ADVS"]["C1"]    = "usere"      # Cast
+config["ADVS"]["C2"]    = ""           # Credits
+config["ADVS"]["C3"]    = "userc"      # Size/Length
+config["ADVS"]["C4"]    = "eventdate"  # Event Date
+config["ADVS"]["C5"]    = "type"       # Format
+config["ADVS"]["C7"]    = "eventtitle" # Event Title
+config["ADVS"]["CA"]    = "usera"      # Caption
+config["ADVS"]["CN"]    = ""           # Call Number
+config["ADVS"]["CY"]    = "location"   # City
+config["ADVS"]["DA"]    = "data"       # Date
+config["ADVS"]["DB"]    = ""           # Name of Database
+config["ADVS"]["DO"]    = "doi"        # DOI
+config["ADVS"]["DP"]    = ""           # Database Provider
+config["ADVS"]["ER"]    = ""           # End of Record
+config["ADVS"]["ET"]    = "edition"    # Edition
+config["ADVS"]["H1"]    = ""           # ?
+config["ADVS"]["H2"]    = ""           # ?
+config["ADVS"]["ID"]    = ""           # Reference ID
+config["ADVS"]["J2"]    = ""           # Alternate Title
+config["ADVS"]["KW"]    = "keywords"   # Keywords
+config["ADVS"]["L1"]    = ""           # File Attachments
+config["ADVS"]["L2"]    = ""           # ?
+config["ADVS"]["L3"]    = ""           # ?
+config["ADVS"]["L4"]    = ""           # Figure
+config["ADVS"]["LA"]    = "language"   # Language
+config["ADVS"]["LB"]    = "userb"      # Label
+config["ADVS"]["M1"]    = "number"     # Number
+config["ADVS"]["M3"]    = "type"       # Type
+config["ADVS"]["N1"]    = "note"       # Notes
+config["ADVS"]["N2"]    = "abstract"   # like AB
+config["ADVS"]["NV"]    = ""           # Extent of Work
+config["ADVS"]["OP"]    = "userf"      # Contents
+config["ADVS"]["PB"]    = "publisher"  # Publisher
+config["ADVS"]["PY"]    = "year"       # Year
+config["ADVS"]["RN"]    = ""           # Research Notes
+config["ADVS"]["SN"]    = "isbn"       # ISBN
+config["ADVS"]["ST"]    = "shorttitle" # Short Title
+config["ADVS"]["SV"]    = ""           # ?
+config["ADVS"]["T1"]    = "title"      # Title
+config["ADVS"]["T3"]    = "series"     # Series Title
+config["ADVS"]["TA"]    = ""           # Translated Author
+config["ADVS"]["TI"]    = "title"      # Title
+config["ADVS"]["TT"]    = ""           # Translated Title
+config["ADVS"]["U6"]    = ""           # like L1
+config["ADVS"]["UR"]    = "url"        # URL
+config["ADVS"]["VL"]    = "volume"     # Volume
+config["ADVS"]["Y2"]    = "date"       # Date of last change
+config["ADVS"]["Y3"]    = "urldate"    # Access Date
+
+config["ART"]["A1"]     = "author"      # primary author
+config["ART"]["A2"]     = "author"      # secondary author
+config["ART"]["A3"]     = "author"      # tertiary author
+config["ART"]["A4"]     = ""            # Subsidiary Author / Translator
+config["ART"]["AB"]     = "abstract"    # Abstract
+config["ART"]["AD"]     = ""            # Author Address
+config["ART"]["AN"]     = ""            # Accession Number
+config["ART"]["AU"]     = "author"      # Artist
+config["ART"]["C1"]     = "venue"       # Place Published
+config["ART"]["C2"]     = ""            # Year Published
+config["ART"]["C3"]     = "userc"       # Size/Length
+config["ART"]["C4"]     = "eventdate"   # Event Date
+config["ART"]["C5"]     = ""            # Packaging Method
+config["ART"]["C7"]     = "eventtitle"  # Event Title
+config["ART"]["CA"]     = "usera"       # Caption
+config["ART"]["CN"]     = ""            # Call Number
+config["ART"]["CY"]     = "location"    # City
+config["ART"]["DA"]     = "date"        # Date
+config["ART"]["DB"]     = ""            # Name of Database
+config["ART"]["DO"]     = "doi"         # DOI
+config["ART"]["DP"]     = ""            # Database Provider
+config["ART"]["ER"]     = ""            # End of Record
+config["ART"]["ET"]     = "edition"     # Edition
+config["ART"]["H1"]     = ""            # ?
+config["ART"]["H2"]     = ""            # ?
+config["ART"]["ID"]     = ""            # Reference ID
+config["ART"]["J2"]     = ""            # Alternate Title
+config["ART"]["KW"]     = "keywords"    # Keywords
+config["ART"]["L1"]     = ""            # File Attachments
+config["ART"]["L2"]     = ""            # ?
+config["ART"]["L3"]     = ""            # ?
+config["ART"]["L4"]     = ""            # Figure
+config["ART"]["LA"]     = "language"    # Language
+config["ART"]["LB"]     = "userb"       # Label
+config["ART"]["M1"]     = "userc"       # Size
+config["ART"]["M3"]     = "type"        # Type of Work
+config["ART"]["N1"]     = "note"        # Notes
+config["ART"]["N2"]     = "abstract"    # like AB
+config["ART"]["PB"]     = "publisher"   # Publisher
+config["ART"]["PY"]     = "year"        # Year
+config["ART"]["RN"]     = ""            # Research Notes
+config["ART"]["SP"]     = "description" # Description (add.)
+config["ART"]["ST"]     = "shorttitle"  # Short Title
+config["ART"]["SV"]     = ""            # ?
+config["ART"]["T1"]     = "title"       # Title
+config["ART"]["TA"]     = ""            # Translated Author
+config["ART"]["TI"]     = "title"       # Title
+config["ART"]["TT"]     = ""            # Translated Title
+config["ART"]["U6"]     = ""            # like L1
+config["ART"]["UR"]     = "url"         # URL
+config["ART"]["Y2"]     = "date"        # Date of last change
+config["ART"]["Y3"]     = "urldate"     # Access Date
+
+config["BOOK"]["A1"]    = "author"       # primary author
+config["BOOK"]["A2"]    = "editor"       # Series Editor
+config["BOOK"]["A3"]    = "author"       # tertiary author
+config["BOOK"]["A4"]    = "author"       # Translator
+config["BOOK"]["A4"]    = ""             # Subsidiary Author / Translator
+config["BOOK"]["AB"]    = "abstract"     # Abstract
+config["BOOK"]["AD"]    = ""             # Author Address
+config["BOOK"]["AN"]    = ""             # Accession Number
+config["BOOK"]["AU"]    = "author"       # Author
+config["BOOK"]["C1"]    = "venue"        # Place Published
+config["BOOK"]["C2"]    = ""             # Year Published
+config["BOOK"]["C3"]    = ""             # Proceedings Title
+config["BOOK"]["C4"]    = "eventdate"    # Event Date
+config["BOOK"]["C5"]    = ""             # Packaging Method
+config["BOOK"]["C7"]    = "eventtitle"   # Event Title
+config["BOOK"]["CA"]    = ""             # Caption
+config["BOOK"]["CN"]    = ""             # Call Number
+config["BOOK"]["CY"]    = "location"     # City
+config["BOOK"]["DA"]    = "date"         # Date
+config["BOOK"]["DB"]    = ""             # Name of Database
+config["BOOK"]["DO"]    = "doi"          # DOI
+config["BOOK"]["DP"]    = ""             # Database Provider
+config["BOOK"]["ED"]    = "editor"       # Editor
+config["BOOK"]["ER"]    = ""             # End of Record
+config["BOOK"]["ET"]    = "edition"      # Edition
+config["BOOK"]["H1"]    = ""             # ?
+config["BOOK"]["H2"]    = ""             # ?
+config["BOOK"]["ID"]    = ""             # Reference ID
+config["BOOK"]["IN"]    = "organization" # institution
+config["BOOK"]["IS"]    = "number"       # Issue
+config["BOOK"]["J2"]    = ""             # Abbreviation
+config["BOOK"]["KW"]    = "keywords"     # Keywords
+config["BOOK"]["L1"]    = ""             # File Attachments
+config["BOOK"]["L2"]    = ""             # ?
+config["BOOK"]["L3"]    = ""             # ?
+config["BOOK"]["L4"]    = ""             # Figure
+config["BOOK"]["LA"]    = "language"     # Language
+config["BOOK"]["LB"]    = ""             # Label
+config["BOOK"]["M1"]    = ""             # Series Volume
+config["BOOK"]["M3"]    = ""             # Type of Work
+config["BOOK"]["M4"]    = ""             # Citavi
+config["BOOK"]["N1"]    = "note"         # Notes
+config["BOOK"]["N2"]    = "abstract"     # like AB
+config["BOOK"]["NV"]    = "volumes"      # Number of Volumes
+config["BOOK"]["OP"]    = ""             # Original Publication
+config["BOOK"]["PB"]    = "publisher"    # Publisher
+config["BOOK"]["PY"]    = "year"         # Year
+config["BOOK"]["RN"]    = ""             # Research Notes
+config["BOOK"]["RP"]    = ""             # Reprint Edition
+config["BOOK"]["SE"]    = "pages"        # Pages
+config["BOOK"]["SN"]    = "isbn"         # ISBN
+config["BOOK"]["SP"]    = "pagetotal"    # Number of Pages
+config["BOOK"]["ST"]    = "shorttitle"   # Short Title
+config["BOOK"]["SV"]    = ""             # ?
+config["BOOK"]["T1"]    = "title"        # Title
+config["BOOK"]["T2"]    = "series"       # Series Title
+config["BOOK"]["T4"]    = "subtitle"     # subtitle
+config["BOOK"]["T5"]    = "titleaddon"   # titleaddon
+config["BOOK"]["TA"]    = ""             # Translated Author
+config["BOOK"]["TI"]    = "title"        # Title
+config["BOOK"]["TS"]    = ""             # Title source
+config["BOOK"]["TT"]    = ""             # Translated Title
+config["BOOK"]["U3"]    = "note"         # Note
+config["BOOK"]["U6"]    = ""             # like L1
+config["BOOK"]["UR"]    = "url"          # URL
+config["BOOK"]["VL"]    = "volume"       # Volume
+config["BOOK"]["Y2"]    = "date"         # Date of last change
+config["BOOK"]["Y3"]    = "urldate"      # Access Date
+
+config["CHAP"]["A1"]    = "author"     # primary author
+config["CHAP"]["A2"]    = "editor"     # Editor
+config["CHAP"]["A3"]    = "author"     # tertiary author / Series Editor
+config["CHAP"]["A4"]    = ""           # Subsidiary Author / Translator
+config["CHAP"]["A4"]    = ""           # Translator
+config["CHAP"]["AB"]    = "abstract"   # Abstract
+config["CHAP"]["AD"]    = ""           # Author Address
+config["CHAP"]["AN"]    = ""           # Accession Number
+config["CHAP"]["AU"]    = "author"     # Author
+config["CHAP"]["C1"]    = "venue"      # Place Published
+config["CHAP"]["C2"]    = ""           # Year Published
+config["CHAP"]["C3"]    = ""           # Title Prefix
+config["CHAP"]["C4"]    = "eventdate"  # Event Date
+config["CHAP"]["C5"]    = ""           # Packaging Method
+config["CHAP"]["C7"]    = "eventtitle" # Event Title
+config["CHAP"]["CA"]    = ""           # Caption
+config["CHAP"]["CN"]    = ""           # Call Number
+config["CHAP"]["CY"]    = "location"   # City
+config["CHAP"]["DB"]    = ""           # Name of Database
+config["CHAP"]["DO"]    = "doi"        # DOI
+config["CHAP"]["DP"]    = ""           # Database Provider
+config["CHAP"]["ED"]    = "editor"     # Editor
+config["CHAP"]["EP"]    = "pages"      # end page
+config["CHAP"]["ER"]    = ""           # End of Record
+config["CHAP"]["ET"]    = "edition"    # Edition
+config["CHAP"]["H1"]    = ""           # ?
+config["CHAP"]["H2"]    = ""           # ?
+config["CHAP"]["ID"]    = ""           # Reference ID
+config["CHAP"]["IS"]    = "issue"      # Issue
+config["CHAP"]["IS"]    = ""           # Number of Volumes
+config["CHAP"]["J2"]    = ""           # Abbreviation
+config["CHAP"]["KW"]    = "keywords"   # Keywords
+config["CHAP"]["L1"]    = ""           # File Attachments
+config["CHAP"]["L2"]    = ""           # ?
+config["CHAP"]["L3"]    = ""           # ?
+config["CHAP"]["L4"]    = ""           # Figure
+config["CHAP"]["LA"]    = "language"   # Language
+config["CHAP"]["LB"]    = ""           # Label
+config["CHAP"]["M4"]    = ""           # Citavi
+config["CHAP"]["N1"]    = "note"       # Notes
+config["CHAP"]["N2"]    = "abstract"   # like AB
+config["CHAP"]["OP"]    = ""           # Original Publication
+config["CHAP"]["PB"]    = "publisher"  # Publisher
+config["CHAP"]["PY"]    = "year"       # Year
+config["CHAP"]["RI"]    = ""           # Reviewed Item
+config["CHAP"]["RN"]    = ""           # Research Notes
+config["CHAP"]["RP"]    = ""           # Reprint Edition
+config["CHAP"]["SE"]    = "chapter"    # Chapter
+config["CHAP"]["SN"]    = "isbn"       # ISBN
+config["CHAP"]["SP"]    = "pages"      # Pages
+config["CHAP"]["ST"]    = "shorttitle" # Short Title
+config["CHAP"]["SV"]    = "number"     # Series Volume
+config["CHAP"]["T1"]    = "title"      # Title
+config["CHAP"]["T2"]    = "subtitle"   # Subtitle
+config["CHAP"]["T3"]    = "series"     # Series Title
+config["CHAP"]["T4"]    = "subtitle"   # subtitle
+config["CHAP"]["T5"]    = "titleaddon" # titladdon
+config["CHAP"]["TA"]    = ""           # Translated Author
+config["CHAP"]["TI"]    = "title"      # Title
+config["CHAP"]["TT"]    = ""           # Translated Title
+config["CHAP"]["U6"]    = ""           # like L1
+config["CHAP"]["UR"]    = "url"        # URL
+config["CHAP"]["VL"]    = "volume"     # Volume
+config["CHAP"]["Y2"]    = "date"       # Date of last change
+config["CHAP"]["Y3"]    = "urldate"    # Access Date
+
+config["COMP"]["A1"]    = "author"       # primary author
+config["COMP"]["A2"]    = "author"       # secondary author
+config["COMP"]["A3"]    = "author"       # tertiary author
+config["COMP"]["A4"]    = "author"       # Involved Person
+config["COMP"]["AB"]    = "abstract"     # Abstract
+config["COMP"]["AD"]    = ""             # Author Address
+config["COMP"]["AN"]    = ""             # Accession Number
+config["COMP"]["AU"]    = "author"       # Programmer
+config["COMP"]["C1"]    = "venue"        # Place Published
+config["COMP"]["C2"]    = ""             # Year Published
+config["COMP"]["C3"]    = ""             # Proceedings Title
+config["COMP"]["C4"]    = "eventdate"    # Event Date
+config["COMP"]["C5"]    = ""             # Packaging Method
+config["COMP"]["C7"]    = "eventtitle"   # Event Title
+config["COMP"]["CA"]    = ""             # Caption
+config["COMP"]["CN"]    = ""             # Call Number
+config["COMP"]["CY"]    = "location"     # City
+config["COMP"]["DB"]    = ""             # Name of Database
+config["COMP"]["DO"]    = "doi"          # DOI
+config["COMP"]["DP"]    = ""             # Database Provider
+config["COMP"]["ER"]    = ""             # End of Record
+config["COMP"]["ET"]    = "edition"      # Edition
+config["COMP"]["ET"]    = ""             # Version
+config["COMP"]["H1"]    = ""             # ?
+config["COMP"]["H2"]    = ""             # ?
+config["COMP"]["ID"]    = ""             # Reference ID
+config["COMP"]["IN"]    = "organization" # Institution
+config["COMP"]["J2"]    = ""             # Alternate Title
+config["COMP"]["KW"]    = "keywords"     # Keywords
+config["COMP"]["L1"]    = ""             # File Attachments
+config["COMP"]["L2"]    = ""             # ?
+config["COMP"]["L3"]    = ""             # ?
+config["COMP"]["L4"]    = ""             # Figure
+config["COMP"]["LA"]    = "language"     # Language
+config["COMP"]["LB"]    = ""             # Label
+config["COMP"]["M1"]    = ""             # Computer
+config["COMP"]["M3"]    = ""             # Type
+config["COMP"]["M4"]    = ""             # Citavi
+config["COMP"]["N1"]    = "note"         # Notes
+config["COMP"]["N2"]    = "abstract"     # like AB
+config["COMP"]["NV"]    = "volumes"      # Bandzahl
+config["COMP"]["PB"]    = "publisher"    # Publisher
+config["COMP"]["PY"]    = "year"         # Year
+config["COMP"]["RN"]    = ""             # Research Notes
+config["COMP"]["SN"]    = "isbn"         # ISBN
+config["COMP"]["SP"]    = "pagetotal"    # Pages
+config["COMP"]["ST"]    = "shorttitle"   # Short Title
+config["COMP"]["SV"]    = ""             # ?
+config["COMP"]["T1"]    = "title"        # Title
+config["COMP"]["T2"]    = "series"       # Series Title
+config["COMP"]["T4"]    = "subtitle"     # subtitle
+config["COMP"]["T5"]    = "titleaddon"   # titleaddon
+config["COMP"]["TA"]    = ""             # Translated Author
+config["COMP"]["TI"]    = "title"        # Title
+config["COMP"]["TT"]    = ""             # Translated Title
+config["COMP"]["U3"]    = "note"         # Note
+config["COMP"]["U6"]    = ""             # like L1
+config["COMP"]["UR"]    = "url"          # URL
+config["COMP"]["VL"]    = "volume"       # Volume Number
+config["COMP"]["Y2"]    = "date"         # Date of last change
+config["COMP"]["Y3"]    = "urldate"      # Access Date
+
+config["CONF"]["A1"]    = "author"     # primary author
+config["CONF"]["A2"]    = "editor"     # Editor
+config["CONF"]["A3"]    = "author"     # tertiary author / Series Editor
+config["CONF"]["A4"]    = ""           # Sponsor
+config["CONF"]["AB"]    = "abstract"   # Abstract
+config["CONF"]["AD"]    = ""           # Author Address
+config["CONF"]["AN"]    = ""           # Accession Number
+config["CONF"]["AU"]    = "author"     # Author
+config["CONF"]["C1"]    = "venue"      # Place Published
+config["CONF"]["C2"]    = ""           # Year Published
+config["CONF"]["C3"]    = ""           # Proceedings Title
+config["CONF"]["C4"]    = "eventdate"  # Event Date
+config["CONF"]["C5"]    = ""           # Packaging Method
+config["CONF"]["C7"]    = "eventtitle" # Event Title
+config["CONF"]["CA"]    = ""           # Caption
+config["CONF"]["CN"]    = ""           # Call Number
+config["CONF"]["CY"]    = "location"   # Conference Location
+config["CONF"]["DA"]    = "date"       # Date
+config["CONF"]["DB"]    = ""           # Name of Database
+config["CONF"]["DO"]    = "doi"        # DOI
+config["CONF"]["DP"]    = ""           # Database Provider
+config["CONF"]["ER"]    = ""           # End of Record
+config["CONF"]["ET"]    = "edition"    # Edition
+config["CONF"]["H1"]    = ""           # ?
+config["CONF"]["H2"]    = ""           # ?
+config["CONF"]["ID"]    = ""           # Reference ID
+config["CONF"]["IS"]    = "number"     # Zusatztitel
+config["CONF"]["JA"]    = ""           # Zusatztitel
+config["CONF"]["KW"]    = "keywords"   # Keywords
+config["CONF"]["L1"]    = ""           # File Attachments
+config["CONF"]["L2"]    = ""           # ?
+config["CONF"]["L3"]    = ""           # ?
+config["CONF"]["L4"]    = ""           # Figure
+config["CONF"]["LA"]    = "language"   # Language
+config["CONF"]["LB"]    = ""           # Label
+config["CONF"]["M1"]    = ""           # Issue
+config["CONF"]["M4"]    = ""           # Citavi
+config["CONF"]["N1"]    = "note"       # Notes
+config["CONF"]["N2"]    = "abstract"   # like AB
+config["CONF"]["NV"]    = "volumes"    # Number of Volumes
+config["CONF"]["PB"]    = "publisher"  # Publisher
+config["CONF"]["PY"]    = "year"       # Year of Conference
+config["CONF"]["RN"]    = ""           # Research Notes
+config["CONF"]["SN"]    = "isbn"       # ISBN
+config["CONF"]["SP"]    = "pagetotal"  # Pages
+config["CONF"]["ST"]    = "shorttitle" # Short Title
+config["CONF"]["SV"]    = ""           # ?
+config["CONF"]["T1"]    = "title"      # Title
+config["CONF"]["T2"]    = "eventtitle" # Event Name
+config["CONF"]["T3"]    = "series"     # Series Title
+config["CONF"]["T4"]    = "subtitle"   # subtitle
+config["CONF"]["T5"]    = "titleaddon" # titleaddon
+config["CONF"]["TA"]    = ""           # Translated Author
+config["CONF"]["TI"]    = "title"      # Title
+config["CONF"]["TT"]    = ""           # Translated Title
+config["CONF"]["U6"]    = ""           # like L1
+config["CONF"]["UR"]    = "url"        # URL
+config["CONF"]["VL"]    = "volume"     # Volume
+config["CONF"]["Y2"]    = "date"       # Date of last change
+config["CONF"]["Y3"]    = "urldate"    # Access Date
+
+config["CPAPER"]["A1"]  = "author"       # primary author
+config["CPAPER"]["A2"]  = "editor"       # Editor
+config["CPAPER"]["A3"]  = "author"       # tertiary author
+config["CPAPER"]["A4"]  = ""             # Subsidiary Author / Translator
+config["CPAPER"]["AB"]  = "abstract"     # Abstract
+config["CPAPER"]["AD"]  = ""             # Author Address
+config["CPAPER"]["AN"]  = ""             # Accession Number
+config["CPAPER"]["AU"]  = "author"       # Author
+config["CPAPER"]["C1"]  = "venue"        # Place Published
+config["CPAPER"]["C2"]  = ""             # Year Published
+config["CPAPER"]["C3"]  = ""             # Proceedings Title
+config["CPAPER"]["C4"]  = "eventdate"    # Event Date
+config["CPAPER"]["C5"]  = ""             # Packaging Method
+config["CPAPER"]["C7"]  = "eventtitle"   # Event Title
+config["CPAPER"]["CA"]  = ""             # Caption
+config["CPAPER"]["CY"]  = "location"     # Conference Location
+config["CPAPER"]["DA"]  = ""             # Date
+config["CPAPER"]["DB"]  = ""             # Name of Database
+config["CPAPER"]["DO"]  = "doi"          # DOI
+config["CPAPER"]["DP"]  = ""             # Database Provider
+config["CPAPER"]["ED"]  = "editor"       # Editor?"CY"
+config["CPAPER"]["EP"]  = "pages"        # End Page
+config["CPAPER"]["ER"]  = ""             # End of Record
+config["CPAPER"]["ET"]  = "edition"      # Edition
+config["CPAPER"]["H1"]  = ""             # ?
+config["CPAPER"]["H2"]  = ""             # ?
+config["CPAPER"]["ID"]  = ""             # Reference ID
+config["CPAPER"]["IN"]  = "organization" # Heftnummer
+config["CPAPER"]["IS"]  = "number"       # Heftnummer
+config["CPAPER"]["KW"]  = "keywords"     # Keywords
+config["CPAPER"]["L1"]  = ""             # File Attachments
+config["CPAPER"]["L2"]  = ""             # ?
+config["CPAPER"]["L3"]  = ""             # ?
+config["CPAPER"]["L4"]  = ""             # Figure
+config["CPAPER"]["LA"]  = "language"     # Language
+config["CPAPER"]["LB"]  = ""             # Label
+config["CPAPER"]["M3"]  = ""             # Type of Work
+config["CPAPER"]["M4"]  = ""             # Citavi
+config["CPAPER"]["N1"]  = "note"         # Notes
+config["CPAPER"]["N2"]  = "abstract"     # like AB
+config["CPAPER"]["PB"]  = "publisher"    # Publisher
+config["CPAPER"]["PY"]  = "year"         # Year
+config["CPAPER"]["RN"]  = ""             # Research Notes
+config["CPAPER"]["SN"]  = "isbn"         # ISBN
+config["CPAPER"]["SP"]  = "pages"        # Pages
+config["CPAPER"]["SP"]  = "pages"        # Start Page
+config["CPAPER"]["ST"]  = "shorttitle"   # Short Title
+config["CPAPER"]["T1"]  = "title"        # Title
+config["CPAPER"]["T2"]  = ""             # Conference Name
+config["CPAPER"]["T2"]  = "subtitle"     # Subtitle
+config["CPAPER"]["T3"]  = "series"       # series
+config["CPAPER"]["T4"]  = "subtitle"     # subtitle 
+config["CPAPER"]["T5"]  = "titleaddon"   # titleaddon
+config["CPAPER"]["TA"]  = ""             # Translated Author
+config["CPAPER"]["TI"]  = "title"        # Title
+config["CPAPER"]["TT"]  = ""             # Translated Title
+config["CPAPER"]["U6"]  = ""             # like L1
+config["CPAPER"]["UR"]  = "url"          # URL
+config["CPAPER"]["VL"]  = "volume"       # Volume
+config["CPAPER"]["Y2"]  = "date"         # Date of last change
+config["CPAPER"]["Y3"]  = "urldate"      # Access Date
+
+config["ELEC"]["A1"]    = "author"       # primary author
+config["ELEC"]["A2"]    = "editor"       # Series Editor
+config["ELEC"]["A3"]    = "author"       # tertiary author
+config["ELEC"]["A4"]    = ""             # Series Editor
+config["ELEC"]["A4"]    = ""             # Subsidiary Author / Translator
+config["ELEC"]["AB"]    = "abstract"     # Abstract
+config["ELEC"]["AD"]    = ""             # Author Address
+config["ELEC"]["AN"]    = ""             # Accession Number
+config["ELEC"]["AU"]    = "author"       # Author
+config["ELEC"]["C1"]    = "venue"        # Place Published
+config["ELEC"]["C2"]    = ""             # Year Published
+config["ELEC"]["C2"]    = "urldate"      # Date Cited
+config["ELEC"]["C3"]    = ""             # Proceedings Title
+config["ELEC"]["C4"]    = "eventdate"    # Event Date
+config["ELEC"]["C5"]    = ""             # Packaging Method
+config["ELEC"]["C7"]    = "eventtitle"   # Event Title
+config["ELEC"]["CA"]    = ""             # Caption
+config["ELEC"]["CN"]    = ""             # Call Number
+config["ELEC"]["CY"]    = "location"     # City
+config["ELEC"]["DA"]    = "date"         # Last Update Date
+config["ELEC"]["DB"]    = ""             # Name of Database
+config["ELEC"]["DO"]    = "doi"          # DOI
+config["ELEC"]["DP"]    = ""             # Database Provider
+config["ELEC"]["ER"]    = ""             # End of Record
+config["ELEC"]["ET"]    = "edition"      # Edition
+config["ELEC"]["H1"]    = ""             # ?
+config["ELEC"]["H2"]    = ""             # ?
+config["ELEC"]["ID"]    = ""             # Reference ID
+config["ELEC"]["J2"]    = ""             # Alternate Title
+config["ELEC"]["KW"]    = "keywords"     # Keywords
+config["ELEC"]["L1"]    = ""             # File Attachments
+config["ELEC"]["L2"]    = ""             # ?
+config["ELEC"]["L3"]    = ""             # ?
+config["ELEC"]["L4"]    = ""             # Figure
+config["ELEC"]["LA"]    = "language"     # Language
+config["ELEC"]["LB"]    = ""             # Label
+config["ELEC"]["M1"]    = "urldate"      # Access Date
+config["ELEC"]["M3"]    = "howpublished" # Type of Medium"CY"
+config["ELEC"]["N1"]    = "note"         # Notes
+config["ELEC"]["N2"]    = "abstract"     # like AB
+config["ELEC"]["OP"]    = ""             # Contents
+config["ELEC"]["PB"]    = "publisher"    # Publisher
+config["ELEC"]["PY"]    = "year"         # Year
+config["ELEC"]["RN"]    = ""             # Research Notes
+config["ELEC"]["SN"]    = "isbn"         # ISBN
+config["ELEC"]["SP"]    = ""             # Description
+config["ELEC"]["ST"]    = "shorttitle"   # Short Title
+config["ELEC"]["SV"]    = ""             # ?
+config["ELEC"]["T1"]    = "title"        # Title
+config["ELEC"]["T2"]    = "series"       # Series Title
+config["ELEC"]["TA"]    = ""             # Translated Author
+config["ELEC"]["TI"]    = "title"        # Title
+config["ELEC"]["TT"]    = ""             # Translated Title
+config["ELEC"]["U6"]    = ""             # like L1
+config["ELEC"]["UR"]    = "url"          # URL
+config["ELEC"]["VL"]    = ""             # Access Year
+config["ELEC"]["Y2"]    = "date"         # Date of last change
+config["ELEC"]["Y3"]    = "urldate"      # Access Date
+
+config["GEN"]["A1"]     = "author"       # primary author
+config["GEN"]["A2"]     = "author"       # secondary author
+config["GEN"]["A3"]     = "author"       # tertiary author
+config["GEN"]["A4"]     = "author"       # Involved Person
+config["GEN"]["AB"]     = "abstract"     # Abstract
+config["GEN"]["AD"]     = ""             # Author Address
+config["GEN"]["AN"]     = ""             # Accession Number
+config["GEN"]["AU"]     = "author"       # Author
+config["GEN"]["C1"]     = ""             # Custom 1
+config["GEN"]["C2"]     = ""             # Custom 2
+config["GEN"]["C3"]     = ""             # Custom 3
+config["GEN"]["C4"]     = ""             # Custom 4
+config["GEN"]["C5"]     = ""             # Custom 5
+config["GEN"]["C6"]     = ""             # Custom 6
+config["GEN"]["C7"]     = "eventtitle"   # Event Title
+config["GEN"]["C8"]     = ""             # Custom 8
+config["GEN"]["CA"]     = ""             # Caption
+config["GEN"]["CN"]     = ""             # Call Number
+config["GEN"]["CY"]     = "location"     # Place Published
+config["GEN"]["DA"]     = "date"         # Date
+config["GEN"]["DB"]     = ""             # Name of Database
+config["GEN"]["DO"]     = "doi"          # DOI
+config["GEN"]["DP"]     = ""             # Database Provider
+config["GEN"]["ED"]     = "editor"       # Editor
+config["GEN"]["ER"]     = ""             # End of Record
+config["GEN"]["ET"]     = "edition"      # Edition
+config["GEN"]["H1"]     = ""             # ?
+config["GEN"]["H2"]     = ""             # ?
+config["GEN"]["ID"]     = ""             # Reference ID
+config["GEN"]["IN"]     = "organization" # institution
+config["GEN"]["IS"]     = "issue"        # Issue
+config["GEN"]["J2"]     = ""             # Alternate Title
+config["GEN"]["JF"]     = "series"       # Zeitschrift
+config["GEN"]["KW"]     = "keywords"     # Keywords
+config["GEN"]["L1"]     = ""             # File Attachments
+config["GEN"]["L2"]     = ""             # ?
+config["GEN"]["L3"]     = ""             # ?
+config["GEN"]["L4"]     = ""             # Figure
+config["GEN"]["LA"]     = "language"     # Language
+config["GEN"]["LB"]     = ""             # Label
+config["GEN"]["M1"]     = "number"       # Number
+config["GEN"]["M3"]     = "type"         # Type of Work
+config["GEN"]["M4"]     = ""             # Citavi
+config["GEN"]["N1"]     = "note"         # Notes
+config["GEN"]["N2"]     = "abstract"     # like AB
+config["GEN"]["NV"]     = "volumes"      # Number of Volumes
+config["GEN"]["OP"]     = ""             # Original Publication
+config["GEN"]["PB"]     = "publisher"    # Publisher
+config["GEN"]["PY"]     = "year"         # Year
+config["GEN"]["RI"]     = ""             # Reviewed Item
+config["GEN"]["RN"]     = ""             # Research Notes
+config["GEN"]["RP"]     = ""             # Reprint Edition
+config["GEN"]["SE"]     = ""             # Section
+config["GEN"]["SN"]     = "isbn"         # ISBN/ISSN
+config["GEN"]["SP"]     = "pages"        # Pages
+config["GEN"]["ST"]     = "shorttitle"   # Short Title
+config["GEN"]["SV"]     = ""             # ?
+config["GEN"]["T1"]     = "title"        # Title
+config["GEN"]["T2"]     = "series"       # Secondary Title
+config["GEN"]["T3"]     = ""             # Tertiary Title
+config["GEN"]["T4"]     = "subtitle"     # subtitle
+config["GEN"]["T5"]     = "titleaddon"   # titleaddon
+config["GEN"]["TA"]     = ""             # Translated Author
+config["GEN"]["TI"]     = "title"        # Title
+config["GEN"]["TT"]     = ""             # Translated Title
+config["GEN"]["U3"]     = "note"         # Note
+config["GEN"]["U6"]     = ""             # like L1
+config["GEN"]["UR"]     = "url"          # URL
+config["GEN"]["VL"]     = "volume"       # Volume
+config["GEN"]["Y2"]     = "date"         # Date of last change
+config["GEN"]["Y3"]     = "urldate"      # Access Date
+
+config["ICOMM"]["A1"]   = "author"       # primary author
+config["ICOMM"]["A2"]   = "editor"       # Recipient
+config["ICOMM"]["A3"]   = "author"       # tertiary author
+config["ICOMM"]["A4"]   = ""             # Subsidiary Author / Translator
+config["ICOMM"]["AB"]   = "abstract"     # Abstract
+config["ICOMM"]["AD"]   = ""             # Author Address
+config["ICOMM"]["AN"]   = ""             # Accession Number
+config["ICOMM"]["AU"]   = "author"       # Author
+config["ICOMM"]["C1"]   = "venue"        # Place Published
+config["ICOMM"]["C2"]   = ""             # Recieipients EMail
+config["ICOMM"]["C3"]   = ""             # Proceedings Title
+config["ICOMM"]["C4"]   = "eventdate"    # Event Date
+config["ICOMM"]["C5"]   = ""             # Packaging Method
+config["ICOMM"]["C7"]   = "eventtitle"   # Event Title
+config["ICOMM"]["CA"]   = ""             # Caption
+config["ICOMM"]["CN"]   = ""             # Call Number
+config["ICOMM"]["CY"]   = "location"     # City
+config["ICOMM"]["DA"]   = "date"         # Date
+config["ICOMM"]["DB"]   = ""             # Name of Database
+config["ICOMM"]["DO"]   = "doi"          # DOI
+config["ICOMM"]["DP"]   = ""             # Database Provider
+config["ICOMM"]["ER"]   = ""             # End of Record
+config["ICOMM"]["ET"]   = "version"      # Description?
+config["ICOMM"]["H1"]   = ""             # ?
+config["ICOMM"]["H2"]   = ""             # ?
+config["ICOMM"]["ID"]   = ""             # Reference ID
+config["ICOMM"]["IN"]   = "organization" # Institution
+config["ICOMM"]["IS"]   = "number"       # number
+config["ICOMM"]["J2"]   = ""             # Abbreviation
+config["ICOMM"]["KW"]   = "keywords"     # Keywords
+config["ICOMM"]["L1"]   = ""             # File Attachments
+config["ICOMM"]["L2"]   = ""             # ?
+config["ICOMM"]["L3"]   = ""             # ?
+config["ICOMM"]["L4"]   = ""             # Figure
+config["ICOMM"]["LA"]   = "language"     # Language
+config["ICOMM"]["LB"]   = ""             # Label
+config["ICOMM"]["M1"]   = ""             # Folio Number
+config["ICOMM"]["M3"]   = "type"         # Type
+config["ICOMM"]["M4"]   = ""             # Citavi
+config["ICOMM"]["N1"]   = "note"         # Notes
+config["ICOMM"]["N2"]   = "abstract"     # like AB
+config["ICOMM"]["NV"]   = ""             # Communication Number
+config["ICOMM"]["PB"]   = "publisher"    # Publisher
+config["ICOMM"]["PY"]   = "year"         # Year
+config["ICOMM"]["RN"]   = ""             # Research Notes
+config["ICOMM"]["SN"]   = "isbn"         # ISBN
+config["ICOMM"]["SP"]   = "pagetotal"    # Pages
+config["ICOMM"]["ST"]   = "shorttitle"   # Short Title
+config["ICOMM"]["SV"]   = ""             # ?
+config["ICOMM"]["T1"]   = "title"        # Title
+config["ICOMM"]["T2"]   = "subtitle"     # subtitle
+config["ICOMM"]["T3"]   = "series"       # series
+config["ICOMM"]["T5"]   = "titleaddon"   # Titleaddon
+config["ICOMM"]["TA"]   = ""             # Translated Author
+config["ICOMM"]["TI"]   = "title"        # Title
+config["ICOMM"]["TT"]   = ""             # Translated Title
+config["ICOMM"]["U6"]   = ""             # like L1
+config["ICOMM"]["UR"]   = "url"          # URL
+config["ICOMM"]["VL"]   = "volume"       # Titleaddon?
+config["ICOMM"]["Y2"]   = "date"         # Date of last change
+config["ICOMM"]["Y3"]   = "urldate"      # Access Date
+
+config["JOUR"]["A1"]    = "author"       # primary author
+config["JOUR"]["A2"]    = "publisher"    # secondary author
+config["JOUR"]["A3"]    = "author"       # tertiary author
+config["JOUR"]["A4"]    = ""             # Subsidiary Author / Translator
+config["JOUR"]["AB"]    = "abstract"     # Abstract
+config["JOUR"]["AD"]    = ""             # Author Address
+config["JOUR"]["AN"]    = ""             # Accession Number
+config["JOUR"]["AU"]    = "author"       # Author
+config["JOUR"]["C1"]    = "venue"        # Place Published
+config["JOUR"]["C2"]    = ""             # PMCID
+config["JOUR"]["C3"]    = ""             # Proceedings Title
+config["JOUR"]["C4"]    = "eventdate"    # Event Date
+config["JOUR"]["C5"]    = ""             # Packaging Method
+config["JOUR"]["C6"]    = ""             # NIHMSID
+config["JOUR"]["C7"]    = ""             # Article Number
+config["JOUR"]["CA"]    = ""             # Caption
+config["JOUR"]["CN"]    = ""             # Call Number
+config["JOUR"]["CY"]    = "location"     # 
+config["JOUR"]["DA"]    = "date"         # Date
+config["JOUR"]["DB"]    = ""             # Name of Database
+config["JOUR"]["DO"]    = "doi"          # DOI
+config["JOUR"]["DP"]    = ""             # Database Provider
+config["JOUR"]["EP"]    = "pages"        # End Page
+config["JOUR"]["ER"]    = ""             # End of Record
+config["JOUR"]["ET"]    = ""             # Epub Date
+config["JOUR"]["H1"]    = ""             # ?
+config["JOUR"]["H2"]    = ""             # ?
+config["JOUR"]["ID"]    = ""             # Reference ID
+config["JOUR"]["IN"]    = "organization" # 
+config["JOUR"]["IS"]    = "number"       # Issue
+config["JOUR"]["J2"]    = ""             # Alternate Journal
+config["JOUR"]["JA"]    = "series"       # 
+config["JOUR"]["JF"]    = "journaltitle" # Journaltitle
+config["JOUR"]["KW"]    = "keywords"     # Keywords
+config["JOUR"]["L1"]    = ""             # File Attachments
+config["JOUR"]["L2"]    = ""             # ?
+config["JOUR"]["L3"]    = ""             # ?
+config["JOUR"]["L4"]    = ""             # Figure
+config["JOUR"]["LA"]    = "language"     # Language
+config["JOUR"]["LB"]    = ""             # Label
+config["JOUR"]["M2"]    = ""             # Start Page
+config["JOUR"]["M3"]    = "howpublished" # Type of Article
+config["JOUR"]["M4"]    = ""             # 
+config["JOUR"]["N1"]    = "note"         # Notes
+config["JOUR"]["N2"]    = "abstract"     # like AB
+config["JOUR"]["OP"]    = ""             # Original Publication
+config["JOUR"]["PB"]    = "publisher"    # publisher
+config["JOUR"]["PY"]    = "year"         # Year
+config["JOUR"]["RI"]    = ""             # Reviewed Item
+config["JOUR"]["RN"]    = ""             # Research Notes
+config["JOUR"]["RP"]    = ""             # Reprint Edition
+config["JOUR"]["SN"]    = "issn"         # ISSN
+config["JOUR"]["SP"]    = "pages"        # Start Page
+config["JOUR"]["ST"]    = "shorttitle"   # Short Title
+config["JOUR"]["SV"]    = ""             # ?
+config["JOUR"]["T1"]    = "title"        # Title
+config["JOUR"]["T2"]    = ""             # Journal
+config["JOUR"]["T3"]    = "journaltitle" # Citavi
+config["JOUR"]["T4"]    = "subtitle"     # subtitle
+config["JOUR"]["T5"]    = "titleaddon"   # titleaddonJOUR
+config["JOUR"]["TA"]    = ""             # Translated Author
+config["JOUR"]["TI"]    = "title"        # Title
+config["JOUR"]["TT"]    = ""             # Translated Title
+config["JOUR"]["U3"]    = "note"         # Note
+config["JOUR"]["U6"]    = ""             # like L1
+config["JOUR"]["UR"]    = "url"          # URL
+config["JOUR"]["VL"]    = "volume"       # Volume
+config["JOUR"]["Y2"]    = "date"         # Date of last change
+config["JOUR"]["Y3"]    = "urldate"      # Access Date
+
+config["MANSCPT"]["A1"] = "author"       # primary author
+config["MANSCPT"]["A2"] = "editor"       # A2
+config["MANSCPT"]["A3"] = "author"       # tertiary author
+config["MANSCPT"]["A4"] = ""             # Subsidiary Author / Translator
+config["MANSCPT"]["AB"] = "abstract"     # Abstract
+config["MANSCPT"]["AD"] = ""             # Author Address
+config["MANSCPT"]["AN"] = ""             # Accession Number
+config["MANSCPT"]["AU"] = "author"       # Author
+config["MANSCPT"]["C1"] = "venue"        # Place Published
+config["MANSCPT"]["C2"] = ""             # Year Published
+config["MANSCPT"]["C3"] = ""             # Proceedings Title
+config["MANSCPT"]["C4"] = "eventdate"    # Event Date
+config["MANSCPT"]["C5"] = ""             # Packaging Method
+config["MANSCPT"]["C7"] = "eventtitle"   # Event Title
+config["MANSCPT"]["CA"] = ""             # Caption
+config["MANSCPT"]["CN"] = ""             # Call Number
+config["MANSCPT"]["CY"] = "location"     # City
+config["MANSCPT"]["DA"] = "date"         # Date
+config["MANSCPT"]["DB"] = ""             # Name of Database
+config["MANSCPT"]["DO"] = "doi"          # DOI
+config["MANSCPT"]["DP"] = ""             # Database Provider
+config["MANSCPT"]["ED"] = "editor"       # Editor
+config["MANSCPT"]["ER"] = ""             # End of Record
+config["MANSCPT"]["ET"] = ""             # Description of Material
+config["MANSCPT"]["H1"] = ""             # ?
+config["MANSCPT"]["H2"] = ""             # ?
+config["MANSCPT"]["ID"] = ""             # Reference ID
+config["MANSCPT"]["J2"] = ""             # Abbreviation
+config["MANSCPT"]["KW"] = "keywords"     # Keywords
+config["MANSCPT"]["L1"] = ""             # File Attachments
+config["MANSCPT"]["L2"] = ""             # ?
+config["MANSCPT"]["L3"] = ""             # ?
+config["MANSCPT"]["L4"] = ""             # Figure
+config["MANSCPT"]["LA"] = "language"     # Language
+config["MANSCPT"]["LB"] = ""             # Label
+config["MANSCPT"]["M1"] = ""             # Folio Number
+config["MANSCPT"]["M3"] = "type"         # Type of Work
+config["MANSCPT"]["N1"] = "note"         # Notes
+config["MANSCPT"]["N2"] = "abstract"     # like AB
+config["MANSCPT"]["NV"] = "number"       # Manuscript Number
+config["MANSCPT"]["PB"] = "organization" # Library/Archive
+config["MANSCPT"]["PY"] = "year"         # Year
+config["MANSCPT"]["RN"] = ""             # Research Notes
+config["MANSCPT"]["RP"] = ""             # Reprint Edition
+config["MANSCPT"]["SE"] = "pages"        # Start Page?
+config["MANSCPT"]["SP"] = "pagetotal"    # Pages
+config["MANSCPT"]["ST"] = "shorttitle"   # Short Title
+config["MANSCPT"]["SV"] = ""             # ?
+config["MANSCPT"]["T1"] = "title"        # Titleline 
+config["MANSCPT"]["T2"] = "series"       # Collection Title
+config["MANSCPT"]["T4"] = "subtitle"     # Subtitle
+config["MANSCPT"]["T5"] = "titleaddon"   # titleaddon
+config["MANSCPT"]["TA"] = ""             # Translated Author
+config["MANSCPT"]["TI"] = "title"        # Title
+config["MANSCPT"]["TT"] = ""             # Translated Title
+config["MANSCPT"]["U6"] = ""             # like L1
+config["MANSCPT"]["UR"] = "url"          # URL
+config["MANSCPT"]["VL"] = ""             # Volume/Storage Container
+config["MANSCPT"]["Y2"] = "date"         # Date of last change
+config["MANSCPT"]["Y3"] = "urldate"      # Access Date
+
+config["MUSIC"]["A1"]   = "author"      # primary author
+config["MUSIC"]["A2"]   = "author"      # secondary author
+config["MUSIC"]["A2"]   = "editor"      # Editor
+config["MUSIC"]["A3"]   = ""            # Series Editor
+config["MUSIC"]["A4"]   = "producer"    # Producer (add.)
+config["MUSIC"]["AB"]   = "abstract"    # Abstract
+config["MUSIC"]["AD"]   = ""            # Author Address
+config["MUSIC"]["AN"]   = ""            # Accession Number
+config["MUSIC"]["AU"]   = "author"      # Composer
+config["MUSIC"]["C1"]   = "type"        # Format of Music
+config["MUSIC"]["C2"]   = "composition" # Form of Composition (add.)
+config["MUSIC"]["C3"]   = ""            # Music Parts
+config["MUSIC"]["C4"]   = "audience"    # Target Audience (add.)
+config["MUSIC"]["C5"]   = ""            # Accompanying Matter
+config["MUSIC"]["C7"]   = "eventtitle"  # Event Title
+config["MUSIC"]["CA"]   = "usera"       # Caption
+config["MUSIC"]["CN"]   = ""            # Call Number
+config["MUSIC"]["CY"]   = "location"    # Place Published
+config["MUSIC"]["DA"]   = "date"        # Date
+config["MUSIC"]["DB"]   = ""            # Name of Database
+config["MUSIC"]["DO"]   = "doi"         # DOI
+config["MUSIC"]["DP"]   = ""            # Database Provider
+config["MUSIC"]["ER"]   = ""            # End of Record
+config["MUSIC"]["ET"]   = "edition"     # Edition
+config["MUSIC"]["H1"]   = ""            # ?
+config["MUSIC"]["H2"]   = ""            # ?
+config["MUSIC"]["ID"]   = ""            # Reference ID
+config["MUSIC"]["KW"]   = "keywords"    # Keywords
+config["MUSIC"]["L1"]   = ""            # File Attachments
+config["MUSIC"]["L2"]   = ""            # ?
+config["MUSIC"]["L3"]   = ""            # ?
+config["MUSIC"]["L4"]   = ""            # Figure
+config["MUSIC"]["LA"]   = "language"    # Language
+config["MUSIC"]["LB"]   = "userb"       # Label
+config["MUSIC"]["M3"]   = ""            # Form of Item
+config["MUSIC"]["N1"]   = "note"        # Notes
+config["MUSIC"]["N2"]   = "abstract"    # like AB
+config["MUSIC"]["NV"]   = "volumes"     # Number of Volumes
+config["MUSIC"]["OP"]   = ""            # Original Publication
+config["MUSIC"]["PB"]   = "publisher"   # Publisher
+config["MUSIC"]["PY"]   = "year"        # Year
+config["MUSIC"]["RN"]   = ""            # Research Notes
+config["MUSIC"]["RP"]   = ""            # Reprint Edition
+config["MUSIC"]["SE"]   = ""            # Section
+config["MUSIC"]["SN"]   = "issn"        # ISSN
+config["MUSIC"]["SP"]   = "pages"       # Pages
+config["MUSIC"]["ST"]   = "shorttitle"  # Short Title
+config["MUSIC"]["SV"]   = ""            # ?
+config["MUSIC"]["T1"]   = "title"       # Title
+config["MUSIC"]["T2"]   = "album"       # Album Title (add.)
+config["MUSIC"]["T3"]   = "series"      # Series Title
+config["MUSIC"]["T4"]   = "subtitle"    # subtitle
+config["MUSIC"]["T5"]   = "titleaddon"  # titleaddon
+config["MUSIC"]["TA"]   = ""            # Translated Author
+config["MUSIC"]["TI"]   = "title"       # Title
+config["MUSIC"]["TT"]   = ""            # Translated Title
+config["MUSIC"]["U6"]   = ""            # like L1
+config["MUSIC"]["UR"]   = "url"         # URL
+config["MUSIC"]["VL"]   = "volume"      # Volume
+config["MUSIC"]["Y2"]   = "date"        # Date of last change
+config["MUSIC"]["Y3"]   = "urldate"     # Access Date
+
+config["NEWS"]["A1"]    = "author"       # primary author
+config["NEWS"]["A2"]    = "author"       # secondary author
+config["NEWS"]["A3"]    = "author"       # tertiary author
+config["NEWS"]["AB"]    = "abstract"     # Abstract
+config["NEWS"]["AD"]    = ""             # Author Address
+config["NEWS"]["AN"]    = ""             # Accession Number
+config["NEWS"]["AU"]    = "author"       # Reporter
+config["NEWS"]["C1"]    = "venue"        # Place Published
+config["NEWS"]["C2"]    = "number"       # Issue
+config["NEWS"]["C3"]    = ""             # Proceedings Title
+config["NEWS"]["C4"]    = "eventdate"    # Event Date
+config["NEWS"]["C5"]    = ""             # Packaging Method
+config["NEWS"]["C7"]    = "eventtitle"   # Event Title
+config["NEWS"]["CA"]    = ""             # Caption
+config["NEWS"]["CN"]    = ""             # Call Number
+config["NEWS"]["CY"]    = "location"     # City
+config["NEWS"]["DA"]    = "date"         # Date
+config["NEWS"]["DB"]    = ""             # Name of Database
+config["NEWS"]["DO"]    = "doi"          # DOI
+config["NEWS"]["DP"]    = ""             # Database Provider
+config["NEWS"]["EP"]    = "pages"        # End Page
+config["NEWS"]["ER"]    = ""             # End of Record
+config["NEWS"]["ET"]    = "edition"      # Edition
+config["NEWS"]["H1"]    = ""             # ?
+config["NEWS"]["H2"]    = ""             # ?
+config["NEWS"]["ID"]    = ""             # Reference ID
+config["NEWS"]["IS"]    = "number"       # Issue
+config["NEWS"]["JF"]    = "journaltitle" # journaltitle
+config["NEWS"]["KW"]    = "keywords"     # Keywords
+config["NEWS"]["L1"]    = ""             # Figure
+config["NEWS"]["L2"]    = ""             # ?
+config["NEWS"]["L3"]    = ""             # ?
+config["NEWS"]["L4"]    = ""             # File Attachments
+config["NEWS"]["LA"]    = "language"     # Language
+config["NEWS"]["M1"]    = "pages"        # Start Page
+config["NEWS"]["M3"]    = ""             # Type of Article
+config["NEWS"]["M4"]    = ""             # Citavi
+config["NEWS"]["N1"]    = "note"         # Notes
+config["NEWS"]["N2"]    = "abstract"     # like AB
+config["NEWS"]["NV"]    = ""             # Frequency
+config["NEWS"]["PB"]    = "publisher"    # Publisher
+config["NEWS"]["PY"]    = "year"         # Year
+config["NEWS"]["RI"]    = ""             # Reviewed Item
+config["NEWS"]["RN"]    = ""             # Research Notes
+config["NEWS"]["RP"]    = ""             # Reprint Edition
+config["NEWS"]["SE"]    = ""             # Section
+config["NEWS"]["SN"]    = "issn"         # ISSN
+config["NEWS"]["SP"]    = "pages"        # Start Page
+config["NEWS"]["ST"]    = "shorttitle"   # Short Title
+config["NEWS"]["SV"]    = ""             # ?
+config["NEWS"]["T1"]    = "title"        # Title
+config["NEWS"]["T2"]    = ""             # Newspaper
+config["NEWS"]["T4"]    = "subtitle"     # subtitle
+config["NEWS"]["T5"]    = "titleaddon"   # titleaddon
+config["NEWS"]["TA"]    = ""             # Translated Author
+config["NEWS"]["TI"]    = "title"        # Title
+config["NEWS"]["TT"]    = ""             # Translated Title
+config["NEWS"]["U6"]    = ""             # like L1
+config["NEWS"]["UR"]    = "url"          # URL
+config["NEWS"]["VL"]    = "volume"       # Volume
+config["NEWS"]["Y2"]    = "date"         # Date of last change
+config["NEWS"]["Y3"]    = "urldate"      # Access Date
+
+config["PCOMM"]["A1"]   = "author"       # primary author
+config["PCOMM"]["A2"]   = "author"       # secondary author / Recipient
+config["PCOMM"]["A3"]   = "author"       # tertiary author
+config["PCOMM"]["A4"]   = "author"       # Involved Person
+config["PCOMM"]["AB"]   = "abstract"     # Abstract
+config["PCOMM"]["AD"]   = ""             # Author Address
+config["PCOMM"]["AN"]   = ""             # Accession Number
+config["PCOMM"]["AU"]   = "author"       # Author
+config["PCOMM"]["C1"]   = ""             # Sender's EMail
+config["PCOMM"]["C1"]   = "venue"        # Place Published
+config["PCOMM"]["C2"]   = ""             # Recieipients EMail
+config["PCOMM"]["C3"]   = ""             # Proceedings Title
+config["PCOMM"]["C4"]   = "eventdate"    # Event Date
+config["PCOMM"]["C5"]   = ""             # Packaging Method
+config["PCOMM"]["C7"]   = "eventtitle"   # Event Title
+config["PCOMM"]["CA"]   = ""             # Caption
+config["PCOMM"]["CN"]   = ""             # Call Number
+config["PCOMM"]["CY"]   = "location"     # City
+config["PCOMM"]["DA"]   = "date"         # Date
+config["PCOMM"]["DA"]   = ""             # Date
+config["PCOMM"]["DB"]   = ""             # Name of Database
+config["PCOMM"]["DO"]   = "doi"          # DOI
+config["PCOMM"]["DP"]   = ""             # Database Provider
+config["PCOMM"]["ED"]   = "editor"       # Editor
+config["PCOMM"]["ER"]   = ""             # End of Record
+config["PCOMM"]["ET"]   = "edition"      # Edition
+config["PCOMM"]["H1"]   = ""             # ?
+config["PCOMM"]["H2"]   = ""             # ?
+config["PCOMM"]["ID"]   = ""             # Reference ID
+config["PCOMM"]["IN"]   = "organization" # Institution
+config["PCOMM"]["IS"]   = "issue"        # Reihennummer
+config["PCOMM"]["J2"]   = ""             # Abbreviation
+config["PCOMM"]["KW"]   = "keywords"     # Keywords
+config["PCOMM"]["L1"]   = ""             # File Attachments
+config["PCOMM"]["L2"]   = ""             # ?
+config["PCOMM"]["L3"]   = ""             # ?
+config["PCOMM"]["L4"]   = ""             # Figure
+config["PCOMM"]["LA"]   = "language"     # Language
+config["PCOMM"]["LB"]   = ""             # Label
+config["PCOMM"]["M1"]   = ""             # Folio Number
+config["PCOMM"]["M3"]   = "type"         # Type
+config["PCOMM"]["M4"]   = ""             # Citavi
+config["PCOMM"]["N1"]   = "note"         # Notes
+config["PCOMM"]["N2"]   = "abstract"     # like AB
+config["PCOMM"]["NV"]   = ""             # Communication Number
+config["PCOMM"]["PB"]   = "publisher"    # Publisher
+config["PCOMM"]["PY"]   = "year"         # Year
+config["PCOMM"]["RN"]   = ""             # Research Notes
+config["PCOMM"]["SP"]   = "pagetotal"    # Pages
+config["PCOMM"]["ST"]   = "shorttitle"   # Short Title
+config["PCOMM"]["SV"]   = ""             # ?
+config["PCOMM"]["T1"]   = "title"        # Title
+config["PCOMM"]["T2"]   = "series"       # Reihentitel
+config["PCOMM"]["T4"]   = "subtitle"     # Subtitle
+config["PCOMM"]["TA"]   = ""             # Translated Author
+config["PCOMM"]["TI"]   = "title"        # Title
+config["PCOMM"]["TS"]   = ""             # Title source
+config["PCOMM"]["TT"]   = ""             # Translated Title
+config["PCOMM"]["U3"]   = "note"         # Note
+config["PCOMM"]["U6"]   = ""             # like L1
+config["PCOMM"]["UR"]   = "url"          # URL
+config["PCOMM"]["Y2"]   = "date"         # Date of last change
+config["PCOMM"]["Y3"]   = "urldate"      # Access Date
+
+config["THES"]["A1"]    = "author"      # primary author
+config["THES"]["A2"]    = "author"      # secondary author
+config["THES"]["A3"]    = "author"      # tertiary author / Advisor
+config["THES"]["A4"]    = ""            # Subsidiary Author / Translator
+config["THES"]["AB"]    = "abstract"    # Abstract
+config["THES"]["AD"]    = ""            # Author Address
+config["THES"]["AN"]    = ""            # Accession Number
+config["THES"]["AU"]    = "author"      # Author
+config["THES"]["C1"]    = "venue"       # Place Published
+config["THES"]["C2"]    = ""            # Year Published
+config["THES"]["C3"]    = ""            # Proceedings Title
+config["THES"]["C4"]    = "eventdate"   # Event Date
+config["THES"]["C5"]    = ""            # Packaging Method
+config["THES"]["C7"]    = "eventtitle"  # Event Title
+config["THES"]["CA"]    = ""            # Caption
+config["THES"]["CN"]    = ""            # Call Number
+config["THES"]["CY"]    = "location"    # City
+config["THES"]["DA"]    = "date"        # Date
+config["THES"]["DB"]    = ""            # Name of Database
+config["THES"]["DO"]    = "doi"         # DOI
+config["THES"]["DP"]    = ""            # Database Provider
+config["THES"]["ER"]    = ""            # End of Record
+config["THES"]["ET"]    = "edition"     # Edition
+config["THES"]["H1"]    = ""            # ?
+config["THES"]["H2"]    = ""            # ?
+config["THES"]["ID"]    = ""            # Reference ID
+config["THES"]["IS"]    = "issue"       # Reihennummer
+config["THES"]["KW"]    = "keywords"    # Keywords
+config["THES"]["L1"]    = ""            # File Attachments
+config["THES"]["L2"]    = ""            # ?
+config["THES"]["L3"]    = ""            # ?
+config["THES"]["L4"]    = ""            # Figure
+config["THES"]["LA"]    = "language"    # Language
+config["THES"]["LB"]    = ""            # Label
+config["THES"]["M1"]    = ""            # Document Number
+config["THES"]["M3"]    = "type"        # Thesis Type
+config["THES"]["M4"]    = ""            # Citavi
+config["THES"]["N1"]    = "note"        # Notes
+config["THES"]["N2"]    = "abstract"    # like AB
+config["THES"]["PB"]    = "institution" # University
+config["THES"]["PY"]    = "year"        # Year
+config["THES"]["RN"]    = ""            # Research Notes
+config["THES"]["SP"]    = "pagetotal"   # Number of Pages
+config["THES"]["ST"]    = "shorttitle"  # Short Title
+config["THES"]["SV"]    = ""            # ?
+config["THES"]["T1"]    = "title"       # Title
+config["THES"]["T2"]    = "subtitle"    # Subtitle
+config["THES"]["T2"]    = ""            # Academic Department
+config["THES"]["T3"]    = "series"      # Reihentitel
+config["THES"]["T4"]    = "subtitle"    # subtitle ?
+config["THES"]["T5"]    = "titleaddon"  # titleaddon
+config["THES"]["TA"]    = ""            # Translated Author
+config["THES"]["TI"]    = "title"       # Title
+config["THES"]["TS"]    = ""            # Title source
+config["THES"]["TT"]    = ""            # Translated Title
+config["THES"]["U2"]    = "note"        # Note
+config["THES"]["U6"]    = ""            # like L1
+config["THES"]["UR"]    = "url"         # URL
+config["THES"]["VL"]    = ""            # Degree
+config["THES"]["Y2"]    = "date"        # Date of last change
+config["THES"]["Y3"]    = "urldate"     # Access Date
+
+config["UNPB"]["A1"]    = "author"       # primary author
+config["UNPB"]["A2"]    = "editor"       # Series Editor
+config["UNPB"]["A3"]    = "author"       # tertiary author
+config["UNPB"]["A4"]    = ""             # Subsidiary Author / Translator
+config["UNPB"]["AB"]    = "abstract"     # Abstract
+config["UNPB"]["AD"]    = ""             # Author Address
+config["UNPB"]["AU"]    = "author"       # Author
+config["UNPB"]["C1"]    = "venue"        # Place Published
+config["UNPB"]["C2"]    = ""             # Year Published
+config["UNPB"]["C3"]    = ""             # Proceedings Title
+config["UNPB"]["C4"]    = "eventdate"    # Event Date
+config["UNPB"]["C5"]    = ""             # Packaging Method
+config["UNPB"]["C7"]    = "eventtitle"   # Event Title
+config["UNPB"]["CA"]    = ""             # Caption
+config["UNPB"]["CY"]    = "location"     # City
+config["UNPB"]["DA"]    = "date"         # Date
+config["UNPB"]["DB"]    = ""             # Name of Database
+config["UNPB"]["DO"]    = "doi"          # DOI
+config["UNPB"]["DP"]    = ""             # Database Provider
+config["UNPB"]["ED"]    = "editor"       # Editor
+config["UNPB"]["ER"]    = ""             # End of Record
+config["UNPB"]["ET"]    = "version"      # Edition
+config["UNPB"]["H1"]    = ""             # ?
+config["UNPB"]["H2"]    = ""             # ?
+config["UNPB"]["ID"]    = ""             # Reference ID
+config["UNPB"]["J2"]    = ""             # Abbreviation
+config["UNPB"]["KW"]    = "keywords"     # Keywords
+config["UNPB"]["L1"]    = ""             # File Attachments
+config["UNPB"]["L2"]    = ""             # ?
+config["UNPB"]["L3"]    = ""             # ?
+config["UNPB"]["L4"]    = ""             # Figure
+config["UNPB"]["LA"]    = "language"     # Language
+config["UNPB"]["LB"]    = ""             # Label
+config["UNPB"]["M1"]    = "number"       # Number
+config["UNPB"]["M3"]    = "type"         # Type of Work
+config["UNPB"]["M4"]    = ""             # Citavi
+config["UNPB"]["N1"]    = "note"         # Notes
+config["UNPB"]["N2"]    = "abstract"     # like AB
+config["UNPB"]["PB"]    = "organization" # Institution
+config["UNPB"]["PY"]    = "year"         # Year
+config["UNPB"]["RN"]    = ""             # Research Notes
+config["UNPB"]["SN"]    = ""             # Reihennummer
+config["UNPB"]["SN"]    = "isbn"         # IDBN/ISSN
+config["UNPB"]["SP"]    = "pagetotal"    # Pages
+config["UNPB"]["ST"]    = "shorttitle"   # Short Title
+config["UNPB"]["SV"]    = ""             # ?
+config["UNPB"]["T1"]    = "title"        # Title
+config["UNPB"]["T2"]    = "series"       # Series Title
+config["UNPB"]["T3"]    = ""             # Department
+config["UNPB"]["T4"]    = "subtitle"     # subtitle
+config["UNPB"]["T5"]    = "titleaddon"   # titleaddon
+config["UNPB"]["TA"]    = ""             # Translated Author
+config["UNPB"]["TI"]    = "title"        # Title of Work
+config["UNPB"]["TT"]    = ""             # Translated Title
+config["UNPB"]["U3"]    = "note"         # Note
+config["UNPB"]["U6"]    = ""             # like L1
+config["UNPB"]["UR"]    = "url"          # URL
+config["UNPB"]["Y1"]    = "year"         # Year
+config["UNPB"]["Y2"]    = "date"         # Date of last change
+config["UNPB"]["Y3"]    = "urldate"      # Access Date
+
+# -------------------------------------------------------------
+# Some declarations and initializations
+
+allrecordkeys = []                            # container for all record keys (see also Converter)
+usedkeys      = set()                         # all keys in use (generated or already present)
+fieldwidth    = 13                            # width of the BibTeX keys
+newline       = "\n" + (fieldwidth + 2) * " " #
+verbose       = False                         # Flag: verbose output
+bibtexkeys    = False                         # Flag: show the generated BibTeX keys
+makeindex     = False                         # Flag: build the index file (--index)
+extractedkeys = []                            # keys taken from the index (--extract, --sample)
+mmapped       = False                         # Flag: memory-mapped input, record by record
+profiletop    = 25                            # number of lines in the memory profile (--profile)
+progressinterval = 1.0                        # seconds between two progress reports (--progress)
+checkpointinterval = 60.0                     # seconds between two checkpoints (--resume without --checkpoint)
+actDate       = time.strftime("%Y-%m-%d")     # actual date of program execution
+actTime       = time.strftime("%X")           # actual time of program execution
+call          = sys.argv                      # parameter of the program call
+
+arguments = " "
+for f in range(1,len(call)):
+    arguments = arguments + call[f] + " "
+
+# -------------------------------------------------------------
+# Defaults
+
+out_file        = ""                                 # actual name for output file
+out_default     = "out-test.bib"                     # default name for output file
+in_file         = ""                                 # actual name for input file
+in_default      = ""                                 # default name for input file
+correction_file = ""                                 # actual name for correction file
+correction_default = ""                              # default name for correction file
+skip_default    = "[]"                               # default for -s 
+fields_default  = ""                                 # default for --fields (all fields)
+where_default   = ""                                 # default for --where (all records)
+sortby_default  = ""                                 # default for --sort-by (input order)
+sortmem_default = 64                                 # default for --sort-memory (MB)
+sortfanin       = 64                                 # sorted runs merged at once (open files)
+extract_default = ""                                 # default for --extract (all records)
+append_default  = ""                                 # default for --append-to (no appending)
+encoding_default = ""                                # default for --encoding (guessed)
+latex_default   = ""                                 # default for --latex (values verbatim)
+sample_default  = 0                                  # default for --sample (no sample)
+seed_default    = None                               # default for --seed (random)
+profile_default = ""                                 # default for --profile (no profile)
+slow_default    = 0                                  # default for --slow-records (no log)
+pipeline_default = 0                                 # default for --pipeline (sequential)
+shardby_default = ""                                 # default for --shard-by (one .bib file)
+progress_default = ""                                # default for --progress (no report)
+crossref_default = False                             # default for --crossref (no parent entries)
+check_default   = False                              # default for --check (conversion)
+diff_default    = ""                                 # default for --diff (all records)
+fulltext_default = False                             # default for --fulltext (no full-text index)
+search_default  = ""                                 # default for --search (conversion)
+checkpoint_default = 0                               # default for --checkpoint (no checkpoints)
+resume_default  = False                              # default for --resume (conversion from the beginning)
+
+# -------------------------------------------------------------
+# Texts for argparse
+
+in_text         = "name for input file"              # 
+out_text        = "name for output file"             #
+correction_text = "name for a file with additional conversion rules"    
+verbose_text    = "Flag: verbose output"             #
+bibtex_text     = "Flag: show the generated BibTeX keys" #
+author_text     = "author of the program"            #
+version_text    = "version of the program"           #
+program_text    = "converts RIS files to .bib files" #
+skip_text       = "skip BibTeX fields"               # 
+mmap_text       = "Flag: memory-mapped input; only the lines of the selected records and written fields are decoded"
+encoding_text   = "encoding of the input file, e.g. cp1252, utf-16; Default: guessed"
+latex_text      = ("escape LaTeX special characters (special) and non-ASCII characters (ascii); " +
+                   "after the built-in transformers, before those of addtransformer (-c)")
+fields_text     = "write only these BibTeX fields, e.g. title,author,year,doi"
+where_text      = "select records, e.g. \"type=JOUR year>=2015 keyword=LaTeX has=doi\""
+sortby_text     = "sort the BibTeX records by key|author,year|type (also title)"
+sortmem_text    = "memory (MB, at least 1) for a sorted run before it is written to a temporary file"
+index_text      = "Flag: write the index file <in_file>.idx and stop"
+append_text     = "append only new records to this existing .bib file (instead of -o)"
+extract_text    = "convert only these records (numbers, ranges, keys), e.g. 1-10,42,Knuth.1984a"
+sample_text     = "convert only a random sample of n records"
+seed_text       = "seed for --sample"
+profile_text    = "write a CPU profile (<out_file>.prof, pstats) and/or the top memory allocations (<out_file>.mem)"
+slow_text       = "list the records whose processing takes longer than this number of milliseconds"
+pipeline_text   = "read and write in own threads; number of 64 KB blocks in the queues (0: sequential)"
+shardby_text    = "write several .bib files <out_file>-<shard>.bib and a manifest, split by size=50MB|type|year"
+progress_text   = "report bytes, records/s and ETA on stderr or (with a file name) in a status file"
+crossref_text   = "Flag: one @book/@proceedings entry for chapters and papers of the same book; crossref in the children"
+check_text      = "Flag: only check the structure of the input file; exit code 1 if there are problems"
+diff_text       = "convert only the records added or changed since this older RIS file (old keys kept; removed keys in <out_file>.removed)"
+fulltext_text   = "Flag: write a full-text index <out_file>.fts of titles, abstracts, keywords and authors"
+search_text     = "show the keys of the records matching this query in the full-text index <in_file>.fts, e.g. \"title:tikz AND font*\""
+checkpoint_text = "write a checkpoint <out_file>.checkpoint every n seconds (implies -m; 0: no checkpoints)"
+resume_text     = "Flag: continue an interrupted conversion from <out_file>.checkpoint"
+
+# -------------------------------------------------------------
+# Regular expressions
+
+p1 = re.compile("^[A-Z][A-Z0-9]$")                   # regular expression: RIS keys
+p2 = re.compile("^[A-Z]+")                           # regular expression: RIS types
+p3 = re.compile("^@[a-z]+")                          # regular expression: BibTeX types
+p4 = re.compile("  -")                               # separator between RIS key and content
+p5 = re.compile("[;,]")                              # 
+p6 = re.compile("[a-z0-9]+")                         # regular expression: BibTeX field names
+p7 = re.compile("^([a-z]+)(>=|<=|!=|=|>|<)(.+)$")   # regular expression: condition in --where
+p8 = re.compile("[0-9]{4}")                          # regular expression: year
+p9 = re.compile(rb"\r\n|\r|\n")                       # line ends (universal newlines) in bytes
+p11 = re.compile(r"^\s*@(\w+)\s*\{\s*([^,\s=]+)\s*,")  # regular expression: "@type{key," in a .bib file
+p12 = re.compile(r"^\s*(\w+)\s*=\s*\{(.*)\},?\s*$")  # regular expression: "field = {value}," in a .bib file
+p13 = re.compile("[^a-z0-9]+")                       # regular expression: not letter/digit
+p10 = re.compile(rb"[ \t\x0b\x0c]*([A-Z][A-Z0-9])(?:  -|[ \t\x0b\x0c]*$)")  # RIS key at the start of a byte line
+p14 = re.compile("^size=([0-9]+)(B|KB|MB|GB)?$", re.IGNORECASE)  # regular expression: size in --shard-by
+p15 = re.compile("(?<=[0-9])\\s*[-–]\\s*(?=[0-9])")        # regular expression: single dash in a page range
+p16 = re.compile("^(?:https?://(?:dx\\.)?doi\\.org/|doi:\\s*)", re.IGNORECASE)  # regular expression: DOI prefix
+p17 = re.compile("^([0-9]{4})(?:[/.-]([0-9]{1,2})?(?:[/.-]([0-9]{1,2})?(?:/.*)?)?)?$")  # regular expression: RIS date (YYYY/MM/DD/other info)
+p18 = re.compile(rb"\n[ \t\x0b\x0c]*([A-Z][A-Z0-9])(?=  -|[ \t\x0b\x0c]*(?:\r|\n|$))")  # RIS key after '\n', '\r\n' (--check)
+p19 = re.compile(rb"TY(?:  -([^\r\n]*))?")              # content of 'TY  -' (--check)
+p20 = re.compile("^(?:jr|sr|[ivx]+|[0-9]+(?:st|nd|rd|th))\\.?$", re.IGNORECASE)  # regular expression: suffix of a name
+p21 = re.compile(rb"\r(?!\n)[ \t\x0b\x0c]*([A-Z][A-Z0-9])(?=  -|[ \t\x0b\x0c]*(?:\r|\n|$))")  # RIS key after a single '\r' (--check)
+p22 = re.compile(rb"\n[ \t\x0b\x0c]*(?:(TY|ER)(?=  -|[ \t\x0b\x0c]*(?:\r|\n|$))|"
+                 rb"[\x1c-\x1f\x80-\xff][\t\x0b\x0c \x1c-\x1f\x80-\xff]*[A-Z][A-Z0-9](?=  -|[\t\x0b\x0c \x1c-\x1f\x80-\xff]*(?:\r|\n|$))|"
+                 rb"[A-Z][A-Z0-9](?=[\t\x0b\x0c \x1c-\x1f\x80-\xff]*(?:\r|\n|$)))")  # 'TY  -', 'ER  -' after '\n', '\r\n'; no group: RIS key after non-ASCII blanks or without '  -' (-m)
+p23 = re.compile(rb"\r(?!\n)[ \t\x0b\x0c]*(?:(TY|ER)(?=  -|[ \t\x0b\x0c]*(?:\r|\n|$))|"
+                 rb"[\x1c-\x1f\x80-\xff][\t\x0b\x0c \x1c-\x1f\x80-\xff]*[A-Z][A-Z0-9](?=  -|[\t\x0b\x0c \x1c-\x1f\x80-\xff]*(?:\r|\n|$))|"
+                 rb"[A-Z][A-Z0-9](?=[\t\x0b\x0c \x1c-\x1f\x80-\xff]*(?:\r|\n|$)))")  # the same after a single '\r' (-m)
+
+# -------------------------------------------------------------
+# Some functions
+
+# o    : the content of a record
+# used : keys in use; keys: generated keys (see Converter); None: module-wide
+
+def recordkey(o, used=None, keys=None):
+    if used is None:
+        used = usedkeys
+    if keys is None:
+        keys = allrecordkeys
+
+    if ("author" in o) and o["author"] != "":       # author name
+        tmp1 = o["author"]
+    elif ("editor" in o) and o["editor"] != "":
+        tmp1 = o["editor"]
+    elif ("organization" in o) and o["organization"] != "":
+        tmp1 = o["organization"]
+    else:
+        tmp1 = "N. N."
+    tmp1a = parsename(tmp1.split(";")[0]).stem      # first name; mapped to ASCII
+        
+    if ("year" in o) and o["year"] != "":           # year
+        tmp2  = o["year"]
+        tmp2a = p5.split(tmp2)[0]
+    else:
+        tmp2a = ""
+    tmp2a = re.sub("[' ]", "", tmp2a)               # delete some characters
+
+    nr     = 0                                 
+    tmpkey = tmp1a + "." + tmp2a + chr(97 + nr)
+    while tmpkey in used:                           # loop over potential keys
+        nr     = nr + 1
+        tmpkey = tmp1a + "." + tmp2a + chr(97 + nr)
+    keys.append((tmp1a, tmp2a, chr(97 + nr)))       # container for all record keys
+    used.add(tmpkey)                                # all keys in use (also --append-to)
+    return tmpkey
+
+# -------------------------------------------------------------
+# Author and editor names
+#
+# a name is parsed once into family, given, prefix (von, de, van, ...)
+# and suffix (Jr., III, ...); the parsed names are kept in namecache
+#
+#   von Last, First        von Last, First, Jr        First von Last
+#
+# (RIS order of AU, A1 - A4, ED; Jr: Jr., Sr., II, 3rd, ..., see p20);
+# formatname writes the BibLaTeX order von Last, Jr, First
+#
+# stem: the key stem of recordkey (part before the first comma, without
+# blanks and apostrophes, mapped to ASCII)
+
+Name       = namedtuple("Name", ["family", "given", "prefix", "suffix", "stem", "comma"])
+namefields = {"author", "editor"}                   # fields with lists of names
+namecache  = {}                                     # raw name ---> Name
+namecachesize = 100000                              # maximal number of cached names
+
+def toascii(text):                                  # unidecode is loaded with the first non-ASCII text
+    if text.isascii():
+        return text
+    from unidecode import unidecode
+    return unidecode(text)
+
+def parsename(raw):
+    name = namecache.get(raw)
+    if name is not None:
+        return name
+    stem  = toascii(re.sub("[' ]", "", raw.split(",")[0]))
+    parts = [" ".join(part.split()) for part in raw.split(",")]
+    words = parts[0].split()
+    if len(parts) == 1:                             # First von Last
+        lower = [i for i in range(len(words) - 1) if words[i][:1].islower()]
+        if lower != []:                             # von part: 1st to last lower case word
+            given, prefix, family = (words[:lower[0]], words[lower[0]:lower[-1] + 1],
+                                     words[lower[-1] + 1:])
+        else:
+            given, prefix, family = words[:-1], [], words[-1:]
+        name = Name(" ".join(family), " ".join(given), " ".join(prefix), "", stem, False)
+    else:                                           # von Last, First[, Jr]
+        nr = 0
+        while nr < len(words) - 1 and words[nr][:1].islower():
+            nr = nr + 1
+        if len(parts) > 2 and all(p20.match(part) for part in parts[2:]):
+            given, suffix = parts[1], " ".join(parts[2:])
+        else:                                       # no suffix, e.g. names of institutions
+            given, suffix = ", ".join(parts[1:]), ""
+        name   = Name(" ".join(words[nr:]), given, " ".join(words[:nr]), suffix, stem, True)
+    if len(namecache) >= namecachesize:
+        namecache.clear()
+    namecache[raw] = name
+    return name
+
+def parsenames(value):
+    return [parsename(raw.strip()) for raw in value.split(";")]
+
+def formatname(name):                               # BibLaTeX form of a name: von Last, Jr, First
+    if not name.comma:                              # without comma: as given
+        return " ".join([w for w in [name.given, name.prefix, name.family] if w != ""])
+    tmp = (name.prefix + " " + name.family).strip()
+    if name.suffix != "":
+        tmp = tmp + ", " + name.suffix
+    if name.given != "" or name.suffix != "":
+        tmp = tmp + ", " + name.given
+    return tmp
+
+# -------------------------------------------------------------
+# Value pool for records kept in memory
+#
+# values which repeat in many records (names, publisher, location,
+# language, journal titles, keywords, ...) are stored only once: an equal
+# value already in the pool replaces the value of the record; field names
+# are interned
+#
+# the string heap of RecordStore shares the values of the same fields
+# (see pooled); the sorted runs of --sort-by hold rendered text, not
+# records
+#
+# usage: state = newstate(pool={}); records = list(parselines(lines, state))
+
+poolfields = {"author", "editor", "publisher", "location", "language", "journaltitle",
+              "booktitle", "series", "keywords", "organization", "institution", "school",
+              "type", "edition", "year", "date", "urldate", "volume", "number", "note",
+              "venue", "eventtitle", "howpublished"}
+poollimit  = 200                                    # longer values are not pooled
+
+def pooled(f, value):                               # value shared? (value pool, RecordStore)
+    return f in poolfields and len(value) <= poollimit
+
+def poolvalue(pool, f, value):
+    if pooled(f, value):
+        return pool.setdefault(value, value)
+    return value
+
+def poolrecord(pool, o):
+    for f in list(o):
+        value = o.pop(f)
+        o[sys.intern(f)] = poolvalue(pool, f, value)    # (the order of the fields is kept)
+    return o
+
+# -------------------------------------------------------------
+# Field sets (-s, --fields) and record conditions (--where)
+#
+# a field set is given as ["note","abstract"], note,abstract or "note abstract";
+# a condition is <name><op><value>, several conditions are separated by blanks
+#
+#   type=JOUR, type=article   RIS type or BibLaTeX type (also with !=)
+#   year>=2015                first year in the field year (=, !=, <, <=, >, >=)
+#   keyword=LaTeX             one of the keywords (also with !=)
+#   has=doi                   field is present and not empty (also with !=)
+
+keyfields = {"author", "editor", "organization", "year"}     # needed by recordkey
+
+def fieldset(text):
+    return set(p6.findall(text.lower()))
+
+def compilewhere(text):
+    typeconds   = []                                 # evaluated at 'TY  -'
+    recordconds = []                                 # evaluated at 'ER  -'
+    for cond in text.split():
+        m = p7.match(cond)
+        if m is None:
+            raise ValueError("condition '" + cond + "' not understood")
+        name, op, value = m.groups()
+        if name == "type":
+            if op not in ["=", "!="]:
+                raise ValueError("operator '" + op + "' not allowed in '" + cond + "'")
+            typeconds.append((op, value.upper(), "@" + value.lstrip("@").lower()))
+        elif name == "year":
+            if not value.isdigit():
+                raise ValueError("year expected in '" + cond + "'")
+            recordconds.append((name, op, int(value)))
+        elif name in ["keyword", "has"]:
+            if op not in ["=", "!="]:
+                raise ValueError("operator '" + op + "' not allowed in '" + cond + "'")
+            recordconds.append((name, op, value.lower()))
+        else:
+            raise ValueError("unknown name '" + name + "' in '" + cond + "'")
+    return (typeconds, recordconds)
+
+def matchtype(typeconds, ristype, bibtype):
+    for (op, ris, bib) in typeconds:
+        if (ris == ristype or bib == bibtype) != (op == "="):
+            return False
+    return True
+
+def matchrecord(recordconds, o):
+    for (name, op, value) in recordconds:
+        if name == "year":
+            m = p8.search(o.get("year", ""))
+            if m is None:
+                return False
+            year = int(m.group())
+            if not {"=" : year == value,  "!=": year != value,
+                    "<" : year <  value,  "<=": year <= value,
+                    ">" : year >  value,  ">=": year >= value}[op]:
+                return False
+        elif name == "keyword":
+            found = value in [k.strip().lower() for k in o.get("keywords", "").split(";")]
+            if found != (op == "="):
+                return False
+        elif name == "has":
+            if (o.get(value, "") != "") != (op == "="):
+                return False
+    return True
+
+# -------------------------------------------------------------
+# Hooks for timers, counters, ... (see also --profile, --slow-records)
+#
+# on_line          (state, line)            : an input line is parsed
+# on_record_start  (state, ristype)         : a record starts with 'TY  -' (selected or not)
+# on_record_parsed (state, bibtype, record) : a record is completed by 'ER  -'
+# on_key           (key, record)            : a BibTeX key is generated (or taken from the index)
+# on_record_written(key, text)              : a BibTeX record is written (--sort-by: rendered)
+#
+# usage: addhook("on_record_written", lambda key, text: counts.update([key]))
+#
+# registry: hooks of a converter (see Converter); None: module-wide hooks
+
+hooks = {"on_line": [], "on_record_start": [], "on_record_parsed": [], "on_key": [], "on_record_written": []}
+
+def addhook(name, func, registry=None):
+    (hooks if registry is None else registry)[name].append(func)   # KeyError: unknown hook
+
+def callhooks(name, *args, registry=None):
+    for func in (hooks if registry is None else registry)[name]:
+        func(*args)
+
+# -------------------------------------------------------------
+# Records whose processing (parsing, key, rendering, writing) takes
+# longer than threshold seconds; the time between two records is
+# counted for the following one
+
+class SlowLog:
+    def __init__(self, threshold, registry=None):
+        self.threshold = threshold
+        self.start     = None                       # start of the actual record
+        self.line      = 0                          # line number of 'TY  -'
+        self.slow      = []                         # (line, key, seconds)
+        addhook("on_line", self.online, registry)
+        addhook("on_record_parsed", self.parsed, registry)
+        addhook("on_record_written", self.written, registry)
+
+    def online(self, state, line):
+        if self.start is None:
+            self.start = time.perf_counter()
+
+    def parsed(self, state, bibtype, o):
+        self.line = state.get("recordline", 0)
+
+    def written(self, key, text):
+        if self.start is None:
+            return
+        seconds    = time.perf_counter() - self.start
+        self.start = None
+        if seconds > self.threshold:
+            self.slow.append((self.line, key, seconds))
+
+# -------------------------------------------------------------
+# Progress report (--progress): bytes processed, records/s and ETA,
+# at most every progressinterval seconds; the clock is read only every
+# 64 input records (selected or not, so that --where does not stop it)
+#
+# total   : size of the input (bytes); 0: unknown
+# position: function ---> bytes processed
+# target  : "-": stderr; else name of a status file (rewritten each time)
+# registry: hooks of a converter (see Converter); None: module-wide hooks
+
+class Progress:
+    def __init__(self, total, position, target="-", interval=progressinterval, registry=None):
+        self.total    = total
+        self.position = position
+        self.target   = target
+        self.interval = interval
+        self.records  = 0                           # records parsed
+        self.seen     = 0                           # records read ('TY  -')
+        self.start    = self.last = time.perf_counter()
+        addhook("on_record_start", self.started, registry)
+        addhook("on_record_parsed", self.parsed, registry)
+
+    def parsed(self, state, bibtype, o):
+        self.records = self.records + 1
+
+    def started(self, state, ristype):
+        self.seen = self.seen + 1
+        if self.seen % 64 == 0:
+            now = time.perf_counter()
+            if now - self.last >= self.interval:
+                self.last = now
+                self.report("running")
+
+    def report(self, status):
+        elapsed = time.perf_counter() - self.start
+        done    = self.total if status == "finished" else min(self.position(), self.total)
+        rate    = self.records / elapsed if elapsed > 0 else 0.0
+        if status == "finished":
+            eta = "0 s"
+        elif done > 0 and self.total > 0:
+            eta = "%.0f s" % (elapsed * (self.total - done) / done)
+        else:
+            eta = "unknown"
+        if self.target == "-":
+            text = ("" if self.total == 0 else
+                    "%.1f of %.1f MB (%.0f %%); " % (done / 1024 / 1024, self.total / 1024 / 1024,
+                                                    100 * done / self.total))
+            text = "--- " + text + "%d records; %.0f records/s; ETA %s" % (self.records, rate, eta)
+            end = "\n" if status == "finished" or not sys.stderr.isatty() else ""
+            sys.stderr.write("\r" + text + end if sys.stderr.isatty() else text + end)
+            sys.stderr.flush()
+        else:
+            with open(self.target + ".tmp", encoding="utf-8", mode="w") as f:
+                f.write("status   : " + status + "\n" +
+                        "bytes    : " + str(done) + "\n" +
+                        "total    : " + str(self.total) + "\n" +
+                        "records  : " + str(self.records) + "\n" +
+                        "records/s: " + "%.0f" % rate + "\n" +
+                        "elapsed  : " + "%.0f s" % elapsed + "\n" +
+                        "ETA      : " + eta + "\n")
+            os.replace(self.target + ".tmp", self.target)    # readers never see a half file
+
+# -------------------------------------------------------------
+# Parser state and parsing of one input line
+#
+# state    : dictionary with the parser state (see newstate)
+# line     : a input line
+# result   : None               (line absorbed into the actual record)
+#            string             (line outside of a record, stripped)
+#            (bibtype, record)  (record completed by 'ER  -')
+
+# skip     : BibTeX fields to be skipped (set)
+# fields   : BibTeX fields to be written (set); None: all fields
+# where    : conditions for records (see compilewhere)
+# pool     : value pool for records kept in memory (see poolrecord); None: no pool
+# table    : compiled conversion table (see compileentry); None: compiled from config
+# registry : hooks (see addhook); None: module-wide hooks
+# counts   : counter of the decoding errors (see decodefallback); None: module-wide
+
+def newstate(skip=(), fields=None, where="", pool=None, table=None, registry=None, counts=None):
+    if table is None:
+        table = config.compile()
+    typeconds, recordconds = compilewhere(where)
+    needed = set(keyfields)                         # fields needed for keys and conditions
+    for (name, op, value) in recordconds:
+        needed.add({"year": "year", "keyword": "keywords"}.get(name, value))
+    return {"linenr"     : 0,                       # line number in source file
+            "status"     : "out of record",         # in record / in note / in abstract / out of record /
+                                                    # skip record / out of selection
+            "ristype"    : "",                      # actual RIS type
+            "bibtype"    : table["GEN"].bibtype,    # actual BibTeX type
+            "bibfield"   : "",                      # actual BibTeX field
+            "onerecord"  : {},                      # the content of a record
+            "include"    : None if fields is None else set(fields) | needed,  # fields to be built
+            "exclude"    : set(skip) - needed,      # fields not to be built
+            "linetable"  : {},                      # dispatch table of the RIS type (parseline)
+            "typeconds"  : typeconds,               # conditions evaluated at 'TY  -'
+            "recordconds": recordconds,             # conditions evaluated at 'ER  -'
+            "condscan"   : {},                      # -m: (RIS type, lonecr) ---> scan of the condition fields
+            "scankeep"   : {},                      # -m: (RIS type, lonecr) ---> scan of the written fields
+            "lonecr"     : False,                   # -m: line ends '\r' in the buffer
+            "pool"       : pool,                    # value pool (or None)
+            "table"      : table,                   # compiled conversion table (read-only)
+            "hooks"      : hooks if registry is None else registry,
+            "counts"     : decodefallbacks if counts is None else counts}   # bytes read by the error handler
+
+def wanted(state, bibfield):
+    return ((state["include"] is None or bibfield in state["include"]) and
+            bibfield not in state["exclude"])
+
+# -------------------------------------------------------------
+# Entry of a compiled conversion table: BibTeX type, a read-only copy of
+# the layer and the dispatch table RIS key ---> (handler, BibTeX field)
+# of parseline and scanrecord (never changed after the compilation);
+# 'TY  -' is handled by parseline, unknown RIS keys by lineunknown
+
+def compileentry(layer):
+    linetable = {}
+    for (riskey, bibfield) in layer.items():
+        if riskey in ["TY", "ER"]:
+            continue
+        elif riskey in ["N1", "AB", "N2"]:              # continued by the following lines
+            linetable[riskey] = (linenote, bibfield)
+        elif bibfield == "":                            # collected in 'note'
+            linetable[riskey] = (lineempty, bibfield)
+        else:
+            linetable[riskey] = (linefield, bibfield)
+    linetable["ER"] = (lineend, "")
+    return TableEntry(layer["TY"], MappingProxyType(dict(layer)), linetable)
+
+# -------------------------------------------------------------
+# Handlers for the lines of parseline with a RIS key
+#
+# handler(state, bibfield, riskey, lparts, oneline) ---> result of parseline
+
+def linetype(state, lparts, oneline):                        # 'TY  -'
+    linenr = state["linenr"]
+    if state["status"] not in ["out of record", "out of selection"]:  # previous record is not completed
+        if verbose: print("--- Line", str(linenr) +
+                          ": actual record not completed by 'ER  -'; skipped")
+    state["status"]    = "in record"                         # status set to "in record"
+    state["onerecord"] = {}                                  # container onerecord initialized
+    state["recordline"] = linenr                             # line of the record
+    ristype = lparts[1][1:]                                  # get RIS type
+    table   = state["table"]
+    if not (p2.match(ristype) and (ristype in table)):       # unknown ristype
+        if verbose:
+            print("--- Line", str(linenr) + ": RIS type incorrect in", oneline,
+                  "; 'GEN' supposed")
+        ristype = "GEN"                                      # ristype set to "GEN"
+    entry = table[ristype]
+    state["ristype"] = ristype
+    state["bibtype"] = entry.bibtype                         # get bibtype
+    state["linetable"] = entry.linetable
+    if not matchtype(state["typeconds"], ristype, state["bibtype"]):
+        state["status"] = "skip record"                      # record is not built
+    if state["hooks"]["on_record_start"]:
+        callhooks("on_record_start", state, ristype, registry=state["hooks"])
+    return None
+
+def linenote(state, bibfield, riskey, lparts, oneline):      # 'N1  -', 'AB  -', 'N2  -'
+    state["status"]   = "in note" if riskey == "N1" else "in abstract"
+    state["bibfield"] = bibfield
+    onerecord = state["onerecord"]
+    if not wanted(state, bibfield):
+        pass
+    elif bibfield in onerecord:
+        onerecord[bibfield] = onerecord[bibfield] + newline + lparts[1][1:]
+    else:
+        onerecord[bibfield] = lparts[1][1:]
+    return None
+
+def lineend(state, bibfield, riskey, lparts, oneline):       # 'ER  -'
+    onerecord = state["onerecord"]
+    state["onerecord"] = {}                                  # initialize onerecord
+    state["status"]    = "out of record"                     # status set
+    if not matchrecord(state["recordconds"], onerecord):
+        state["status"] = "out of selection"                 # record not selected (--where)
+        return None
+    if state["pool"] is not None:                            # share repeated values
+        poolrecord(state["pool"], onerecord)
+    if state["hooks"]["on_record_parsed"]:
+        callhooks("on_record_parsed", state, state["bibtype"], onerecord, registry=state["hooks"])
+    return (state["bibtype"], onerecord)                     # completed record
+
+def linefield(state, bibfield, riskey, lparts, oneline):     # RIS key with a BibTeX field
+    state["status"]   = "in record"
+    state["bibfield"] = bibfield
+    if wanted(state, bibfield):
+        onerecord = state["onerecord"]
+        if bibfield in onerecord:
+            onerecord[bibfield] = onerecord[bibfield] + "; " + lparts[1][1:]
+        else:
+            onerecord[bibfield] = lparts[1][1:]
+    return None
+
+def lineempty(state, bibfield, riskey, lparts, oneline):     # RIS key with an empty BibTeX field
+    state["status"]   = "in record"
+    state["bibfield"] = bibfield
+    if verbose:
+        print("--- Line", str(state["linenr"]) + ": empty bibfield for " ,
+              state["ristype"], riskey, "in '" + oneline + "'", "; collected in 'note'")
+    if lparts[1][1:] != "" and wanted(state, 'note'):
+        onerecord = state["onerecord"]
+        if 'note' in onerecord:
+            onerecord['note'] = onerecord['note'] + newline + oneline
+        else:
+            onerecord['note'] = oneline
+    return None
+
+def lineunknown(state, bibfield, riskey, lparts, oneline):   # RIS key unknown in the actual record
+    state["status"] = "in record"
+    if verbose:
+        print("--- Line", str(state["linenr"]) + ": unknown riskey for", state["ristype"],
+              riskey, "in '" + oneline + "'")
+    if lparts[1][1:] != "" and wanted(state, 'note'):
+        onerecord = state["onerecord"]
+        if 'note' in onerecord:
+            onerecord['note'] = onerecord['note'] + newline + oneline
+        else:
+            onerecord['note'] = oneline
+    return None
+
+unknownline = (lineunknown, "")
+
+def parseline(state, line):
+    state["linenr"] = linenr = state["linenr"] + 1           # counter
+    if state["hooks"]["on_line"]:
+        callhooks("on_line", state, line, registry=state["hooks"])
+    oneline = line.strip()                                   # strip line
+    lparts  = p4.split(oneline)                              # split line
+    status  = state["status"]
+    if p1.match(lparts[0]):                                  # (1) 1st part of line match p1
+        riskey = lparts[0]                                   #     get riskey
+        if riskey == "TY":                                   # (2) process TY
+            return linetype(state, lparts, oneline)
+        if status == "skip record":                          # (2) record not selected (--where)
+            if riskey == "ER":
+                state["status"] = "out of selection"         #     status set
+            return None
+        handler, bibfield = state["linetable"].get(riskey, unknownline)   # (2) one lookup
+        return handler(state, bibfield, riskey, lparts, oneline)
+    elif status == "out of record":                          # (1) "out of record"
+        return oneline
+    elif status == "in abstract" and wanted(state, "abstract"):  # (1) "in abstract"
+        onerecord = state["onerecord"]
+        if state["bibfield"] in onerecord:
+            onerecord["abstract"] = onerecord["abstract"] + " " + oneline
+        else:
+            onerecord["abstract"] = oneline
+    elif status == "in note" and wanted(state, "note"):      # (1) "in note"
+        onerecord = state["onerecord"]
+        if state["bibfield"] in onerecord:
+            onerecord["note"] = onerecord["note"] + newline + oneline
+        else:
+            onerecord["note"] = oneline
+    return None
+
+# -------------------------------------------------------------
+# Parsing of a sequence of input lines (file, list, ...)
+
+def parselines(lines, state=None):
+    if state is None:
+        state = newstate()
+    return counted(parselineloop(lines, state), state["counts"])
+
+def parselineloop(lines, state):
+    for line in lines:                                       # loop over all input lines
+        result = parseline(state, line)
+        if result is not None:
+            yield result
+
+# -------------------------------------------------------------
+# Input encoding
+#
+# the encoding is guessed from the first chunk of the file (BOM, null bytes
+# of UTF-16, valid UTF-8, Windows-1252, Latin-1); the file is then decoded
+# incrementally while it is read, so it is read only once
+#
+# a byte which is not valid in the encoding (e.g. a Windows-1252 character
+# after a first chunk of plain ASCII) is read as Windows-1252 or Latin-1
+# with the error handler "RIS2bib"; these bytes are counted in
+# decodefallbacks and reported at the end
+#
+# there is only one error handler; it counts in the counter of the context
+# (decodecounts): the parsers run in a context of their own with the
+# counter of their state ("counts", see counted), so every Converter
+# counts its own decodefallbacks
+
+sniffsize = 65536                                        # size of the first chunk
+decodeerrors    = "RIS2bib"                              # error handler for all decoding of the input
+decodefallbacks = {"bytes": 0}                           # bytes read by the error handler (module-wide)
+decodecounts    = contextvars.ContextVar("decodecounts", default=decodefallbacks)   # counter of the context
+
+def decodefallback(error):                               # invalid bytes ---> Windows-1252, Latin-1
+    if not isinstance(error, UnicodeDecodeError):
+        raise error
+    bad    = error.object[error.start:error.end]
+    counts = decodecounts.get()
+    counts["bytes"] = counts["bytes"] + len(bad)
+    return ("".join(bytes([b]).decode("cp1252", "ignore") or chr(b) for b in bad), error.end)
+
+codecs.register_error(decodeerrors, decodefallback)
+
+def counted(results, counts):                            # results of a parser; its decoding errors
+    context = contextvars.copy_context()                 # counted in counts
+    context.run(decodecounts.set, counts)
+    while True:
+        try:
+            result = context.run(next, results)
+        except StopIteration:
+            return
+        yield result
+
+def sniffencoding(head):
+    if head.startswith(codecs.BOM_UTF32_LE) or head.startswith(codecs.BOM_UTF32_BE):
+        return "utf-32"
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith(codecs.BOM_UTF16_LE) or head.startswith(codecs.BOM_UTF16_BE):
+        return "utf-16"
+    half = len(head) // 2
+    if half > 0:                                         # UTF-16 without BOM: every 2nd byte 0
+        even = head[0::2].count(0)
+        odd  = head[1::2].count(0)
+        if odd > 0.3 * half and even < 0.05 * half:
+            return "utf-16-le"
+        if even > 0.3 * half and odd < 0.05 * half:
+            return "utf-16-be"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        pass
+    try:
+        head.decode("cp1252")
+        return "cp1252"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+def bytewise(encoding):                                  # usable by parsebuffer
+    return not codecs.lookup(encoding).name.startswith(("utf-16", "utf-32"))
+
+def openinput(name, encoding="", errors=decodeerrors):
+    raw = open(name, mode="rb", buffering=sniffsize)
+    if encoding == "":
+        encoding = sniffencoding(raw.peek(sniffsize)[:sniffsize])
+    return (io.TextIOWrapper(raw, encoding=encoding, errors=errors), encoding)
+
+def mapfile(name):
+    with open(name, mode="rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:                               # empty file
+            return b""
+
+# -------------------------------------------------------------
+# Memory-mapped input (-m)
+#
+# the lines 'TY  -' and 'ER  -' are found by one regular expression over
+# the whole buffer (p22; p23 only if there are line ends '\r'); inside a
+# record the lines are handled by parseline, but only those lines are
+# decoded and parsed whose text is needed (see scanrecord):
+#
+#    - a record which is not selected by its RIS type ('TY  -') or by the
+#      conditions on fields (year, keyword, has; only the lines of these
+#      fields are decoded, see condscan, rejected) is skipped in one step
+#    - if note and abstract and most other fields are not written (--fields,
+#      -s), only the lines of the written fields are decoded and parsed (see
+#      scankeep): the other lines change only the status of the parser,
+#      which matters only for continued lines of note and abstract
+#    - otherwise the record is decoded in one piece and every line is
+#      parsed (see parsetext)
+#
+# the regular expressions over a record start with '\n' (much faster than
+# '[\r\n]'), '[\r\n]' only if there are line ends '\r' (see keyscan)
+#
+# records with a RIS key after non-ASCII blanks or without '  -' (p22,
+# p23), the lines outside of records, records not completed by 'ER  -'
+# and all lines for hooks on_line are decoded line by line (see
+# parseregion), so the results are the same as those of parselines
+
+emptyline = {b"\n", b"\r\n", b"\r"}                      # the usual gap between two records
+
+def recordheads(buf, start, lonecr):                     # (b"TY", b"ER" or b"", start of the line)
+    m     = p9.search(buf, start)
+    first = p10.match(buf, start, m.start() if m else len(buf))   # first line (no line end before it)
+    if first and first.group(1) in [b"TY", b"ER"]:
+        yield (first.group(1), start)
+    heads = p22.finditer(buf, start)
+    if lonecr:                                           # line ends '\r': merged in file order
+        heads = heapq.merge(heads, p23.finditer(buf, start), key=lambda m: m.start())
+    for m in heads:
+        yield (m.group(1) or b"", m.start() + 1)         # (b"": see p22)
+
+def regionlines(buf, start, end):                        # (start, end) of the lines of buf[start:end]
+    for m in p9.finditer(buf, start, end):
+        yield (start, m.start())
+        start = m.end()
+    if start < end:                                      # last line without line end
+        yield (start, end)
+
+def keyscan(state, names):                               # lines with a RIS key of names (bytes), found
+    return re.compile((rb"[\r\n]" if state["lonecr"] else rb"\n") +   # after their line end
+                      rb"[ \t\x0b\x0c]*(" + (b"|".join(map(re.escape, sorted(names))) or rb"(?!)") + rb")  -[^\r\n]*")
+
+def parseregion(state, buf, start, end):                 # lines of buf[start:end] by parseline
+    encoding = state["encoding"]
+    for (first, last) in regionlines(buf, start, end):
+        result = parseline(state, str(buf[first:last], encoding, decodeerrors))
+        if state.get("recordline") == state["linenr"]:   # 'TY  -' (see linetype)
+            state["recordstart"] = first
+        if result is not None:
+            if not isinstance(result, str):
+                state["recordend"] = last
+            yield result
+
+def parsetext(state, buf, start, end):                   # lines of buf[start:end] (none with 'TY  -', see p22)
+    text = str(buf[start:end], state["encoding"], decodeerrors)   # decoded in one piece ---> result
+    if "\r" in text and text.count("\r") != text.count("\r\n"):   # line ends '\r' (see p9; a '\r'  of the
+        text = text.replace("\r\n", "\n").replace("\r", "\n")   # before '\n' is stripped)   last line
+    lines = text.split("\n")
+    if buf[end - 1] in b"\r\n":                          # (no line after the last line end)
+        lines.pop()
+    result = None
+    for line in lines:
+        result = parseline(state, line)
+    return result
+
+# lines of the written fields of a RIS type (None: note or abstract written,
+# whose continued lines depend on the lines before them, or most fields
+# written)
+
+def scankeep(state):
+    ristype = (state["ristype"], state["lonecr"])        # (see keyscan)
+    if ristype not in state["scankeep"]:                 # once for every RIS type
+        linetable = state["linetable"]
+        kept      = [key.encode("ascii", "replace") for (key, (handler, field)) in linetable.items()
+                     if (handler is linefield or handler is linenote) and wanted(state, field)]
+        alone     = (not verbose and not wanted(state, "note") and not wanted(state, "abstract") and
+                     all(linetable[key.decode("ascii")][0] is linefield for key in kept) and
+                     2 * len(kept) <= len(linetable))    # (a line alone costs about twice as much)
+        state["scankeep"][ristype] = keyscan(state, kept) if alone else None
+    return state["scankeep"][ristype]
+
+def condscan(state, ristype):                            # (regular expression, RIS key ---> field) or None
+    scans = state["condscan"]
+    scan  = (ristype, state["lonecr"])                   # (see keyscan)
+    if scan not in scans:
+        linetable = state["table"][ristype].linetable
+        fields    = {{"year": "year", "keyword": "keywords"}.get(name, value)
+                     for (name, op, value) in state["recordconds"]}
+        keys      = {riskey: field for (riskey, (handler, field)) in linetable.items() if field in fields}
+        if fields & {"note", "abstract"} or any(linetable[riskey][0] is not linefield for riskey in keys):
+            scans[scan] = None                           # continued or collected lines: no scan
+        else:
+            keys = {riskey.encode("ascii", "replace"): field for (riskey, field) in keys.items()}
+            scans[scan] = (keyscan(state, keys), keys)
+    return scans[scan]
+
+def rejected(state, buf, start, end):                    # record not selected (--where); buf[start]: line end
+    scan = condscan(state, state["ristype"]) if state["recordconds"] and not verbose else None
+    if scan is None:                                     # of 'TY  -'
+        return False
+    o = {}
+    for m in scan[0].finditer(buf, start, end):          # only the lines of the condition fields
+        try:                                             # (invalid bytes: by parseline, counted once)
+            oneline = str(buf[m.start() + 1:m.end()], state["encoding"]).strip()
+        except UnicodeDecodeError:
+            return False
+        field = scan[1][m.group(1)]
+        value = p4.split(oneline)[1][1:]                 # like linefield
+        o[field] = o[field] + "; " + value if field in o else value
+    return not matchrecord(state["recordconds"], o)
+
+def scanrecord(state, buf, start, end):                  # record buf[start:end] from 'TY  -' to 'ER  -'
+    encoding = state["encoding"]                         # ---> results of parseline
+    m = p9.search(buf, start, end)
+    parseline(state, str(buf[start:m.start()], encoding, decodeerrors))   # 'TY  -' (see linetype)
+    state["recordstart"] = start
+    if state["status"] == "in record" and rejected(state, buf, m.start(), end):
+        state["status"] = "skip record"                  # not selected by the condition fields
+    if state["status"] == "skip record":                 # only 'ER  -' counts (see parseline)
+        state["linenr"] = state["linenr"] + countlines(buf, m.start(), end)
+        state["status"] = "out of selection"
+        return
+    fieldlines = scankeep(state) if state["include"] is not None or state["exclude"] else None
+    if fieldlines is None:                               # every line needed (or note, abstract)
+        result = parsetext(state, buf, m.end(), end)
+        if result is not None:
+            state["recordend"] = end
+            yield result
+        return
+    erline = buf.rfind(b"\n", m.start(), end)            # only the lines of the written fields;
+    if state["lonecr"]:                                  # line end before 'ER  -'
+        erline = max(erline, buf.rfind(b"\r", m.start(), end))
+    base = state["linenr"]
+    for k in fieldlines.finditer(buf, m.start(), erline):
+        parseline(state, str(buf[k.start() + 1:k.end()], encoding, decodeerrors))
+    state["linenr"] = base + countlines(buf, m.start(), erline)
+    result = parseline(state, str(buf[erline + 1:end], encoding, decodeerrors))
+    if result is not None:
+        state["recordend"] = end
+        yield result
+
+# -------------------------------------------------------------
+# Parsing of a whole buffer (see mapfile); the encoding must be
+# ASCII compatible (see bytewise)
+#
+# offset: byte offset of the first line (> 0: continued conversion,
+#         see --resume)
+
+def parsebuffer(buf, state=None, encoding="utf-8", offset=0):
+    if state is None:
+        state = newstate()
+    state["encoding"] = "utf-8" if encoding == "utf-8-sig" else encoding
+    if offset > 0:
+        start = offset
+    else:
+        start = 3 if buf[:3] == codecs.BOM_UTF8 else 0       # like "utf-8-sig"
+    return counted(parsebufferloop(buf, state, start), state["counts"])
+
+def parsebufferloop(buf, state, start):
+    if state["hooks"]["on_line"]:                            # every line to the hooks
+        yield from parseregion(state, buf, start, len(buf))
+        return
+    state["lonecr"] = p23.search(buf, start) is not None     # line ends '\r' (see keyscan)
+    heads = recordheads(buf, start, state["lonecr"])
+    head  = next(heads, None)
+    while head is not None:
+        if head[0] != b"TY":                                 # 'ER  -' outside of a record
+            head = next(heads, None)
+            continue
+        first = head[1]
+        head  = next(heads, None)
+        plain = True                                         # no line which only parseline can tell (p22)
+        while head is not None and head[0] == b"":
+            plain = False
+            head  = next(heads, None)
+        if head is None or head[0] == b"TY":                 # record not completed by 'ER  -'
+            stop = len(buf) if head is None else head[1]
+            yield from parseregion(state, buf, start, stop)
+            start = stop
+            continue
+        m    = p9.search(buf, head[1])                       # end of the line 'ER  -'
+        last = m.start() if m else len(buf)
+        stop = m.end() if m else len(buf)
+        if start < first:                                    # lines outside of records
+            if buf[start:first] in emptyline and state["status"] in ["out of record", "out of selection"]:
+                state["linenr"] = state["linenr"] + 1        # one empty line (as parseline)
+                if state["status"] == "out of record":
+                    yield ""
+            else:
+                yield from parseregion(state, buf, start, first)
+        if plain:
+            yield from scanrecord(state, buf, first, last)
+        else:
+            yield from parseregion(state, buf, first, stop)
+        start = stop
+        head  = next(heads, None)
+    if start < len(buf):
+        yield from parseregion(state, buf, start, len(buf))
+
+# -------------------------------------------------------------
+# LaTeX escaping of field values (--latex)
+#
+# special: the LaTeX special characters & % # _ $ ~ ^ \ are escaped;
+#          braces only if they are not balanced in the value
+# ascii  : as special; non-ASCII characters are written as LaTeX macros
+#          (for classic BibTeX)
+#
+# each value is converted in one pass with str.translate; the tables are
+# built on first use; fields in verbatimfields are never escaped
+
+verbatimfields = {"url", "doi", "eprint", "file"}
+
+latexspecial = {"&": "\\&", "%": "\\%", "#": "\\#", "_": "\\_", "$": "\\$",
+                "~": "\\textasciitilde{}", "^": "\\textasciicircum{}",
+                "\\": "\\textbackslash{}"}
+latexbraces  = {"{": "\\{", "}": "\\}"}
+latexaccents = {"\u0300": "`", "\u0301": "'", "\u0302": "^", "\u0303": "~",
+                "\u0304": "=", "\u0306": "u", "\u0307": ".", "\u0308": '"',
+                "\u030a": "r", "\u030b": "H", "\u030c": "v", "\u0327": "c",
+                "\u0328": "k"}
+latexsymbols = {"ß": "{\\ss}", "æ": "{\\ae}", "Æ": "{\\AE}", "œ": "{\\oe}", "Œ": "{\\OE}",
+                "ø": "{\\o}", "Ø": "{\\O}", "ł": "{\\l}", "Ł": "{\\L}", "ı": "{\\i}",
+                "\u00a0": "~", "–": "--", "—": "---", "…": "{\\ldots}",
+                "“": "``", "”": "''", "‘": "`", "’": "'", "„": "{\\glqq}",
+                "«": "{\\guillemotleft}", "»": "{\\guillemotright}",
+                "§": "{\\S}", "¶": "{\\P}", "©": "{\\textcopyright}",
+                "°": "{\\textdegree}", "€": "{\\texteuro}"}
+latexcache   = {}                                        # mode ---> tables; "unescape": see latexunescape
+
+def latextables(mode):
+    if mode not in latexcache:
+        extra = {}
+        if mode == "ascii":
+            for code in range(0xc0, 0x250):              # Latin-1 and Latin Extended-A/B
+                tmp = unicodedata.normalize("NFD", chr(code))
+                if len(tmp) == 2 and tmp[0].isascii() and tmp[1] in latexaccents:
+                    base = {"i": "\\i", "j": "\\j"}.get(tmp[0], tmp[0])
+                    sep  = " " if latexaccents[tmp[1]].isalpha() else ""
+                    extra[chr(code)] = "{\\" + latexaccents[tmp[1]] + sep + base + "}"
+            extra.update(latexsymbols)
+        latexcache[mode] = {
+            False: str.maketrans({**latexspecial, **extra}),                  # braces balanced
+            True : str.maketrans({**latexspecial, **latexbraces, **extra})}   # braces not balanced
+    return latexcache[mode]
+
+def balanced(value):
+    depth = 0
+    for c in value:
+        if c == "{":
+            depth = depth + 1
+        elif c == "}":
+            depth = depth - 1
+            if depth < 0:
+                return False
+    return depth == 0
+
+def latexescape(value, mode):
+    if mode == "ascii" and not value.isascii():
+        tables = latextables("ascii")
+    else:                                                # fast path: no macros needed
+        tables = latextables("special")
+    return value.translate(tables[("{" in value or "}" in value) and not balanced(value)])
+
+# inverse of latexescape for both modes (--append-to: identity of a record
+# written with --latex); the escapes are unambiguous because a backslash
+# of the value is always escaped itself; other text is unchanged
+
+def latexunescape(value):
+    if "unescape" not in latexcache:                     # (regular expression, LaTeX ---> character)
+        inverse = {text: chr(code) for (code, text) in latextables("ascii")[True].items()}
+        latexcache["unescape"] = (re.compile("|".join(re.escape(text) for text in
+                                                      sorted(inverse, key=len, reverse=True))), inverse)
+    pattern, inverse = latexcache["unescape"]
+    return pattern.sub(lambda m: inverse[m.group()], value)
+
+# -------------------------------------------------------------
+# Transformers of field values
+#
+# transformers: BibTeX field ---> functions value ---> value, applied in
+# this order when a record is rendered, before the LaTeX escaping
+# (--latex); built in:
+#
+#   author, editor: "; " ---> " and " (names in BibLaTeX form, see formatname)
+#   pages         : "; " ---> "--"; 12-15 ---> 12--15
+#   keywords      : "; " ---> ", "
+#   doi           : prefixes "https://doi.org/", "doi:" removed
+#   url           : blanks and <...> around the URL removed
+#   date, urldate : 2015/03/07/ ---> 2015-03-07; 2015/03// ---> 2015-03;
+#                   2015/// ---> 2015; other info (2015/03/07/Spring) dropped;
+#                   invalid month or day (2015-13-45): value unchanged
+#
+# addedtransformers: the transformers of addtransformer, applied after
+# the LaTeX escaping; they get the escaped value and may return LaTeX,
+# which is not escaped again; a correction file can add transformers, e.g.
+#
+#   addtransformer("title", lambda value: value.replace("LaTeX", "\\LaTeX{}"))
+#
+# the functions of a field are compiled into two callables, before and
+# after the escaping (fieldchains); fields without transformers are not
+# touched
+
+def joinnames(value):
+    return " and ".join([formatname(n) for n in parsenames(value)])
+
+def pagerange(value):
+    return p15.sub("--", value.replace("; ", "--"))
+
+def keywordlist(value):
+    return value.replace("; ", ", ")
+
+def cleandoi(value):
+    return p16.sub("", value.strip())
+
+def cleanurl(value):
+    return value.strip().strip("<>").strip()
+
+def isodate(value):
+    m = p17.match(value.strip())
+    if not m:
+        return value
+    year, month, day = m.groups()
+    if month is None:                                    # year only (a day without month is dropped)
+        return year
+    if not 1 <= int(month) <= 12 or (day is not None and not 1 <= int(day) <= 31):
+        return value                                     # invalid month or day: unchanged
+    if day is None:
+        return year + "-" + month.zfill(2)
+    return year + "-" + month.zfill(2) + "-" + day.zfill(2)
+
+transformers = {**{f: [joinnames] for f in namefields},    # author, editor
+                "pages"   : [pagerange],
+                "keywords": [keywordlist],
+                "doi"     : [cleandoi],
+                "url"     : [cleanurl],
+                "date"    : [isodate],
+                "urldate" : [isodate]}
+addedtransformers = {}                                   # after the LaTeX escaping
+fieldchains  = {}                                        # BibTeX field ---> (callable before, after escaping)
+
+def chain(funcs):
+    if len(funcs) == 1:
+        return funcs[0]
+    def run(value):
+        for func in funcs:
+            value = func(value)
+        return value
+    return run
+
+def compilechains(transformers, added):                  # BibTeX field ---> (callable, callable)
+    return {f: (chain(list(transformers.get(f, []))), chain(list(added.get(f, []))))
+            for f in set(transformers) | set(added) if transformers.get(f) or added.get(f)}
+
+def compiletransformers():                               # new dict: a running render keeps its chains
+    global fieldchains
+    fieldchains = compilechains(transformers, addedtransformers)
+
+def addtransformer(field, func):                         # module-wide (see also Converter)
+    addedtransformers.setdefault(field, []).append(func)
+    compiletransformers()
+
+compiletransformers()
+
+# -------------------------------------------------------------
+# Rendering of a BibTeX record
+#
+# bibtype  : actual BibTeX type
+# key      : the generated BibTeX key (see recordkey)
+# o        : the content of a record
+# skip     : BibTeX fields to be skipped (set)
+# fields   : BibTeX fields to be written (set); None: all fields
+# latex    : LaTeX escaping: "" (none), "special" or "ascii" (see latexescape)
+# chains   : transformers (see compilechains); None: module-wide fieldchains
+
+def renderrecord(bibtype, key, o, skip=(), fields=None, latex="", chains=None):
+    if chains is None:
+        chains = fieldchains
+    tmp = [bibtype + "{" + key + ",\n"]                      # first line of a BibTeX record
+    for f in o:                                              # process all in o collected lines
+        if f not in skip and (fields is None or f in fields):
+            value = o[f]
+            if f in chains:                                  # see transformers
+                before, after = chains[f]
+                value = before(value)
+                if latex != "" and f not in verbatimfields:
+                    value = latexescape(value, latex)
+                value = after(value)                         # may return LaTeX
+            elif latex != "" and f not in verbatimfields:
+                value = latexescape(value, latex)
+            tmp.append(f.ljust(fieldwidth) + "= {" + value + "},\n")
+    tmp.append("}\n")                                        # last line of a BibTeX record
+    return "".join(tmp)
+
+def renderbatch(keyed, skip=(), fields=None, latex="", chains=None):
+    return "".join([renderrecord(bibtype, key, o, skip, fields, latex, chains) for (bibtype, key, o) in keyed])
+
+# -------------------------------------------------------------
+# Columnar record store for whole-corpus operations
+#
+# all records of a corpus in arrays and one string heap:
+#
+#   heap, offsets       : all strings (keys, values) UTF-8 encoded in one
+#                         bytearray; string i is heap[offsets[i]:offsets[i + 1]];
+#                         repeated values of the pooled fields are stored
+#                         only once (see pooled)
+#   rtype, rkey, rstart : per record: BibTeX type id, string id of the key,
+#                         index of its first field entry
+#   efield, evalue      : per field entry (in the order of the record):
+#                         field id, string id of the value
+#   columns             : field ---> (record indices, string ids) of the
+#                         values of one field in record order
+#
+# used for the children held by --crossref (see CrossrefGroups)
+#
+# usage: store = RecordStore(); store.load(parselines(inp))
+#        indices, years = store.column("year")
+#        for (bibtype, key, o) in store.records(): out.write(renderrecord(bibtype, key, o))
+
+class RecordStore:
+    def __init__(self):
+        self.heap     = bytearray()                     # all strings
+        self.offsets  = array("Q", [0])                 # string id ---> start in heap
+        self.shared   = {}                              # hash of a pooled value ---> string id
+        self.types    = []                              # BibTeX types
+        self.fields   = []                              # field names
+        self.typeids  = {}                              # BibTeX type ---> type id
+        self.fieldids = {}                              # field name ---> field id
+        self.columns  = {}                              # field ---> (array of record indices, array of string ids)
+        self.rtype    = array("H")
+        self.rkey     = array("I")
+        self.rstart   = array("I", [0])
+        self.efield   = array("H")
+        self.evalue   = array("I")
+
+    def __len__(self):
+        return len(self.rtype)
+
+    def addtext(self, text, pooled=False):              # string ---> string id
+        data = text.encode("utf-8", "surrogatepass")
+        if pooled:                                      # repeated value: the same id
+            h = hash(text)
+            i = self.shared.get(h)
+            if i is not None and self.heap[self.offsets[i]:self.offsets[i + 1]] == data:
+                return i
+        self.heap.extend(data)
+        self.offsets.append(len(self.heap))
+        i = len(self.offsets) - 2
+        if pooled and h not in self.shared:             # (an equal hash of another value: not shared)
+            self.shared[h] = i
+        return i
+
+    def text(self, i):                                  # string id ---> string
+        return self.heap[self.offsets[i]:self.offsets[i + 1]].decode("utf-8", "surrogatepass")
+
+    def add(self, bibtype, key, o):                     # one record ---> its index
+        nr = len(self)
+        if bibtype not in self.typeids:
+            self.typeids[bibtype] = len(self.types)
+            self.types.append(bibtype)
+        self.rtype.append(self.typeids[bibtype])
+        self.rkey.append(self.addtext(key))
+        for f in o:
+            if f not in self.fieldids:
+                self.fieldids[f] = len(self.fields)
+                self.fields.append(sys.intern(f))
+                self.columns[f] = (array("I"), array("I"))
+            value = o[f]
+            i     = self.addtext(value, pooled(f, value))
+            self.efield.append(self.fieldids[f])
+            self.evalue.append(i)
+            indices, ids = self.columns[f]
+            indices.append(nr)
+            ids.append(i)
+        self.rstart.append(len(self.efield))
+        return nr
+
+    # results: lines and records of the parser (parselines, parsebuffer, aparse);
+    # the keys are generated in input order
+
+    def load(self, results, keyfunc=None):              # keyfunc: see Converter.resultkey
+        if keyfunc is None:
+            keyfunc = resultkey
+        for result in results:
+            if isinstance(result, str):                 # lines outside of records
+                continue
+            self.add(result[0], keyfunc(result), result[1])
+        return len(self)
+
+    def record(self, nr):                               # (bibtype, key, record)
+        fields, text = self.fields, self.text
+        o = {fields[self.efield[e]]: text(self.evalue[e]) for e in range(self.rstart[nr], self.rstart[nr + 1])}
+        return (self.types[self.rtype[nr]], text(self.rkey[nr]), o)
+
+    def records(self):
+        for nr in range(len(self)):
+            yield self.record(nr)
+
+    def column(self, name):                             # (record indices, values) of one field
+        if name not in self.columns:
+            return (array("I"), [])
+        indices, ids = self.columns[name]
+        return (indices, [self.text(i) for i in ids])
+
+# -------------------------------------------------------------
+# Sorting of the rendered records (--sort-by)
+#
+# the sort keys are computed once per record (folded with unidecode);
+# runs of rendered records are sorted in memory and, if they exceed
+# the given memory, written to temporary files and merged at the end
+
+sortparts = ["key", "author", "year", "type", "title"]    # allowed parts of --sort-by
+
+def compilesort(text):
+    parts = [f for f in re.split("[ ,;]+", text.lower()) if f != ""]
+    for f in parts:
+        if f not in sortparts:
+            raise ValueError("unknown sort criterion '" + f + "'")
+    return parts
+
+def foldtext(text):
+    return toascii(text).casefold()
+
+def sortkey(parts, bibtype, key, o, nr):
+    tmp = []
+    for f in parts:
+        if f == "key":
+            tmp.append(foldtext(key))
+        elif f == "author":
+            for g in ["author", "editor", "organization"]:       # like recordkey
+                if o.get(g, "") != "":
+                    tmp.append(foldtext(o[g]))
+                    break
+            else:
+                tmp.append("")
+        elif f == "year":
+            m = p8.search(o.get("year", ""))
+            tmp.append(m.group() if m else "")
+        elif f == "type":
+            tmp.append(bibtype)
+        elif f == "title":
+            tmp.append(foldtext(o.get("title", "")))
+    tmp.append(nr)                                               # stable: input order
+    return tmp
+
+def spillrun(run):
+    import json, tempfile
+    run.sort(key=lambda item: item[0])
+    f = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+    for item in run:
+        f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    f.seek(0)
+    return f
+
+def readrun(f):
+    import json
+    for line in f:
+        yield json.loads(line)
+
+def mergeruns(runs):                                             # sorted runs ---> one sorted run
+    import json, tempfile
+    f = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+    try:
+        for item in heapq.merge(*[readrun(g) for g in runs], key=lambda item: item[0]):
+            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    finally:
+        for g in runs:
+            g.close()
+    f.seek(0)
+    return f
+
+# items : iterable of (sort key, rendered record)
+# memory: number of bytes for a run in memory
+#
+# at most sortfanin runs are open at once: when there are more, they are
+# first merged into one run
+
+def externalsort(items, memory=sortmem_default * 1024 * 1024):
+    runs = []                                                    # temporary files
+    run  = []                                                    # actual run in memory
+    size = 0
+    for (k, text) in items:
+        run.append((k, text))
+        size = size + len(text) + 64
+        if size >= memory:
+            runs.append(spillrun(run))
+            run  = []
+            size = 0
+            if len(runs) >= sortfanin:                           # (the run in memory is the last one)
+                runs = [mergeruns(runs)]
+    run.sort(key=lambda item: item[0])
+    if runs == []:                                               # everything fitted in memory
+        for item in run:
+            yield item[1]
+        return
+    try:
+        for item in heapq.merge(*[readrun(f) for f in runs], run, key=lambda item: item[0]):
+            yield item[1]
+    finally:
+        for f in runs:
+            f.close()
+
+
+# -------------------------------------------------------------
+# Index file for random access (--index, --extract, --sample)
+#
+# <in_file>.idx is a text file with a header line and one line per record:
+#
+#   nr  start  end  line  ristype  doi  first author  year  key
+#
+# (separated by tabs; start, end: byte range of the record from 'TY  -'
+# to 'ER  -'; line: line number of 'TY  -'; key: the key of a full conversion)
+
+def indexname(in_file):
+    return in_file + ".idx"
+
+def indexheader(in_file):
+    tmp = os.stat(in_file)
+    return ("% RIS2bib index; size " + str(tmp.st_size) +
+            "; mtime " + str(tmp.st_mtime_ns) + "\n")
+
+def buildindex(in_file, name, encoding="utf-8", converter=None):   # converter: see Converter
+    if converter is None:
+        converter = Converter()                                  # keys not used elsewhere
+    buf   = mapfile(in_file)
+    state = converter.newstate()
+    nr    = 0
+    with open(name, encoding="utf-8", mode="w") as f:
+        f.write(indexheader(in_file))
+        for result in parsebuffer(buf, state, encoding):
+            if isinstance(result, str):
+                continue
+            bibtype, o = result
+            nr     = nr + 1
+            key    = converter.recordkey(o)                      # like a full conversion
+            author = ""
+            for g in ["author", "editor", "organization"]:       # like recordkey
+                if o.get(g, "") != "":
+                    author = o[g].split(";")[0].strip()
+                    break
+            m = p8.search(o.get("year", ""))
+            f.write("\t".join([str(nr), str(state["recordstart"]), str(state["recordend"]),
+                               str(state["recordline"]), state["ristype"],
+                               o.get("doi", "").replace("\t", " "), author.replace("\t", " "),
+                               m.group() if m else "", key]) + "\n")
+    if buf:
+        buf.close()
+    return nr
+
+def indexcurrent(in_file, name):
+    try:
+        with open(name, encoding="utf-8", mode="r") as f:
+            return f.readline() == indexheader(in_file)
+    except FileNotFoundError:
+        return False
+
+def readindex(name):
+    with open(name, encoding="utf-8", mode="r") as f:
+        f.readline()                                             # header
+        for line in f:
+            tmp = line.rstrip("\n").split("\t")
+            yield (int(tmp[0]), int(tmp[1]), int(tmp[2]), int(tmp[3])) + tuple(tmp[4:])
+
+# spec: numbers, ranges and keys, separated by commas or blanks
+
+def selectindex(rows, spec):
+    numbers = set()
+    ranges  = []
+    keys    = set()
+    for f in re.split("[ ,]+", spec.strip()):
+        if re.match("^[0-9]+$", f):
+            numbers.add(int(f))
+        elif re.match("^[0-9]+-[0-9]+$", f):
+            tmp = f.split("-")
+            ranges.append((int(tmp[0]), int(tmp[1])))
+        elif f != "":
+            keys.add(f)
+    for row in rows:
+        if (row[0] in numbers or row[8] in keys or
+            any(low <= row[0] <= high for (low, high) in ranges)):
+            yield row
+
+def samplerows(rows, n, seed=None):                              # reservoir sampling
+    import random
+    rnd    = random.Random(seed)
+    sample = []
+    for i, row in enumerate(rows):
+        if i < n:
+            sample.append(row)
+        else:
+            j = rnd.randint(0, i)
+            if j < n:
+                sample[j] = row
+    sample.sort()                                                # in input order
+    return sample
+
+def extractrecords(in_file, rows, state=None, encoding="utf-8"):
+    if state is None:
+        state = newstate()
+    with open(in_file, mode="rb") as f:
+        for row in rows:
+            f.seek(row[1])
+            buf = f.read(row[2] - row[1])
+            state["linenr"] = row[3] - 1                         # line numbers for messages
+            for result in parsebuffer(buf, state, encoding):
+                if not isinstance(result, str):
+                    yield result + (row[8],)                     # (bibtype, record, key)
+
+# -------------------------------------------------------------
+# Validation of the structure of a RIS file (--check)
+#
+# only the RIS keys are looked at: a regular expression runs over the
+# buffer itself (also a memory-mapped file; nothing is copied), a second
+# one only if there are line ends '\r'; the first line is matched
+# separately; line numbers are counted only if there are problems, in
+# slices of checkslice bytes; no records, keys or output
+#
+# buf      : content of the input file (bytes or mmap, ASCII compatible)
+# table    : compiled conversion table; None: compiled from config
+# result   : (number of records, [(line number, problem), ...])
+
+checkslice = 1024 * 1024                                     # bytes copied at a time for counting lines
+
+def riskeys(buf):                                            # match objects: group 1 = RIS key
+    start = 3 if buf[:3] == codecs.BOM_UTF8 else 0
+    m     = p9.search(buf, start)
+    first = p10.match(buf, start, m.start() if m else len(buf))   # first line (no line end before it)
+    if first:
+        yield first
+    keys = p18.finditer(buf, start)
+    if p21.search(buf, start):                               # line ends '\r': merged in file order
+        keys = heapq.merge(keys, p21.finditer(buf, start), key=lambda m: m.start())
+    yield from keys
+
+def countlines(buf, start, end):                             # line ends in buf[start:end]
+    count = 0
+    while start < end:
+        stop = min(end, start + checkslice)
+        if buf[stop - 1:stop] == b"\r" and buf[stop:stop + 1] == b"\n":
+            stop = stop + 1                                  # '\r\n' not split
+        part  = buf[start:stop]
+        count = count + part.count(b"\n") + part.count(b"\r") - part.count(b"\r\n")
+        start = stop
+    return count
+
+def checkbuffer(buf, table=None):
+    if table is None:
+        table = config.compile()
+    known = {ristype: frozenset(riskey.encode("ascii") for riskey in entry.layer)
+             for (ristype, entry) in table.items()}
+    problems = []                                            # (byte offset, problem)
+    records  = 0
+    layer    = None                                          # RIS keys of the actual record; None: out of record
+    start    = 0                                             # byte offset of 'TY  -'
+    for m in riskeys(buf):
+        riskey = m.group(1)
+        if riskey == b"TY":
+            if layer is not None:
+                problems.append((start, "record not completed by 'ER  -'"))
+            records = records + 1
+            start   = m.start(1)
+            ristype = (p19.match(buf, start).group(1) or b"").strip().decode("ascii", "replace")
+            if p2.match(ristype) and ristype in known:
+                layer = known[ristype]
+            else:
+                problems.append((start, "RIS type '" + ristype + "' unknown"))
+                ristype, layer = "GEN", known["GEN"]
+        elif layer is None:
+            problems.append((m.start(1), "RIS key " + riskey.decode("ascii") + " outside of a record"))
+        elif riskey == b"ER":
+            layer = None
+        elif riskey not in layer:
+            problems.append((m.start(1), "RIS key " + riskey.decode("ascii") + " unknown for RIS type " + ristype))
+    if layer is not None:
+        problems.append((start, "record not completed by 'ER  -' at the end of the file"))
+    if problems:                                             # byte offset ---> line number
+        lines = {}
+        pos, line = 0, 1
+        for offset in sorted(set(offset for (offset, problem) in problems)):
+            line = line + countlines(buf, pos, offset)
+            pos  = offset
+            lines[offset] = line
+        problems = sorted((lines[offset], problem) for (offset, problem) in problems)
+    return (records, problems)
+
+# -------------------------------------------------------------
+# Threaded pipeline (--pipeline)
+#
+# the input is read by a reader thread and the output is written by a
+# writer thread; both are connected with the parsing and rendering by
+# queues of at most depth blocks (backpressure); the order of the lines
+# is kept, so the output is the same as without threads
+
+pipeblock = 65536                                   # size of a block (characters)
+
+def readahead(inp, depth):                          # lines of inp, read by a reader thread
+    import queue, threading
+    blocks = queue.Queue(depth)
+    failed = []
+
+    def reader():
+        try:
+            while True:
+                block = inp.readlines(pipeblock)
+                blocks.put(block)
+                if not block:                       # end of file
+                    break
+        except Exception as e:
+            failed.append(e)
+            blocks.put([])
+
+    context = contextvars.copy_context()            # decoding errors counted as by the caller
+    thread  = threading.Thread(target=context.run, args=(reader,), daemon=True)
+    thread.start()
+    while True:
+        block = blocks.get()
+        if not block:
+            break
+        yield from block
+    thread.join()
+    if failed:
+        raise failed[0]
+
+class PipeWriter:                                   # out.write in a writer thread
+    def __init__(self, out, depth):
+        import queue, threading
+        self.out    = out
+        self.blocks = queue.Queue(depth)
+        self.parts  = []                            # texts of the actual block
+        self.size   = 0
+        self.failed = []
+        self.thread = threading.Thread(target=self.writer, daemon=True)
+        self.thread.start()
+
+    def writer(self):
+        while True:
+            block = self.blocks.get()
+            if block is None:                       # closed
+                break
+            if not self.failed:                     # after an error: only emptying the queue
+                try:
+                    self.out.write(block)
+                except Exception as e:
+                    self.failed.append(e)
+            self.blocks.task_done()
+
+    def write(self, text):
+        if self.failed:
+            raise self.failed[0]
+        self.parts.append(text)
+        self.size = self.size + len(text)
+        if self.size >= pipeblock:
+            self.blocks.put("".join(self.parts))
+            self.parts = []
+            self.size  = 0
+
+    def flush(self):                                # all blocks written
+        if self.parts:
+            self.blocks.put("".join(self.parts))
+            self.parts = []
+            self.size  = 0
+        self.blocks.join()
+        if self.failed:
+            raise self.failed[0]
+        self.out.flush()
+
+    def fileno(self):
+        return self.out.fileno()
+
+    def close(self):
+        if self.parts:
+            self.blocks.put("".join(self.parts))
+            self.parts = []
+        self.blocks.put(None)
+        self.thread.join()
+        self.out.close()
+        if self.failed:
+            raise self.failed[0]
+
+# -------------------------------------------------------------
+# Output in several .bib files (--shard-by size=50MB|type|year)
+#
+# the shards of out.bib are out-<label>.bib (label: 001, 002, ... for
+# size; BibTeX type; year or "noyear"); every shard has its own header,
+# the keys are unique over all shards; out.bib.manifest lists the shards
+# after a header line (separated by tabs):
+#
+#   shard  records  bytes  first key  last key
+#
+# the manifest lists only the shards of this run; shards of an earlier run
+# which are listed in the old manifest but not written again (e.g. fewer
+# shards by size, other years) are removed when the new manifest is
+# written; other files are never removed
+
+def compileshard(text):                             # (mode, bytes per shard)
+    if text in ["type", "year"]:
+        return (text, 0)
+    m = p14.match(text.strip())
+    if not m or int(m.group(1)) == 0:
+        raise ValueError("expected size=<n>[B|KB|MB|GB], type or year, not '" + text + "'")
+    unit = {"": 1, "B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}[(m.group(2) or "").upper()]
+    return ("size", int(m.group(1)) * unit)
+
+def shardlabel(spec, bibtype, o):                   # None: chosen by size (see ShardWriter.write)
+    if spec[0] == "type":
+        return bibtype.lstrip("@")
+    if spec[0] == "year":
+        m = p8.search(o.get("year", ""))
+        return m.group() if m else "noyear"
+    return None
+
+def manifestname(out_file):
+    return out_file + ".manifest"
+
+class ShardWriter:
+    def __init__(self, out_file, spec, header, pipeline=0):
+        self.stem, self.ext = os.path.splitext(out_file)
+        self.spec     = spec
+        self.header   = header                      # header lines (without the file name)
+        self.pipeline = pipeline                    # see --pipeline
+        self.files    = {}                          # label ---> open file
+        self.shards   = {}                          # label ---> [name, records, bytes, first key, last key]
+        self.actual   = None                        # actual shard (size)
+
+    def open(self, label):
+        name = self.stem + "-" + label + self.ext
+        text = "% " + name + " \n" + self.header
+        f    = open(name, encoding="utf-8", mode="w")
+        if self.pipeline > 0:
+            f = PipeWriter(f, self.pipeline)
+        f.write(text)
+        self.files[label]  = f
+        self.shards[label] = [name, 0, len(text.encode("utf-8")), None, None]
+
+    def write(self, label, key, text):
+        size = len(text.encode("utf-8"))
+        if label is None:                           # next shard if the actual one would be too large
+            label = self.actual
+            if label is None or (self.shards[label][1] > 0 and
+                                 self.shards[label][2] + size > self.spec[1]):
+                label = self.actual = "%03d" % (len(self.shards) + 1)
+        if label not in self.files:
+            self.open(label)
+        self.files[label].write(text)
+        shard    = self.shards[label]
+        shard[1] = shard[1] + 1
+        shard[2] = shard[2] + size
+        if shard[3] is None or key < shard[3]:
+            shard[3] = key
+        if shard[4] is None or key > shard[4]:
+            shard[4] = key
+
+    def close(self, manifest):                      # (number of shards, number of old shards removed)
+        for f in self.files.values():
+            f.close()
+        old = oldshards(manifest, os.path.basename(self.stem) + "-", self.ext)
+        old = old - {os.path.basename(shard[0]) for shard in self.shards.values()}
+        with open(manifest, encoding="utf-8", mode="w") as f:
+            f.write("% RIS2bib shards; " + self.spec[0] + "\n")
+            for label in sorted(self.shards):
+                (name, records, size, first, last) = self.shards[label]
+                f.write("\t".join([os.path.basename(name), str(records), str(size), first, last]) + "\n")
+        folder  = os.path.dirname(manifest)
+        removed = 0
+        for name in old:
+            try:
+                os.remove(os.path.join(folder, name))
+                removed = removed + 1
+            except FileNotFoundError:
+                pass
+        return (len(self.shards), removed)
+
+def oldshards(manifest, prefix, ext):               # names of the shards <prefix>*<ext> in an existing manifest
+    try:
+        with open(manifest, encoding="utf-8") as f:
+            lines = f.read().split("\n")         # (keys may hold other line breaks)
+    except FileNotFoundError:
+        return set()
+    if lines == [] or not lines[0].startswith("% RIS2bib shards"):
+        return set()                                # (not a manifest: nothing removed)
+    names = {line.split("\t")[0] for line in lines[1:] if line != ""}
+    return {name for name in names if name == os.path.basename(name) and   # (only shards next to the manifest)
+            name.startswith(prefix) and name.endswith(ext)}
+
+# -------------------------------------------------------------
+# Parent entries for chapters and papers (--crossref)
+#
+# @inbook and @inproceedings records with the same book title, ISBN,
+# year and publisher form a group; the first one defines the parent entry
+# (@book, @proceedings), written after all other records; in the children
+# the fields equal to the parent are replaced by "crossref"; the key of a
+# parent is made from a hash of the group, so no other key changes
+#
+# the children of a group are held back until the bytes they save are
+# more than the parent entry costs; then they are written with crossref,
+# later children at once; groups which never save bytes (e.g. a single
+# chapter) get no parent entry, their children are written unchanged at
+# the end (see rest); the held records are kept in a RecordStore, which
+# is emptied whenever no child is held
+#
+# T2 of CHAP and CPAPER is mapped to subtitle (see config); it becomes
+# the title of the parent (booktitle of the children by inheritance)
+#
+# with --fields, -s only fields which are written are inherited: the book
+# title stays in the children if "title" is not written; "crossref" itself
+# is always written (see the main program)
+
+crossrefparents = {"@inbook": "@book", "@incollection": "@book", "@inproceedings": "@proceedings"}
+crossreftitles  = ["booktitle", "subtitle"]             # book title in the children
+crossreffields  = ["editor", "publisher", "location", "isbn", "series", "volume", "edition", "year"]
+
+class CrossrefGroups:
+    def __init__(self, size, used=None, written=None):  # size: (bibtype, key, record) ---> bytes written
+        self.size     = size                            # used: keys in use; None: usedkeys
+        self.used     = usedkeys if used is None else used
+        self.written  = written                         # BibTeX field ---> written?; None: all fields
+        self.groups   = {}                              # hash ---> CrossrefGroup
+        self.store    = RecordStore()                   # the held children
+        self.held     = 0                               # number of held children
+        self.children = 0                               # number of children with crossref
+        self.entries  = 0                               # number of parent entries
+        self.saved    = 0                               # bytes saved (parent entries included)
+
+    # add: a record ---> the records to be written now, [(bibtype, key,
+    # record, extra), ...]; a child is held until its group saves bytes,
+    # then the held children are given with crossref; extra is passed on
+    # (e.g. the sort key)
+
+    def add(self, bibtype, key, o, extra=None):
+        group, titlefield = self.group(bibtype, o)
+        if group is None:
+            return [(bibtype, key, o, extra)]
+        reduced, gain = self.reduce(bibtype, key, o, group, titlefield)
+        if group.parentkey is not None:                 # group with parent entry
+            self.children = self.children + 1
+            self.saved    = self.saved + gain
+            return [(bibtype, key, reduced, extra)]
+        group.held.append((self.store.add(bibtype, key, o), extra))
+        group.gain = group.gain + gain
+        self.held  = self.held + 1
+        if group.gain <= group.cost:                    # no bytes saved yet: held
+            return []
+        group.parentkey = group.key                     # parent entry written at the end
+        self.entries    = self.entries + 1
+        self.children   = self.children + len(group.held)
+        self.saved      = self.saved + group.gain - group.cost
+        ready = []
+        for (nr, extra) in group.held:
+            bibtype, key, o = self.store.record(nr)
+            ready.append((bibtype, key, self.reduce(bibtype, key, o, group, titlefield)[0], extra))
+        self.release(group)
+        return ready
+
+    def release(self, group):                           # the held children of group are given
+        self.held  = self.held - len(group.held)
+        group.held = []
+        if self.held == 0:                              # nothing held: store emptied
+            self.store = RecordStore()
+
+    def group(self, bibtype, o):                        # (CrossrefGroup, field with the book title)
+        if bibtype not in crossrefparents:              # (None, None): no child
+            return (None, None)
+        title = ""
+        for f in crossreftitles:
+            if o.get(f, "") != "":
+                title, titlefield = o[f], f
+                break
+        if title == "":
+            return (None, None)
+        import hashlib
+        group = hashlib.sha1("\x1f".join([crossrefparents[bibtype], title, o.get("isbn", ""),
+                                          o.get("year", ""), o.get("publisher", "")])
+                             .encode("utf-8")).hexdigest()
+        if group not in self.groups:
+            written = self.written or (lambda f: True)
+            parent  = {"title": title} if written("title") else {}
+            for f in crossreffields:
+                if o.get(f, "") != "" and written(f):
+                    parent[f] = o[f]
+            key = crossrefparents[bibtype].lstrip("@") + "." + group[:8]
+            nr  = 0
+            while key + ("" if nr == 0 else chr(96 + nr)) in self.used:
+                nr = nr + 1
+            key = key + ("" if nr == 0 else chr(96 + nr))
+            self.used.add(key)
+            self.groups[group] = CrossrefGroup(key, crossrefparents[bibtype], parent,
+                                               self.size(crossrefparents[bibtype], key, parent) + 1)
+        return (self.groups[group], titlefield)
+
+    def reduce(self, bibtype, key, o, group, titlefield):   # (record with crossref, bytes saved)
+        reduced, removed = {}, {}
+        for f in o:
+            value = o[f]
+            if f == titlefield and "title" in group.parent or (f in crossreffields and group.parent.get(f) == value):
+                removed[f] = value
+            else:
+                reduced[f] = value
+        reduced["crossref"] = group.key                 # removed lines - crossref line
+        return (reduced, self.size(bibtype, key, removed) - self.size(bibtype, key, {"crossref": group.key}))
+
+    def rest(self):                                     # held children of groups without parent entry
+        for group in self.groups.values():
+            for (nr, extra) in group.held:
+                yield self.store.record(nr) + (extra,)
+            self.release(group)
+
+    def parents(self):                                  # (bibtype, key, record)
+        for group in self.groups.values():
+            if group.parentkey is not None:
+                yield (group.parenttype, group.parentkey, group.parent)
+
+class CrossrefGroup:
+    def __init__(self, key, parenttype, parent, cost):
+        self.key        = key                           # key of the parent entry
+        self.parenttype = parenttype                    # @book, @proceedings
+        self.parent     = parent                        # the parent record
+        self.cost       = cost                          # bytes of the parent entry
+        self.gain       = 0                             # bytes saved by the held children
+        self.held       = []                            # [(index in the RecordStore, extra), ...]
+        self.parentkey  = None                          # key once the parent entry is written
+
+# -------------------------------------------------------------
+# Existing .bib file (--append-to)
+#
+# the file is not parsed as BibTeX; only lines "@type{key," and one-line
+# fields "field = {value}," are recognized; a record is identified by its
+# DOI, its URL or (title, year, first author); DOI and URL are compared
+# in the form written to the .bib file (see cleandoi, cleanurl); the other
+# fields are compared without the LaTeX escaping of --latex (see
+# latexunescape)
+
+identityfields = ["doi", "url", "title", "year", "author"]
+
+def alnumfold(text):
+    return p13.sub("", toascii(text).casefold())
+
+def recordidentity(o):
+    doi = cleandoi(o.get("doi", "")).lower()
+    if doi != "":
+        return "doi:" + doi
+    url = cleanurl(o.get("url", ""))
+    if url != "":
+        return "url:" + url
+    title  = alnumfold(o.get("title", ""))
+    author = alnumfold(parsename(re.split(";| and ", o.get("author", ""))[0].strip()).family)
+    if title == "" and author == "":
+        return None                                              # no identity
+    m = p8.search(o.get("year", ""))
+    return "|".join([title, m.group() if m else "", author])
+
+def scanbib(name):
+    keys       = set()
+    identities = set()
+    entry      = None
+    with open(name, encoding="utf-8-sig", errors="replace", mode="r") as f:
+        for line in f:
+            m = p11.match(line)
+            if m:
+                if entry is not None:
+                    identities.add(recordidentity(entry))
+                if m.group(1).lower() in ["comment", "string", "preamble"]:
+                    entry = None
+                else:
+                    keys.add(m.group(2))
+                    entry = {}
+            elif entry is not None:
+                m = p12.match(line)
+                if m and m.group(1).lower() in identityfields:
+                    field = m.group(1).lower()
+                    entry[field] = m.group(2) if field in verbatimfields else latexunescape(m.group(2))
+    if entry is not None:
+        identities.add(recordidentity(entry))
+    identities.discard(None)
+    return (keys, identities)
+
+def newrecords(results, identities):                             # drops lines outside of records
+    for result in results:                                       # and records already present
+        if isinstance(result, str):
+            continue
+        if recordidentity(result[1]) in identities:
+            if verbose:
+                print("--- Record", "'" + result[1].get("title", "") + "'", "already present; skipped")
+            continue
+        yield result
+
+# -------------------------------------------------------------
+# Delta between two snapshots of an export (--diff)
+#
+# the old file is indexed in one pass: hash of the identity (see
+# recordidentity; records without identity: hash of the content) --->
+# [(record number, key, hash of the content), ...]; only hashes and keys
+# are kept, not the records
+#
+# diffrecords yields the added records of the new file and the changed
+# ones with their old keys (bibtype, record, key); the entries left in
+# the index are the removed records (see diffremoved)
+
+def contenthash(bibtype, o):                        # independent of the order of the fields
+    import hashlib
+    return hashlib.sha1("\x1e".join([bibtype] + [f + "\x1f" + o[f] for f in sorted(o)])
+                        .encode("utf-8")).digest()
+
+def identityhash(o, content):
+    import hashlib
+    identity = recordidentity(o)
+    return content if identity is None else hashlib.sha1(identity.encode("utf-8")).digest()
+
+def diffindex(results, converter):                  # keys like a conversion of the old file
+    index = {}
+    nr    = 0
+    for result in results:
+        if isinstance(result, str):
+            continue
+        bibtype, o = result[0], result[1]
+        nr      = nr + 1
+        content = contenthash(bibtype, o)
+        index.setdefault(identityhash(o, content), []).append((nr, converter.recordkey(o), content))
+    return index
+
+def diffrecords(results, index, counts):            # drops lines outside of records
+    for result in results:                          # and unchanged records
+        if isinstance(result, str):
+            continue
+        bibtype, o = result[0], result[1]
+        content  = contenthash(bibtype, o)
+        identity = identityhash(o, content)
+        old      = index.get(identity)
+        if not old:
+            counts["added"] = counts["added"] + 1
+            yield (bibtype, o)
+            continue
+        match = next((entry for entry in old if entry[2] == content), old[0])
+        old.remove(match)
+        if not old:
+            del index[identity]
+        if match[2] == content:
+            counts["unchanged"] = counts["unchanged"] + 1
+        else:
+            counts["changed"] = counts["changed"] + 1
+            yield (bibtype, o, match[1])                             # old key
+
+def diffremoved(index):                             # keys of the removed records (old order)
+    return [key for (nr, key, content) in sorted(entry for old in index.values() for entry in old)]
+
+def removedname(out_file):
+    return out_file + ".removed"
+
+# -------------------------------------------------------------
+# Full-text index (--fulltext, --search)
+#
+# <out_file>.fts is a SQLite database: a contentless FTS5 table with the
+# words of the fields in fulltextfields (accents removed, case folded)
+# and a table rowid ---> key; the records are added when their keys are
+# generated (hook on_key), in batches of fulltextbatch records; with
+# extend (--append-to) an existing index is kept and continued
+#
+# query: FTS5 syntax, e.g. "latex fonts" (both words), "title:tikz",
+#        "font*", "biblatex OR biber", "\"new font\""
+
+fulltextfields = ["title", "abstract", "keywords", "author"]
+fulltextbatch  = 1000                               # records per INSERT
+
+def fulltextname(out_file):
+    return out_file + ".fts"
+
+class FullTextIndex:
+    def __init__(self, name, registry=None, extend=False):   # ValueError: SQLite without FTS5
+        import sqlite3
+        if os.path.exists(name) and not extend:
+            os.remove(name)
+        present = os.path.exists(name)
+        self.db = sqlite3.connect(name)
+        try:
+            self.db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS words USING fts5(" + ", ".join(fulltextfields) +
+                            ", content='', tokenize='unicode61 remove_diacritics 2')")
+        except sqlite3.OperationalError as e:
+            self.db.close()
+            if not present:
+                os.remove(name)
+            raise ValueError(str(e))
+        self.db.execute("CREATE TABLE IF NOT EXISTS keys (id INTEGER PRIMARY KEY, key TEXT)")
+        self.rows  = []                             # (id, key, fields ...)
+        self.count = self.db.execute("SELECT COALESCE(MAX(id), 0) FROM keys").fetchone()[0]
+        addhook("on_key", self.keyed, registry)
+
+    def keyed(self, key, o):
+        self.rows.append((len(self.rows) + self.count + 1, key) + tuple(o.get(f, "") for f in fulltextfields))
+        if len(self.rows) >= fulltextbatch:
+            self.flush()
+
+    def flush(self):
+        self.db.executemany("INSERT INTO keys VALUES (?, ?)", [row[:2] for row in self.rows])
+        self.db.executemany("INSERT INTO words (rowid, " + ", ".join(fulltextfields) + ") VALUES (?" +
+                            ", ?" * len(fulltextfields) + ")", [row[:1] + row[2:] for row in self.rows])
+        self.count = self.count + len(self.rows)
+        self.rows  = []
+
+    def close(self):                                # number of records
+        self.flush()
+        self.db.execute("INSERT INTO words (words) VALUES ('optimize')")   # one compact b-tree
+        self.db.commit()
+        self.db.close()
+        return self.count
+
+def searchindex(name, query):                       # keys, best matches first
+    import sqlite3                                  # FileNotFoundError, ValueError: bad query
+    if not os.path.exists(name):
+        raise FileNotFoundError(name)
+    db = sqlite3.connect("file:" + name + "?mode=ro", uri=True)
+    try:
+        return [row[0] for row in db.execute("SELECT keys.key FROM words JOIN keys ON keys.id = words.rowid "
+                                             "WHERE words MATCH ? ORDER BY rank", (query,))]
+    except sqlite3.OperationalError as e:
+        raise ValueError(str(e))
+    finally:
+        db.close()
+
+# -------------------------------------------------------------
+# Atomic output and checkpoints (--checkpoint, --resume)
+#
+# the .bib file is written as <out_file>.part and renamed to <out_file>
+# when the conversion is complete (see commitoutput); an interrupted
+# conversion leaves an existing <out_file> untouched; without checkpoints
+# an aborted conversion (exception, sys.exit) removes <out_file>.part
+# (see discardoutput); an <out_file> which is not a regular file (symbolic
+# link, device such as /dev/stdout, pipe) is written in place (see
+# atomicoutput; not possible with --checkpoint, --resume)
+#
+# <out_file>.checkpoint (JSON) is rewritten after a written record, at
+# most every interval seconds (the clock is read only every 64 records):
+# input file (size, mtime), byte offset and number of the next line,
+# number and length of the generated keys (see below), length of
+# <out_file>.part; the output is synced before each checkpoint and once
+# at the end (no fsync per record), so that a checkpoint never points
+# behind the data on disk
+#
+# <out_file>.checkpoint.keys: the generated keys, one JSON list per line;
+# a checkpoint appends only the keys generated since the last one
+#
+# --resume: <out_file>.part and <out_file>.checkpoint.keys are cut to the
+# lengths in the checkpoint and the memory-mapped input is parsed from
+# the offset in the checkpoint; a <out_file>.checkpoint.tmp left by a
+# killed save is removed
+
+def partname(out_file):
+    return out_file + ".part"
+
+def checkpointname(out_file):
+    return out_file + ".checkpoint"
+
+def checkpointkeysname(out_file):
+    return checkpointname(out_file) + ".keys"
+
+def atomicoutput(out_file):                         # written as <out_file>.part?
+    try:
+        return stat.S_ISREG(os.lstat(out_file).st_mode)
+    except FileNotFoundError:
+        return True
+
+def removestale(name):                              # left by a killed save
+    if os.path.exists(name + ".tmp"):
+        os.remove(name + ".tmp")
+
+def inputstamp(in_file):                            # [size, mtime]
+    info = os.stat(in_file)
+    return [info.st_size, info.st_mtime_ns]
+
+class Checkpoint:
+    def __init__(self, name, in_file, buf, state, converter, out, interval=checkpointinterval, restart=None):
+        self.name      = name
+        self.in_file   = in_file
+        self.stamp     = inputstamp(in_file)
+        self.buf       = buf
+        self.state     = state
+        self.converter = converter
+        self.out       = out
+        self.interval  = interval
+        self.records   = 0
+        self.last      = time.perf_counter()
+        removestale(name)
+        if restart is None:                         # keys written so far
+            self.keys    = 0
+            self.keyfile = open(name + ".keys", encoding="utf-8", mode="w")
+        else:
+            self.keys    = len(restart["keys"])
+            os.truncate(name + ".keys", restart["keysize"])
+            self.keyfile = open(name + ".keys", encoding="utf-8", mode="a")
+        addhook("on_record_written", self.written, converter.hooks)
+
+    def written(self, key, text):
+        self.records = self.records + 1
+        if self.records % 64 == 0:
+            now = time.perf_counter()
+            if now - self.last >= self.interval:
+                self.last = now
+                self.save()
+
+    def save(self):
+        import json
+        self.out.flush()
+        os.fsync(self.out.fileno())
+        keys = self.converter.allrecordkeys
+        self.keyfile.write("".join(json.dumps(key) + "\n" for key in keys[self.keys:]))
+        self.keyfile.flush()
+        os.fsync(self.keyfile.fileno())
+        self.keys = len(keys)
+        end = self.state["recordend"]               # end of the last record
+        m   = p9.match(self.buf, end)
+        data = {"input" : os.path.abspath(self.in_file),
+                "stamp" : self.stamp,
+                "offset": m.end() if m else end,    # next line
+                "line"  : self.state["linenr"],
+                "output": os.fstat(self.out.fileno()).st_size,
+                "keys"  : self.keys,
+                "keysize": self.keyfile.tell()}
+        with open(self.name + ".tmp", encoding="utf-8", mode="w") as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(self.name + ".tmp", self.name)   # readers never see a half file
+
+    def close(self):
+        self.keyfile.close()
+
+def readcheckpoint(out_file, in_file):              # None: no checkpoint; ValueError: not usable
+    import json
+    removestale(checkpointname(out_file))
+    try:
+        with open(checkpointname(out_file), encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    if data["input"] != os.path.abspath(in_file) or data["stamp"] != inputstamp(in_file):
+        raise ValueError("checkpoint " + checkpointname(out_file) + " does not belong to " + in_file)
+    if not os.path.exists(partname(out_file)) or os.path.getsize(partname(out_file)) < data["output"]:
+        raise ValueError(partname(out_file) + " is missing or shorter than in " + checkpointname(out_file))
+    try:
+        with open(checkpointkeysname(out_file), mode="rb") as f:
+            lines = f.read(data["keysize"]).decode("utf-8").splitlines()
+    except FileNotFoundError:
+        lines = []
+    if len(lines) != data["keys"]:
+        raise ValueError(checkpointkeysname(out_file) + " is missing or shorter than in " + checkpointname(out_file))
+    data["keys"] = [json.loads(line) for line in lines]
+    return data
+
+def resumekeys(converter, keys):                    # generated keys of a checkpoint
+    for (stem, year, letter) in keys:
+        converter.allrecordkeys.append((stem, year, letter))
+        converter.usedkeys.add(stem + "." + year + letter)
+
+def commitoutput(out_file, out, atomic=True):       # out closed; <out_file>.part ---> <out_file>
+    out.flush()
+    try:
+        os.fsync(out.fileno())                      # the data before the rename
+    except OSError:                                 # not a file (terminal, pipe)
+        pass
+    out.close()
+    if not atomic:                                  # written in place (see atomicoutput)
+        return
+    os.replace(partname(out_file), out_file)
+    if os.name == "posix":                          # the rename itself
+        folder = os.open(os.path.dirname(os.path.abspath(out_file)), os.O_RDONLY)
+        try:
+            os.fsync(folder)
+        finally:
+            os.close(folder)
+    for name in (checkpointname(out_file), checkpointkeysname(out_file), checkpointname(out_file) + ".tmp"):
+        if os.path.exists(name):                    # no longer needed
+            os.remove(name)
+
+def discardoutput(out_file):                        # at exit: <out_file>.part of an aborted conversion
+    try:
+        os.remove(partname(out_file))
+    except OSError:                                 # renamed (see commitoutput) or still open
+        pass
+
+# -------------------------------------------------------------
+# Key for a result of the parser; a key from the index (--extract,
+# --sample) or from the old file (--diff) is reused
+#
+# used, keys, extracted, registry: see Converter; None: module-wide
+
+def resultkey(result, used=None, keys=None, extracted=None, registry=None):
+    if registry is None:
+        registry = hooks
+    if len(result) > 2:                                          # (bibtype, record, key)
+        (extractedkeys if extracted is None else extracted).append(result[2])
+        key = result[2]
+    else:
+        key = recordkey(result[1], used, keys)
+    if registry["on_key"]:
+        callhooks("on_key", key, result[1], registry=registry)
+    return key
+
+# -------------------------------------------------------------
+# Converter: all state of one conversion (keys, hooks, transformers,
+# corrections) in one object, on a compiled conversion table shared by
+# all converters; several converters can work at the same time, e.g.
+# in the threads of a pool; the transformers are copied when a converter
+# is created (a later module-wide addtransformer does not change it)
+#
+# correction_file: file with additional conversion rules (see correct)
+# table          : compiled conversion table; None: compiled from config
+#
+#     converter = Converter("trans.py")
+#     with open("inp.ris", encoding="utf-8") as f:
+#         for result in converter.parselines(f):
+#             if not isinstance(result, str):
+#                 text = converter.renderrecord(result[0], converter.resultkey(result), result[1])
+
+class Converter:
+    def __init__(self, correction_file="", table=None):
+        self.config        = ConfigOverlay(config.compile() if table is None else table)
+        self.usedkeys      = set()                      # all keys in use
+        self.allrecordkeys = []                         # all generated keys
+        self.extractedkeys = []                         # keys taken from the index
+        self.hooks         = {name: [] for name in hooks}
+        self.transformers  = {f: list(funcs) for (f, funcs) in transformers.items()}   # snapshot
+        self.added         = {f: list(funcs) for (f, funcs) in addedtransformers.items()}
+        self.fieldchains   = dict(fieldchains)
+        self.decodefallbacks = {"bytes": 0}             # bytes read by the error handler (see counted)
+        if correction_file != "":
+            self.correct(correction_file)
+
+    # a correction file is executed line by line; config, addtransformer
+    # and addhook refer to this converter (OSError: file not readable)
+
+    def correct(self, correction_file):
+        names = dict(globals())
+        names.update(config=self.config, addtransformer=self.addtransformer,
+                     addhook=self.addhook, converter=self)
+        with open(correction_file, encoding="utf-8-sig", mode="r") as ini:
+            for ff in ini:
+                exec(ff, names)
+
+    def addhook(self, name, func):
+        addhook(name, func, self.hooks)
+
+    def addtransformer(self, field, func):              # the module-wide transformers stay unchanged
+        self.added[field] = self.added.get(field, []) + [func]
+        self.fieldchains  = compilechains(self.transformers, self.added)
+
+    def newstate(self, skip=(), fields=None, where="", pool=None):
+        return newstate(skip, fields, where, pool, self.config.compile(), self.hooks, self.decodefallbacks)
+
+    def parselines(self, lines, state=None):
+        return parselines(lines, self.newstate() if state is None else state)
+
+    def parsebuffer(self, buf, state=None, encoding="utf-8", offset=0):
+        return parsebuffer(buf, self.newstate() if state is None else state, encoding, offset)
+
+    def recordkey(self, o):
+        return recordkey(o, self.usedkeys, self.allrecordkeys)
+
+    def resultkey(self, result):
+        return resultkey(result, self.usedkeys, self.allrecordkeys, self.extractedkeys, self.hooks)
+
+    def renderrecord(self, bibtype, key, o, skip=(), fields=None, latex=""):
+        return renderrecord(bibtype, key, o, skip, fields, latex, self.fieldchains)
+
+    def renderbatch(self, keyed, skip=(), fields=None, latex=""):
+        return renderbatch(keyed, skip, fields, latex, self.fieldchains)
+
+# -------------------------------------------------------------
+# Profiles (--profile): CPU profile in pstats format, the largest
+# memory allocations as text
+
+def startprofile(mode):
+    profiler = None
+    if mode in ["cpu", "both"]:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    if mode in ["mem", "both"]:
+        import tracemalloc
+        tracemalloc.start()
+    return profiler
+
+def stopprofile(mode, profiler, name):
+    written = []
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(name + ".prof")                      # see pstats.Stats
+        written.append(name + ".prof")
+    if mode in ["mem", "both"]:
+        import tracemalloc
+        snapshot      = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        with open(name + ".mem", encoding="utf-8", mode="w") as f:
+            f.write("% memory: " + str(current // 1024) + " KiB; peak: " + str(peak // 1024) + " KiB\n")
+            for stat in snapshot.statistics("lineno")[:profiletop]:
+                f.write(str(stat) + "\n")
+        written.append(name + ".mem")
+    return written
+
+
+# =============================================================
+# Asynchronous interface
+#
+# for embedding in asyncio applications, e.g.
+#
+#     async for (bibtype, onerecord) in aparse(reader):
+#         ...
+#
+#     text = await arender(entries, executor)
+
+# -------------------------------------------------------------
+# Converter of one call of aparse or arender without converter: own keys
+# (not the module-wide ones), the module-wide hooks and transformers
+
+def callconverter():
+    converter = Converter()
+    converter.hooks = {name: list(funcs) for (name, funcs) in hooks.items()}
+    return converter
+
+# -------------------------------------------------------------
+# Incremental parsing of an asyncio.StreamReader or an
+# asynchronous iterator of byte chunks
+#
+# source   : object with an awaitable read(n) or an async iterable of bytes
+# keeptext : Flag: yield also the lines outside of records (as strings)
+# chunksize: number of bytes requested per read
+# encoding : encoding of the input; None: guessed from the first chunk
+# state    : parser state, e.g. with field sets and conditions (see Converter.newstate)
+# converter: conversion table and hooks (see Converter); None: a new converter for this call
+
+async def aparse(source, keeptext=False, chunksize=65536, encoding=None, state=None, converter=None):
+    import asyncio
+    decoder = None
+    if state is None:
+        state = (callconverter() if converter is None else converter).newstate()
+    context = contextvars.copy_context()                     # decoding errors counted in the state
+    context.run(decodecounts.set, state["counts"])
+    pending = ""
+    head    = b""                                            # chunks before the decoder
+
+    if hasattr(source, "read"):                              # asyncio.StreamReader and similar
+        async def chunks():
+            while True:
+                chunk = await source.read(chunksize)
+                if not chunk:
+                    break
+                yield chunk
+        stream = chunks()
+    else:                                                    # asynchronous byte iterator
+        stream = source
+
+    final = False
+    while not final:
+        try:
+            chunk = await stream.__anext__()
+        except StopAsyncIteration:
+            chunk = b""
+            final = True
+        if decoder is None:                                  # first chunks
+            head = head + bytes(chunk)
+            if encoding is None and len(head) < sniffsize and not final:
+                continue                                     # sniff as much as openinput
+            if encoding is None:
+                encoding = sniffencoding(head[:sniffsize])
+            decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(decodeerrors), True)
+            chunk, head = head, b""
+        text = context.run(decoder.decode, chunk, final)
+        lines   = (pending + text).split("\n")
+        pending = lines.pop()                                # incomplete last line
+        if final and pending != "":
+            lines.append(pending)
+        for line in lines:
+            result = parseline(state, line)
+            if result is None:
+                continue
+            if isinstance(result, str):
+                if keeptext:
+                    yield result
+                continue
+            yield result
+            await asyncio.sleep(0)                           # yield control between records
+
+# -------------------------------------------------------------
+# Rendering of a batch of records in an executor
+#
+# entries  : list of (bibtype, onerecord) as yielded by aparse
+# executor : concurrent.futures executor; None: default executor of the loop
+#
+# converter: keys, hooks and transformers of this converter (see Converter);
+#            None: a new converter for this call (keys are unique within the call only)
+#
+# the keys are generated in input order before the rendering is handed over
+# (with resultkey, i.e. with the "on_key" hooks as in the other paths)
+
+async def arender(entries, executor=None, skip=(), fields=None, latex="", converter=None):
+    import asyncio
+    if converter is None:                                    # no module-wide keys (they would grow
+        converter = callconverter()                          # with every call of a long-running service)
+    keyed  = [(result[0], converter.resultkey(result), result[1]) for result in entries]
+    chains = converter.fieldchains
+    loop  = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, renderbatch, keyed, skip, fields, latex, chains)
+
+
+# =============================================================
+# The Process
+
+if __name__ == "__main__":
+
+    # -------------------------------------------------------------
+    # Parsing the arguments
+
+    import argparse                                              # argument parsing
+    parser = argparse.ArgumentParser(prog        = programname,          # (not RIS2bibcore.py)
+                                     description = program_text + " [" + programname + "; " +
+                                     "Version: " + programversion + " (" + programdate + ")]")
+    parser._positionals.title = 'Positional parameters'
+    parser._optionals.title   = 'Optional parameters'
+
+    def atleastone(text):                                        # integer >= 1 (--sort-memory)
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError("invalid int value: '" + text + "'")
+        if value < 1:
+            raise argparse.ArgumentTypeError("must be at least 1: '" + text + "'")
+        return value
+
+    parser.add_argument(help    = in_text + "; Default: " + "%(default)s",
+                        dest    = "in_file",
+                        default = in_default)
+
+    parser.add_argument("-a", "--author",
+                        help    = author_text,
+                        action  = 'version',
+                        version = programauthor + " (" + authoremail + ", " +
+                        authorinstitution + ")")
+
+    parser.add_argument("-o", "--output",
+                        help    = out_text + "; Default: " + "%(default)s",
+                        dest    = "out_file",
+                        default = out_default)
+
+    parser.add_argument("-c", "--correction",
+                        help    = correction_text + "; Default: " + "%(default)s",
+                        dest    = "correction_file",
+                        default = correction_default)
+
+    parser.add_argument("--encoding",
+                        help    = encoding_text,
+                        dest    = "encoding",
+                        default = encoding_default)
+
+    parser.add_argument("-s", "--skip",
+                        help    = skip_text + "; Default: " + "%(default)s",
+                        dest    = "skip",
+                        default = skip_default)
+
+    parser.add_argument("--latex",
+                        help    = latex_text + "; Default: " + "%(default)s",
+                        dest    = "latex",
+                        choices = ["special", "ascii"],
+                        default = latex_default)
+
+    parser.add_argument("--fields",
+                        help    = fields_text + "; Default: " + "%(default)s",
+                        dest    = "fields",
+                        default = fields_default)
+
+    parser.add_argument("--where",
+                        help    = where_text + "; Default: " + "%(default)s",
+                        dest    = "where",
+                        default = where_default)
+
+    parser.add_argument("--sort-by",
+                        help    = sortby_text + "; Default: " + "%(default)s",
+                        dest    = "sortby",
+                        default = sortby_default)
+
+    parser.add_argument("--sort-memory",
+                        help    = sortmem_text + "; Default: " + "%(default)s",
+                        dest    = "sortmemory",
+                        type    = atleastone,
+                        default = sortmem_default)
+
+    parser.add_argument("--append-to",
+                        help    = append_text + "; Default: " + "%(default)s",
+                        dest    = "append_file",
+                        default = append_default)
+
+    parser.add_argument("--index",
+                        help    = index_text + "; Default: " + "%(default)s",
+                        dest    = "makeindex",
+                        action  = "store_true",
+                        default = makeindex)
+
+    parser.add_argument("--check",
+                        help    = check_text + "; Default: " + "%(default)s",
+                        dest    = "check",
+                        action  = "store_true",
+                        default = check_default)
+
+    parser.add_argument("--extract",
+                        help    = extract_text + "; Default: " + "%(default)s",
+                        dest    = "extract",
+                        default = extract_default)
+
+    parser.add_argument("--sample",
+                        help    = sample_text + "; Default: " + "%(default)s",
+                        dest    = "sample",
+                        type    = int,
+                        default = sample_default)
+
+    parser.add_argument("--seed",
+                        help    = seed_text + "; Default: " + "%(default)s",
+                        dest    = "seed",
+                        type    = int,
+                        default = seed_default)
+
+    parser.add_argument("--profile",
+                        help    = profile_text + "; Default: " + "%(default)s",
+                        dest    = "profile",
+                        choices = ["cpu", "mem", "both"],
+                        default = profile_default)
+
+    parser.add_argument("--slow-records",
+                        help    = slow_text + "; Default: " + "%(default)s",
+                        dest    = "slow",
+                        type    = float,
+                        default = slow_default)
+
+    parser.add_argument("--pipeline",
+                        help    = pipeline_text + "; Default: " + "%(default)s",
+                        dest    = "pipeline",
+                        type    = int,
+                        default = pipeline_default)
+
+    parser.add_argument("--shard-by",
+                        help    = shardby_text + "; Default: " + "%(default)s",
+                        dest    = "shardby",
+                        default = shardby_default)
+
+    parser.add_argument("--progress",
+                        help    = progress_text + "; Default: " + "%(default)s",
+                        dest    = "progress",
+                        nargs   = "?",
+                        const   = "-",
+                        default = progress_default)
+
+    parser.add_argument("--diff",
+                        help    = diff_text + "; Default: " + "%(default)s",
+                        dest    = "diff_file",
+                        default = diff_default)
+
+    parser.add_argument("--fulltext",
+                        help    = fulltext_text + "; Default: " + "%(default)s",
+                        dest    = "fulltext",
+                        action  = "store_true",
+                        default = fulltext_default)
+
+    parser.add_argument("--search",
+                        help    = search_text + "; Default: " + "%(default)s",
+                        dest    = "search",
+                        default = search_default)
+
+    parser.add_argument("--checkpoint",
+                        help    = checkpoint_text + "; Default: " + "%(default)s",
+                        dest    = "checkpoint",
+                        type    = float,
+                        default = checkpoint_default)
+
+    parser.add_argument("--resume",
+                        help    = resume_text + "; Default: " + "%(default)s",
+                        dest    = "resume",
+                        action  = "store_true",
+                        default = resume_default)
+
+    parser.add_argument("--crossref",
+                        help    = crossref_text + "; Default: " + "%(default)s",
+                        dest    = "crossref",
+                        action  = "store_true",
+                        default = crossref_default)
+
+    parser.add_argument("-v", "--verbose",
+                        help = verbose_text + "; Default: " + "%(default)s",
+                        action = "store_true",
+                        default = verbose)
+
+    parser.add_argument("-b", "--bibtexkeys",
+                        help = bibtex_text + "; Default: " + "%(default)s",
+                        action = "store_true",
+                        default = bibtexkeys)
+
+    parser.add_argument("-m", "--mmap",
+                        help = mmap_text + "; Default: " + "%(default)s",
+                        dest = "mmapped",
+                        action = "store_true",
+                        default = mmapped)
+
+    parser.add_argument("-V", "--version",
+                        help    = version_text,
+                        action  = 'version',
+                        version = '%(prog)s ' + programversion + " (" + programdate + ")")
+
+    args            = parser.parse_args()   # get all arguments
+    out_file        = args.out_file         # name of the output file
+    in_file         = args.in_file          # name of the input file
+    correction_file = args.correction_file  # name of the file with the additional conversion rules
+    verbose         = args.verbose          # Flag: verbose output
+    bibtexkeys      = args.bibtexkeys       # Flag: output the generated BibTeX keys
+    mmapped         = args.mmapped          # Flag: memory-mapped input, record by record
+    encoding        = args.encoding         # encoding of the input file ("": guessed)
+    latex           = args.latex            # LaTeX escaping of the field values
+    skip            = args.skip             # BibTeX keys to be skipped
+    fields          = args.fields           # BibTeX fields to be written
+    where           = args.where            # conditions for records
+    sortby          = args.sortby           # sort criteria
+    sortmemory      = args.sortmemory       # memory for a sorted run (MB)
+    makeindex       = args.makeindex        # Flag: build the index file
+    check           = args.check            # Flag: only check the input file
+    append_file     = args.append_file      # name of an existing .bib file to be extended
+    extract         = args.extract          # records to be extracted
+    sample          = args.sample           # size of a random sample
+    seed            = args.seed             # seed for the random sample
+    profile         = args.profile          # kind of profile
+    slow            = args.slow             # threshold for slow records (ms)
+    pipeline        = args.pipeline         # depth of the queues of the threaded pipeline
+    shardby         = args.shardby          # kind of shards
+    progress        = args.progress         # target of the progress report ("-": stderr)
+    crossref        = args.crossref         # Flag: parent entries with crossref
+    diff_file       = args.diff_file        # name of an older snapshot of the input file
+    fulltext        = args.fulltext         # Flag: write a full-text index
+    search          = args.search           # query for the full-text index of in_file
+    checkpoint      = args.checkpoint       # seconds between two checkpoints (0: none)
+    resume          = args.resume           # Flag: continue from the last checkpoint
+
+    if search != "":                                             # --search: no conversion
+        start = time.perf_counter()
+        try:
+            keys = searchindex(fulltextname(in_file), search)
+        except FileNotFoundError:
+            sys.exit("--- --search: full-text index " + fulltextname(in_file) + " not found; program terminated")
+        except ValueError as e:
+            sys.exit("--- --search: " + str(e) + "; program terminated")
+        for key in keys:
+            print(key)
+        if verbose:
+            print("---", len(keys), "records found in", "%.1f" % ((time.perf_counter() - start) * 1000), "ms")
+        sys.exit(0 if keys else 1)
+
+    profiler  = startprofile(profile)                            # --profile
+    converter = Converter()                                      # keys, hooks, corrections of this run
+    decodecounts.set(converter.decodefallbacks)                  # decoding errors of this run
+    if correction_file != "":                                    # open correction file
+        try:
+            converter.correct(correction_file)
+            if verbose:
+                print("--- File", correction_file, "with additional conversion rules read")
+        except IOError:
+            if verbose:
+                print("--- Correction file", correction_file,  "could not be opened")
+    slowlog   = SlowLog(slow / 1000, converter.hooks) if slow > 0 else None   # --slow-records
+
+    skipset   = fieldset(skip)                                   # BibTeX fields to be skipped (set)
+    fieldsset = fieldset(fields) if fields != "" else None       # BibTeX fields to be written (set)
+    try:
+        state = converter.newstate(skipset, fieldsset, where)    # parser state
+    except ValueError as e:
+        sys.exit("--- --where: " + str(e) + "; program terminated")
+    try:
+        sortby = compilesort(sortby)                             # list of sort criteria
+    except ValueError as e:
+        sys.exit("--- --sort-by: " + str(e) + "; program terminated")
+    if diff_file != "" and append_file != "":
+        sys.exit("--- --diff not possible with --append-to; program terminated")
+    if crossref and (shardby != "" or append_file != ""):
+        sys.exit("--- --crossref not possible with --shard-by, --append-to; program terminated")
+    shardspec = None
+    if shardby != "":
+        if append_file != "":
+            sys.exit("--- --shard-by not possible with --append-to; program terminated")
+        try:
+            shardspec = compileshard(shardby)                    # (mode, bytes per shard)
+        except ValueError as e:
+            sys.exit("--- --shard-by: " + str(e) + "; program terminated")
+    if checkpoint > 0 or resume:                                 # --checkpoint, --resume
+        if (sortby != [] or shardby != "" or append_file != "" or crossref or diff_file != "" or
+                extract != "" or sample > 0 or fulltext or pipeline > 0):
+            sys.exit("--- --checkpoint, --resume not possible with --sort-by, --shard-by, --append-to, "
+                     "--crossref, --diff, --extract, --sample, --fulltext, --pipeline; program terminated")
+        mmapped = True                                           # byte offsets of the records
+        if checkpoint <= 0:
+            checkpoint = checkpointinterval
+    atomic = atomicoutput(out_file)                              # written as <out_file>.part
+    if (checkpoint > 0 or resume) and not atomic:
+        sys.exit("--- --checkpoint, --resume: " + out_file + " is not a regular file; program terminated")
+
+    # -------------------------------------------------------------
+    # Open the files
+
+    try:                                                         # open input file
+        if mmapped or makeindex or check or extract != "" or sample > 0:
+            inp = mapfile(in_file)
+            if encoding == "":
+                encoding = sniffencoding(inp[:sniffsize])
+        else:
+            inp, encoding = openinput(in_file, encoding)
+    except FileNotFoundError:
+        if verbose:
+            print("--- input file", in_file,  "could not be opened; program terminated")
+        sys.exit("--- program is terminated")
+    except LookupError:
+        sys.exit("--- --encoding: unknown encoding " + encoding + "; program terminated")
+    if isinstance(inp, (bytes, mmap.mmap)):
+        try:
+            if not bytewise(encoding) and not check:
+                sys.exit("--- encoding " + encoding + " not possible with -m, --index, --extract, --sample, --checkpoint, --resume; program terminated")
+        except LookupError:
+            sys.exit("--- --encoding: unknown encoding " + encoding + "; program terminated")
+    if verbose and encoding not in ["utf-8", "utf-8-sig"]:
+        print("--- Input file", in_file, "read with encoding", encoding)
+
+    # -------------------------------------------------------------
+    # Only the structure of the input file (--check); exit code 1 if
+    # there are problems
+
+    if check:
+        buf = inp if bytewise(encoding) else codecs.decode(inp[:], encoding, decodeerrors).encode("utf-8")
+        records, problems = checkbuffer(buf, converter.config.compile())
+        for (line, problem) in problems:
+            print("--- Line", str(line) + ":", problem)
+        print("--- Check:", in_file + ";", records, "records;", len(problems), "problems")
+        if inp:
+            inp.close()
+        stopprofile(profile, profiler, out_file)
+        sys.exit(1 if problems else 0)
+
+    # -------------------------------------------------------------
+    # Index file (--index, --extract, --sample)
+
+    if makeindex or extract != "" or sample > 0:
+        idx_file = indexname(in_file)
+        if makeindex or not indexcurrent(in_file, idx_file):
+            nr = buildindex(in_file, idx_file, encoding,         # keys of the index run are not used
+                            Converter(table=converter.config.compile()))
+            if verbose:
+                print("--- Index file", idx_file, "with", nr, "records written")
+        if makeindex:
+            if inp:
+                inp.close()
+            for name in stopprofile(profile, profiler, out_file):   # <out_file>.prof as documented
+                if verbose:
+                    print("--- Profile", name, "written")
+            sys.exit()
+        rows = readindex(idx_file)
+        if extract != "":
+            rows = selectindex(rows, extract)
+        if sample > 0:
+            rows = samplerows(rows, sample, seed)
+
+    if diff_file != "":                                          # older snapshot (--diff)
+        oldconverter = Converter(table=converter.config.compile())
+        try:
+            old, oldencoding = openinput(diff_file, args.encoding)
+        except FileNotFoundError:
+            sys.exit("--- --diff: input file " + diff_file + " could not be opened; program terminated")
+        index = diffindex(oldconverter.parselines(old, oldconverter.newstate(skipset, fieldsset, where)),
+                          oldconverter)
+        old.close()
+        converter.usedkeys.update(oldconverter.usedkeys)         # keys of added records stay unique
+        diffcounts = {"added": 0, "changed": 0, "unchanged": 0}
+        if verbose:
+            print("--- File", diff_file, "with", len(oldconverter.allrecordkeys), "records indexed")
+
+    restart = None                                               # last checkpoint (--resume)
+    if resume:
+        try:
+            restart = readcheckpoint(out_file, in_file)
+        except ValueError as e:
+            sys.exit("--- --resume: " + str(e) + "; program terminated")
+        if restart is None:
+            print("--- --resume: no checkpoint", checkpointname(out_file) + "; conversion from the beginning")
+
+    if append_file != "":                                        # existing .bib file (--append-to)
+        try:
+            presentkeys, identities = scanbib(append_file)
+        except FileNotFoundError:
+            presentkeys, identities = set(), set()
+        converter.usedkeys.update(presentkeys)                   # keys stay unique
+        if verbose:
+            print("--- File", append_file, "with", len(presentkeys), "records scanned")
+        out_file = append_file
+        try:
+            with open(append_file, mode="rb") as f:              # complete the last line
+                f.seek(0, 2)
+                if f.tell() > 0:
+                    f.seek(-1, 2)
+                    lastline = f.read(1) == b"\n"
+                else:
+                    lastline = True
+        except FileNotFoundError:
+            lastline = True
+        out  = open(out_file, encoding="utf-8", mode="a")        # open output file
+        if not lastline:
+            out.write("\n")
+    elif restart is not None:                                    # continued output file (--resume)
+        os.truncate(partname(out_file), restart["output"])
+        out  = open(partname(out_file), encoding="utf-8", mode="a")
+        resumekeys(converter, restart["keys"])                   # keys stay unique
+        state["linenr"] = restart["line"]
+        print("--- Resumed from", checkpointname(out_file), "at line", restart["line"] + 1,
+              "(" + str(len(restart["keys"])) + " records converted)")
+    elif shardspec is None and not atomic:                       # open output file in place
+        out  = open(out_file, encoding="utf-8", mode="w")
+    elif shardspec is None:
+        out  = open(partname(out_file), encoding="utf-8", mode="w")   # open output file (see commitoutput)
+        if checkpoint <= 0:                                      # kept for --resume otherwise
+            import atexit
+            atexit.register(discardoutput, out_file)
+    if pipeline > 0 and shardspec is None:
+        out  = PipeWriter(out, pipeline)                         # writer thread
+
+    # -------------------------------------------------------------
+    # Loop
+
+    # result   : a line outside of a record or a completed record (see parseline)
+    # bibtype  : actual BibTeX type
+    # onerecord: the actual content of a BibTeX record
+    # converter: keys, hooks, corrected conversion table (see Converter)
+    # verbose  : Flag: verbose output
+    # skip     : BibTeX items to be skipped
+
+    header = ("% generated by " + programname + " (version: "  + programversion +
+              " of " + programdate + ")\n")
+    header = header + "% Date          : " + actDate + "; Time: " + actTime + "\n"
+    header = header + "% Input file    : " + in_file + "\n"
+    if encoding not in ["utf-8", "utf-8-sig"]:
+        header = header + "% Input encoding: " + encoding + "\n"
+    if skip != "":
+        header = header + "% skipped fields: " + skip + "\n"
+    if fields != "":
+        header = header + "% written fields: " + fields + "\n"
+    if where != "":
+        header = header + "% selection     : " + where + "\n"
+    if latex != "":
+        header = header + "% LaTeX escaping: " + latex + "\n"
+    if sortby != []:
+        header = header + "% sorted by     : " + ",".join(sortby) + "\n"
+    if extract != "":
+        header = header + "% extracted     : " + extract + "\n"
+    if sample > 0:
+        header = header + ("% sample        : " + str(sample) + " records" +
+                           ("" if seed is None else "; seed " + str(seed)) + "\n")
+    if shardspec is not None:
+        header = header + "% sharded by    : " + shardby + "\n"
+    if crossref:
+        header = header + "% crossref      : parent entries at the end\n"
+    if diff_file != "":
+        header = header + "% changes since : " + diff_file + " (added and changed records)\n"
+    header = header + "% Program Call  : " + programname + arguments + "\n\n"
+
+    if shardspec is None:
+        if restart is None:                                      # (already in <out_file>.part)
+            out.write("% " + out_file + " \n")
+            out.write(header)
+        shards = None
+    else:                                                        # one header per shard
+        out    = None
+        shards = ShardWriter(out_file, shardspec, header, pipeline)
+
+    if verbose:
+        print("- Program call:", programname + arguments)
+
+    if extract != "" or sample > 0:
+        results = extractrecords(in_file, rows, state, encoding) # only the selected records
+    elif mmapped:                                                # record by record
+        results = parsebuffer(inp, state, encoding, 0 if restart is None else restart["offset"])
+    elif pipeline > 0:
+        results = parselines(readahead(inp, pipeline), state)    # reader thread
+    else:
+        results = parselines(inp, state)
+    if append_file != "":
+        results = newrecords(results, identities)                # only new records
+    if diff_file != "":
+        results = diffrecords(results, index, diffcounts)        # only added and changed records
+
+    if fulltext:                                                 # --fulltext
+        try:
+            words = FullTextIndex(fulltextname(out_file), converter.hooks, append_file != "")
+        except ValueError as e:
+            sys.exit("--- --fulltext: " + str(e) + "; program terminated")
+    if checkpoint > 0:                                           # --checkpoint
+        saver = Checkpoint(checkpointname(out_file), in_file, inp, state, converter, out, checkpoint, restart)
+
+    def entrysize(bibtype, key, onerecord):                      # bytes of a rendered record (--crossref)
+        return len(converter.renderrecord(bibtype, key, onerecord, skipset, fieldsset, latex).encode("utf-8"))
+
+    def written(bibfield):                                       # field written with --fields, -s? (--crossref)
+        return bibfield not in skipset and (fieldsset is None or bibfield in fieldsset)
+
+    crossrefs = CrossrefGroups(entrysize, converter.usedkeys, written) if crossref else None   # --crossref
+    if crossref:                                                 # crossref of the children always written
+        skipset   = skipset - {"crossref"}
+        fieldsset = None if fieldsset is None else fieldsset | {"crossref"}
+
+    if progress != "":                                           # --progress
+        if extract != "" or sample > 0:
+            meter = Progress(0, lambda: 0, progress,             # (only records)
+                             registry=converter.hooks)
+        elif mmapped:
+            meter = Progress(len(inp), lambda: state.get("recordstart", 0), progress,
+                             registry=converter.hooks)
+        else:
+            meter = Progress(os.path.getsize(in_file), inp.buffer.tell, progress,
+                             registry=converter.hooks)
+
+    def writerecord(bibtype, key, onerecord):                    # record in input order
+        text = converter.renderrecord(bibtype, key, onerecord, skipset, fieldsset, latex)
+        if shards is None and crossrefs is None:
+            out.write(text)
+        elif shards is None:                                     # --crossref: records out of input order,
+            out.write(text + "\n")                               # each with its empty line
+        else:                                                    # records separated by empty lines
+            shards.write(shardlabel(shardspec, bibtype, onerecord), key, text + "\n")
+        if converter.hooks["on_record_written"]:
+            callhooks("on_record_written", key, text, registry=converter.hooks)
+        if append_file != "":                                    # records separated by empty lines
+            out.write("\n")
+
+    if sortby == []:                                             # records in input order
+        for result in results:                                   # loop over all input lines
+            if isinstance(result, str):                          # line outside of a record
+                if shards is None and not (crossrefs is not None and result == ""):
+                    out.write(result + "\n")                     # (dropped with --shard-by; empty
+                                                                 # lines dropped with --crossref)
+            elif crossrefs is None:                              # record completed by 'ER  -'
+                writerecord(result[0], converter.resultkey(result), result[1])
+            else:                                                # children held by their group
+                for (bibtype, key, onerecord, extra) in crossrefs.add(result[0], converter.resultkey(result),
+                                                                      result[1]):
+                    writerecord(bibtype, key, onerecord)
+        if crossrefs is not None:                                # children of groups without parent
+            for (bibtype, key, onerecord, extra) in crossrefs.rest():
+                writerecord(bibtype, key, onerecord)
+    else:                                                        # sorted records (--sort-by);
+        def sortitems():                                         # lines outside of records are dropped
+            def sortitem(bibtype, key, onerecord, order):
+                text = converter.renderrecord(bibtype, key, onerecord, skipset, fieldsset, latex)
+                if converter.hooks["on_record_written"]:
+                    callhooks("on_record_written", key, text, registry=converter.hooks)
+                if shards is None:
+                    return (order, text)
+                return (order, [shardlabel(shardspec, bibtype, onerecord), key, text])
+
+            nr = 0
+            for result in results:
+                if not isinstance(result, str):
+                    bibtype, onerecord = result[0], result[1]
+                    key = converter.resultkey(result)            # keys are generated in input order
+                    nr  = nr + 1
+                    order = sortkey(sortby, bibtype, key, onerecord, nr)
+                    if crossrefs is None:
+                        yield sortitem(bibtype, key, onerecord, order)
+                    else:                                        # children held by their group
+                        for item in crossrefs.add(bibtype, key, onerecord, order):
+                            yield sortitem(*item)
+            if crossrefs is not None:                            # children of groups without parent
+                for item in crossrefs.rest():
+                    yield sortitem(*item)
+        for text in externalsort(sortitems(), sortmemory * 1024 * 1024):
+            if shards is None:
+                out.write(text + "\n")
+            else:                                                # [shard, key, text]
+                shards.write(text[0], text[1], text[2] + "\n")
+
+    if crossrefs is not None:                                    # parent entries after their children
+        for (bibtype, key, parent) in crossrefs.parents():
+            out.write(converter.renderrecord(bibtype, key, parent, skipset, fieldsset, latex) + "\n")
+
+
+    # =============================================================
+    # The End
+
+    # -------------------------------------------------------------
+    # Close the files
+
+    if progress != "":
+        meter.report("finished")
+    if inp:                                                      # (an empty file is not mapped)
+        inp.close()
+    if checkpoint > 0:
+        saver.close()
+    if shards is None:
+        if append_file == "":
+            commitoutput(out_file, out, atomic)                  # <out_file>.part ---> <out_file>
+        else:
+            out.close()
+    else:
+        nr, removed = shards.close(manifestname(out_file))
+        if verbose:
+            print("--- Manifest", manifestname(out_file), "with", nr, "shards written")
+            if removed > 0:
+                print("---", removed, "shards of an earlier run removed")
+    if fulltext:                                                 # full-text index (--fulltext)
+        nr = words.close()
+        if verbose:
+            print("--- Full-text index", fulltextname(out_file), "with", nr, "records written")
+    if converter.decodefallbacks["bytes"] > 0:                   # see decodefallback
+        print("---", converter.decodefallbacks["bytes"], "bytes not valid in", encoding + "; read as Windows-1252 or Latin-1",
+              "(see --encoding)")
+    if diff_file != "":                                          # removed records (--diff)
+        removed = diffremoved(index)
+        with open(removedname(out_file), encoding="utf-8", mode="w") as f:
+            f.write("".join(key + "\n" for key in removed))
+        print("--- Diff:", diffcounts["added"], "added,", diffcounts["changed"], "changed,",
+              diffcounts["unchanged"], "unchanged,", len(removed), "removed records; removed keys in",
+              removedname(out_file))
+    if crossrefs is not None:                                    # size reduction (--crossref)
+        total, saved = os.path.getsize(out_file), crossrefs.saved
+        print("--- Crossref:", crossrefs.entries, "parent entries for", crossrefs.children, "entries;",
+              saved, "bytes saved (" + "%.1f" % (100 * saved / (total + saved) if total + saved > 0 else 0) + " %)")
+    for name in stopprofile(profile, profiler, out_file):
+        if verbose:
+            print("--- Profile", name, "written")
+    if verbose:
+        print("- Program finished")
+
+    # -------------------------------------------------------------
+    # Process option -b
+
+    if bibtexkeys:
+        print("\n- Generated BibTeX keys:")
+        for f in converter.allrecordkeys: print(f[0] + "." + f[1] + str(f[2]))
+        for f in converter.extractedkeys: print(f)
+
+    # -------------------------------------------------------------
+    # Process option --slow-records
+
+    if slowlog is not None:
+        print("\n- Records slower than", ("%g" % slow), "ms:")
+        for (line, key, seconds) in slowlog.slow:
+            print("Line", str(line) + ":", key, "%.1f" % (seconds * 1000), "ms")